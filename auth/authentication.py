@@ -0,0 +1,89 @@
+"""JWT 인증 클래스.
+
+simplejwt 의 JWTAuthentication 과 같지만 토큰 jti 별로 사용자 조회 결과를 캐시한다.
+
+- 토큰 검증(서명·만료)은 요청마다 한 번만 하고, 검증된 토큰은 request.auth 에 남는다.
+  뷰에서는 헤더를 다시 파싱하지 말고 get_token_claim(request, 'tokenType') 으로 읽는다.
+- 사용자 필드 값은 "jwt_user:<jti>" 키로 토큰 만료 시각까지 캐시해 요청마다 users SELECT 를
+  하지 않는다. 비밀번호 해시는 캐시에 넣지 않는다 - 캐시에서 만든 사용자 객체는 password 가
+  지연(deferred) 필드라 check_password 등에서 처음 읽을 때 DB 에서 가져온다.
+- 사용자가 저장·삭제되면(post_save/post_delete) 사용자별 버전 값을 바꿔, 그 사용자의 캐시된
+  값을 모두 무효화한다(버전이 다르면 다시 조회). QuerySet.update() 처럼 시그널이 없는
+  변경은 토큰 만료(최대 ACCESS_TOKEN_LIFETIME)까지 반영되지 않을 수 있다.
+- 버전 값이 모든 워커에 보여야 하므로 JWT_USER_CACHE(기본값: REDIS_URL 이 있을 때)가
+  꺼져 있으면 캐시하지 않는다. 프로세스 로컬 캐시(LocMem)로는 다른 워커의 무효화가 닿지 않는다.
+"""
+
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+USER_CACHE_PREFIX = "jwt_user:"
+USER_VERSION_PREFIX = "jwt_user_version:"
+UNCACHED_FIELDS = {"password"}
+
+
+def _version_key(user_id):
+    return f"{USER_VERSION_PREFIX}{user_id}"
+
+
+def invalidate_cached_user(user_id):
+    """user_id 의 캐시된 사용자 객체를 모두 무효화한다."""
+    cache.set(_version_key(user_id), uuid.uuid4().hex, None)
+
+
+def get_token_claim(request, name, default=None):
+    """인증 때 검증된 토큰(request.auth)에서 클레임을 꺼낸다. 토큰이 없으면 default."""
+    token = getattr(request, "auth", None)
+    if token is None:
+        return default
+    return token.get(name, default)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        jti = validated_token.get(api_settings.JTI_CLAIM)
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if not settings.JWT_USER_CACHE or jti is None or user_id is None:
+            return super().get_user(validated_token)
+
+        user_key = f"{USER_CACHE_PREFIX}{jti}"
+        version_key = _version_key(user_id)
+        cached = cache.get_many([user_key, version_key])
+        version = cached.get(version_key)
+        entry = cached.get(user_key)
+        if entry is not None and len(entry) == 3 and entry[0] == version:
+            user = self.user_model.from_db("default", entry[1], entry[2])
+            self._check_user(user, validated_token)
+            return user
+
+        user = super().get_user(validated_token)
+        if version is None:
+            version = uuid.uuid4().hex
+            cache.add(version_key, version, None)
+            version = cache.get(version_key, version)
+        timeout = int(validated_token.get("exp", 0) - time.time())
+        if timeout > 0:
+            names = tuple(
+                f.attname for f in user._meta.concrete_fields if f.attname not in UNCACHED_FIELDS
+            )
+            cache.set(user_key, (version, names, tuple(getattr(user, n) for n in names)), timeout)
+        return user
+
+    def _check_user(self, user, validated_token):
+        # 캐시된 사용자에도 simplejwt 와 같은 검사를 한다(CHECK_REVOKE_TOKEN 이 아니면 DB 조회 없음)
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(
+                user.password
+            ):
+                raise AuthenticationFailed(
+                    "The user's password has been changed.", code="password_changed"
+                )
@@ -0,0 +1,166 @@
+"""refresh 토큰 폐기(revocation) 확인.
+
+로그아웃한 refresh 토큰의 jti 를 RevokedToken 테이블에 남기고, 토큰 재발급 때 확인한다.
+대부분의 토큰은 폐기되지 않았으므로 DB 를 보기 전에 프로세스 메모리에서 먼저 거른다.
+
+- 블룸 필터: 폐기된 jti 집합. "없음"이면 확실히 폐기되지 않은 것이므로 바로 통과(DB 조회 없음).
+  "있을 수도 있음"일 때만 LRU → DB(jti unique 인덱스) 순으로 확인한다.
+- LRU: 최근 확인한 jti 의 폐기 여부(블룸 필터 오탐으로 인한 반복 DB 조회 방지).
+- 다른 프로세스에서 폐기한 토큰은 SYNC_INTERVAL 마다 마지막 동기화 시각 - SYNC_MARGIN 이후에
+  폐기된 행(revoked_at 기준)을 다시 읽어 반영한다. id 는 커밋 순서대로 보이지 않으므로(시퀀스 값은
+  먼저 받고 나중에 커밋될 수 있음) id 기준으로 이어 읽으면 늦게 커밋된 행을 영영 놓친다.
+  겹치는 구간의 jti 는 이미 필터에 있으면 건너뛴다. 다른 워커에서의 폐기는 최대 SYNC_INTERVAL 초
+  늦게 반영될 수 있다.
+- 만료된 jti 는 REBUILD_INTERVAL 마다 필터를 다시 만들면서 빠지고, 테이블에서는
+  purge_revoked_tokens 커맨드로 지운다.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+
+from users.models import RevokedToken
+
+SYNC_INTERVAL = getattr(settings, "TOKEN_REVOCATION_SYNC_INTERVAL", 2)  # 초
+# 늦게 커밋되는 행·워커 간 시계 차이를 덮는 재조회 구간
+SYNC_MARGIN = timedelta(seconds=getattr(settings, "TOKEN_REVOCATION_SYNC_MARGIN", 60))
+REBUILD_INTERVAL = 60 * 60  # 1시간
+BLOOM_CAPACITY = 100_000
+BLOOM_ERROR_RATE = 0.01
+LRU_SIZE = 10_000
+
+
+class BloomFilter:
+    def __init__(self, capacity=BLOOM_CAPACITY, error_rate=BLOOM_ERROR_RATE):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, value):
+        for pos in self._positions(value):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+
+class LRUCache:
+    def __init__(self, size=LRU_SIZE):
+        self.size = size
+        self._items = OrderedDict()
+
+    def get(self, key):
+        if key not in self._items:
+            return None
+        self._items.move_to_end(key)
+        return self._items[key]
+
+    def set(self, key, value):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        if len(self._items) > self.size:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+
+
+class RevocationIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bloom = None
+        self._lru = LRUCache()
+        self._synced_since = None  # 다음 동기화에서 읽을 revoked_at 하한
+        self._synced_at = 0.0
+        self._built_at = 0.0
+
+    def _rebuild(self):
+        started = timezone.now()
+        jtis = list(RevokedToken.objects.filter(expires_at__gt=started).values_list("jti", flat=True))
+        bloom = BloomFilter(capacity=max(BLOOM_CAPACITY, len(jtis) * 2))
+        for jti in jtis:
+            bloom.add(jti)
+        self._bloom = bloom
+        self._synced_since = started - SYNC_MARGIN
+        self._lru.clear()
+        self._built_at = self._synced_at = time.monotonic()
+
+    def _sync(self):
+        now = time.monotonic()
+        if (
+            self._bloom is None
+            or now - self._built_at >= REBUILD_INTERVAL
+            or self._bloom.count >= self._bloom.capacity
+        ):
+            self._rebuild()
+            return
+        if now - self._synced_at < SYNC_INTERVAL:
+            return
+        started = timezone.now()
+        recent = RevokedToken.objects.filter(revoked_at__gte=self._synced_since)
+        for jti in recent.values_list("jti", flat=True):
+            # 겹쳐 읽은 구간 - 이미 들어 있으면 다시 넣지 않는다(필터 count 부풀림 방지)
+            if jti not in self._bloom:
+                self._bloom.add(jti)
+            self._lru.set(jti, True)
+        self._synced_since = started - SYNC_MARGIN
+        self._synced_at = now
+
+    def is_revoked(self, jti):
+        with self._lock:
+            self._sync()
+            if jti not in self._bloom:
+                return False
+            cached = self._lru.get(jti)
+            if cached is not None:
+                return cached
+        revoked = RevokedToken.objects.filter(jti=jti).exists()
+        with self._lock:
+            self._lru.set(jti, revoked)
+        return revoked
+
+    def add(self, jti):
+        with self._lock:
+            if self._bloom is not None:
+                self._bloom.add(jti)
+            self._lru.set(jti, True)
+
+
+_index = RevocationIndex()
+
+
+def is_token_revoked(token):
+    """검증된 simplejwt 토큰이 폐기됐는지 확인한다."""
+    jti = token.get(api_settings.JTI_CLAIM)
+    return bool(jti) and _index.is_revoked(jti)
+
+
+def revoke_token(token):
+    """토큰을 폐기 목록에 넣는다(이미 있으면 무시)."""
+    jti = token.get(api_settings.JTI_CLAIM)
+    if not jti:
+        return
+    RevokedToken.objects.get_or_create(
+        jti=jti,
+        defaults={
+            "user_id": token.get(api_settings.USER_ID_CLAIM),
+            "expires_at": datetime.fromtimestamp(token["exp"], tz=dt_timezone.utc),
+        },
+    )
+    _index.add(jti)
@@ -64,4 +64,12 @@ class PhoneSendRequestSerializer(serializers.Serializer):
 
 class PhoneVerifyRequestSerializer(serializers.Serializer):
     phone_number = serializers.CharField(help_text="전화번호 (예: 01012345678 또는 010-1234-5678)")
-    verification_code = serializers.CharField(max_length=6, help_text="6자리 인증번호")
\ No newline at end of file
+    verification_code = serializers.CharField(max_length=6, help_text="6자리 인증번호")
+    verification_challenge = serializers.CharField(
+        required=False, help_text="발송 응답의 verification_challenge (signed 모드에서만 필요)"
+    )
+
+class OctomoVerifyRequestSerializer(PhoneSendRequestSerializer):
+    verification_challenge = serializers.CharField(
+        required=False, help_text="발급 응답의 verification_challenge (signed 모드에서만 필요)"
+    )
@@ -0,0 +1,128 @@
+"""SMS 발송 큐(DB outbox) 처리.
+
+SMS_ASYNC_DISPATCH 일 때 API 는 SmsOutbox 행만 만들고 바로 응답하고, 실제 발송은
+run_sms_worker 커맨드가 한다. 기본값(동기 발송)에서는 큐를 거치지 않고 요청 안에서 보낸다.
+
+- 배치 단위로 행을 가져온다(select_for_update(skip_locked) - 워커 프로세스 여러 개 가능).
+- 가져온 행은 sending 상태 + 처리 권한 만료 시각(LEASE)을 찍어 두어, 워커가 죽으면
+  만료 후 다른 워커가 다시 처리한다.
+- 배치 안에서는 스레드 풀로 동시에 보낸다.
+- 실패하면 지수 backoff(RETRY_BASE_DELAY × 2^(시도-1))로 재시도하고,
+  MAX_ATTEMPTS 번 실패하면 failed 로 남긴다.
+- 인증번호 유효 시간(MESSAGE_TTL)이 지난 행은 보내도 쓸모가 없으므로 재시도하지 않고
+  failed(EXPIRED_ERROR)로 닫는다. 다음 재시도가 유효 시간을 넘겨도 마찬가지.
+- 개발 환경에서는 CoolSMSService 가 _simulate_sms_sending 으로 보낸다.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from users.models import SmsOutbox
+from .verification_service import sms_service
+from .verification_store import VERIFICATION_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 50
+MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 30  # 초
+LEASE = timedelta(minutes=5)
+MESSAGE_TTL = timedelta(seconds=VERIFICATION_TIMEOUT)  # 인증번호 유효 시간
+EXPIRED_ERROR = "인증번호 유효 시간 경과로 발송하지 않음"
+
+
+def expire_stale(now=None):
+    """유효 시간이 지난 미발송 행을 failed 로 닫는다. 닫은 행 수를 반환."""
+    now = now or timezone.now()
+    return SmsOutbox.objects.filter(
+        status__in=[SmsOutbox.STATUS_PENDING, SmsOutbox.STATUS_SENDING],
+        created_at__lt=now - MESSAGE_TTL,
+    ).update(status=SmsOutbox.STATUS_FAILED, last_error=EXPIRED_ERROR)
+
+
+def claim_batch(batch_size=BATCH_SIZE):
+    """발송할 행을 가져와 sending 으로 표시한다(다른 워커와 겹치지 않음)."""
+    now = timezone.now()
+    expired = expire_stale(now)
+    if expired:
+        logger.info("유효 시간이 지난 SMS %s건 발송 취소", expired)
+    with transaction.atomic():
+        rows = list(
+            SmsOutbox.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=SmsOutbox.STATUS_PENDING) | Q(status=SmsOutbox.STATUS_SENDING),
+                next_attempt_at__lte=now,
+                created_at__gte=now - MESSAGE_TTL,
+            )
+            .order_by("next_attempt_at", "id")[:batch_size]
+        )
+        if rows:
+            SmsOutbox.objects.filter(id__in=[row.id for row in rows]).update(
+                status=SmsOutbox.STATUS_SENDING, next_attempt_at=now + LEASE
+            )
+    return rows
+
+
+def _send(row):
+    try:
+        return sms_service.send_message(row.phone_number, row.message)
+    except Exception as e:
+        logger.exception("SMS 발송 중 오류: outbox %s", row.id)
+        return {"success": False, "message": str(e)}
+
+
+def deliver(rows, workers=1):
+    """가져온 행들을 발송하고 결과(sent / 재시도 대기 / failed)를 기록한다."""
+    if not rows:
+        return 0, 0
+
+    if workers > 1 and len(rows) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(rows))) as pool:
+            results = list(pool.map(_send, rows))
+    else:
+        results = [_send(row) for row in rows]
+
+    now = timezone.now()
+    sent = failed = 0
+    for row, result in zip(rows, results):
+        row.attempts += 1
+        retry_at = now + timedelta(seconds=RETRY_BASE_DELAY * 2 ** (row.attempts - 1))
+        if result.get("success"):
+            row.status = SmsOutbox.STATUS_SENT
+            row.sent_at = now
+            row.last_error = None
+            sent += 1
+        elif row.attempts >= MAX_ATTEMPTS or retry_at >= row.created_at + MESSAGE_TTL:
+            row.status = SmsOutbox.STATUS_FAILED
+            row.last_error = result.get("message")
+            failed += 1
+        else:
+            row.status = SmsOutbox.STATUS_PENDING
+            row.next_attempt_at = retry_at
+            row.last_error = result.get("message")
+    SmsOutbox.objects.bulk_update(
+        rows, ["status", "attempts", "next_attempt_at", "last_error", "sent_at"]
+    )
+    return sent, failed
+
+
+def process_batch(batch_size=BATCH_SIZE, workers=1):
+    """한 배치를 가져와 발송한다. (처리한 행 수, 발송 성공 수, 최종 실패 수)"""
+    rows = claim_batch(batch_size)
+    sent, failed = deliver(rows, workers)
+    return len(rows), sent, failed
+
+
+def purge(days):
+    """days 일 지난 발송완료/발송실패 행을 지운다."""
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted, _ = SmsOutbox.objects.filter(
+        status__in=[SmsOutbox.STATUS_SENT, SmsOutbox.STATUS_FAILED],
+        created_at__lt=cutoff,
+    ).delete()
+    return deleted
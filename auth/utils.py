@@ -5,6 +5,11 @@ import re
 
 def get_user_id_from_request(request):
 
+    # 0. 인증 클래스가 이미 검증한 토큰이 있으면 그대로 사용 (재검증 없음)
+    validated_token = getattr(request, "auth", None)
+    if validated_token is not None and "user_id" in validated_token:
+        return validated_token["user_id"]
+
     # 1. Authorization 헤더 가져오기
     authorization_header = request.META.get("HTTP_AUTHORIZATION")
     
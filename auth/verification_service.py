@@ -20,9 +20,13 @@ class CoolSMSService:
         # 개발/운영 환경 구분
         self.is_development = os.getenv('DJANGO_ENV', 'development') == 'development'
     
+    def build_verification_message(self, verification_code):
+        """인증번호 SMS 메시지 내용"""
+        return f"[{self.service_name}] 인증번호는 {verification_code}입니다. 3분 내에 입력해주세요."
+
     def send_verification_sms(self, phone_number, verification_code):
         """
-        인증번호 SMS 발송
+        인증번호 SMS 즉시 발송 (요청 안에서 동기 발송 - SMS_ASYNC_DISPATCH 면 enqueue_verification_sms 사용)
         
         Args:
             phone_number (str): 수신자 전화번호
@@ -31,27 +35,44 @@ class CoolSMSService:
         Returns:
             dict: 발송 결과
         """
+        return self.send_message(phone_number, self.build_verification_message(verification_code))
+
+    def enqueue_verification_sms(self, phone_number, verification_code):
+        """
+        인증번호 SMS 를 발송 큐(SmsOutbox)에 넣고 바로 반환 (발송은 run_sms_worker 가 처리)
+        
+        Returns:
+            SmsOutbox: 생성된 큐 행 (status 로 발송 상태 추적)
+        """
+        from users.models import SmsOutbox
+
+        return SmsOutbox.objects.create(
+            phone_number=phone_number,
+            message=self.build_verification_message(verification_code),
+        )
+
+    def send_message(self, phone_number, message):
+        """
+        SMS 한 건 발송 (개발 환경은 시뮬레이션)
+        
+        Returns:
+            dict: 발송 결과 (오류 상세는 로그에만 남기고 응답에는 싣지 않음)
+        """
         try:
-            # SMS 메시지 내용
-            message = f"[{self.service_name}] 인증번호는 {verification_code}입니다. 3분 내에 입력해주세요."
-            
             # 개발 환경에서는 시뮬레이션만 실행
             if self.is_development:
-                return self._simulate_sms_sending(phone_number, message, verification_code)
+                return self._simulate_sms_sending(phone_number, message, None)
             
             # 운영 환경에서는 실제 SMS 발송
-            return self._send_real_sms(phone_number, message, verification_code)
+            return self._send_real_sms(phone_number, message, None)
             
         except Exception as e:
-            import traceback
-            error_traceback = traceback.format_exc()
             logger.error(f"SMS 발송 중 오류 발생: {str(e)}", exc_info=True)
             
             return {
                 'success': False,
                 'message': f'SMS 발송 중 오류가 발생했습니다: {str(e)}',
                 'error': str(e),
-                'traceback': error_traceback
             }
     
     def _simulate_sms_sending(self, phone_number, message, verification_code):
@@ -121,15 +142,12 @@ class CoolSMSService:
             }
             
         except Exception as e:
-            import traceback
-            error_traceback = traceback.format_exc()
             logger.error(f"쿨 SMS API 호출 중 오류 발생: {str(e)}", exc_info=True)
             
             return {
                 'success': False,
                 'message': f'쿨 SMS API 호출 중 오류가 발생했습니다: {str(e)}',
                 'error': str(e),
-                'traceback': error_traceback
             }
 
 
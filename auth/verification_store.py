@@ -0,0 +1,178 @@
+"""전화번호 인증코드 저장소.
+
+발송/검증 뷰는 저장 방식과 무관하게 아래 인터페이스만 쓴다.
+
+- remaining(phone, type): 지금 더 보낼 수 있는 횟수(하루 DAILY_LIMIT 기준)
+- save(phone, type, code): 코드 저장 + 발송 1회 기록. signed 모드면 클라이언트가 검증 때
+  되돌려 보낼 challenge 토큰을, 그 외에는 None 을 반환
+- load(phone, type, challenge=None): 유효한 코드(없거나 만료면 None)
+- discard(phone, type, challenge=None): 검증 성공 후 코드 폐기
+
+settings.VERIFICATION_CODE_STORE 로 고른다.
+
+- "db"(기본값): 기존 PhoneVerification 행. 발송마다 UPDATE 한 번(처음이면 INSERT)으로 코드·발송
+  시각·daily_count 를 쓰고, 날짜가 바뀌었으면 같은 UPDATE 에서 daily_count 를 리셋
+- "cache": Django 캐시에 TTL 키로 저장(만료되면 자동 소멸, DB 쓰기 없음)
+- "signed": 코드를 암호화·서명(Fernet)한 challenge 토큰으로 클라이언트에 맡김(서버 저장 없음).
+  재사용 방지를 위해 사용한 토큰만 만료 시각까지 캐시에 기록
+
+cache/signed 모드의 발송 제한은 전화번호별 24시간 슬라이딩 윈도우(발송 시각 최대
+DAILY_LIMIT 개)로 캐시에 두므로 날짜 리셋 쓰기가 없다. 워커가 여러 개면 캐시는
+공유 백엔드(REDIS_URL)여야 한다.
+"""
+
+import base64
+import hashlib
+import json
+import time
+
+from cryptography.fernet import Fernet, InvalidToken
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, F, Value, When
+from django.utils import timezone
+
+from users.models import PhoneVerification
+
+DAILY_LIMIT = 10
+VERIFICATION_TIMEOUT = 300  # 5분 (초)
+RATE_WINDOW = 24 * 60 * 60  # 24시간 (초)
+CACHE_PREFIX = "phone_verification:"
+
+
+class DatabaseVerificationStore:
+    """PhoneVerification 행 기반 (기존 동작)."""
+
+    def _get(self, phone, verification_type):
+        return PhoneVerification.objects.filter(
+            phone_number=phone, verification_type=verification_type
+        ).first()
+
+    def remaining(self, phone, verification_type):
+        obj = self._get(phone, verification_type)
+        if obj is None or not obj.sent_at or obj.sent_at.date() < timezone.now().date():
+            return DAILY_LIMIT
+        return max(0, DAILY_LIMIT - obj.daily_count)
+
+    def save(self, phone, verification_type, code):
+        now = timezone.now()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        updated = PhoneVerification.objects.filter(
+            phone_number=phone, verification_type=verification_type
+        ).update(
+            verification_code=code,
+            sent_at=now,
+            # 날짜 바뀌었으면 daily_count 리셋
+            daily_count=Case(When(sent_at__lt=today, then=Value(1)), default=F("daily_count") + 1),
+        )
+        if not updated:
+            PhoneVerification.objects.create(
+                phone_number=phone,
+                verification_type=verification_type,
+                verification_code=code,
+                sent_at=now,
+                daily_count=1,
+            )
+        return None
+
+    def load(self, phone, verification_type, challenge=None):
+        obj = self._get(phone, verification_type)
+        if obj is None or not obj.verification_code:
+            return None
+        if obj.is_code_expired():
+            obj.verification_code = None
+            obj.save(update_fields=["verification_code"])
+            return None
+        return obj.verification_code
+
+    def discard(self, phone, verification_type, challenge=None):
+        PhoneVerification.objects.filter(
+            phone_number=phone, verification_type=verification_type
+        ).delete()
+
+
+class _SlidingWindowLimitMixin:
+    """전화번호별 최근 24시간 발송 시각 목록으로 제한(목록 길이 ≤ DAILY_LIMIT → O(1))."""
+
+    def _rate_key(self, phone, verification_type):
+        return f"{CACHE_PREFIX}rate:{verification_type}:{phone}"
+
+    def _recent_sends(self, phone, verification_type):
+        cutoff = time.time() - RATE_WINDOW
+        sends = cache.get(self._rate_key(phone, verification_type)) or []
+        return [t for t in sends if t > cutoff]
+
+    def remaining(self, phone, verification_type):
+        return max(0, DAILY_LIMIT - len(self._recent_sends(phone, verification_type)))
+
+    def _record_send(self, phone, verification_type):
+        sends = self._recent_sends(phone, verification_type)
+        sends.append(time.time())
+        cache.set(self._rate_key(phone, verification_type), sends[-DAILY_LIMIT:], RATE_WINDOW)
+
+
+class CacheVerificationStore(_SlidingWindowLimitMixin):
+    """Django 캐시 TTL 키 기반."""
+
+    def _code_key(self, phone, verification_type):
+        return f"{CACHE_PREFIX}code:{verification_type}:{phone}"
+
+    def save(self, phone, verification_type, code):
+        cache.set(self._code_key(phone, verification_type), code, VERIFICATION_TIMEOUT)
+        self._record_send(phone, verification_type)
+        return None
+
+    def load(self, phone, verification_type, challenge=None):
+        return cache.get(self._code_key(phone, verification_type))
+
+    def discard(self, phone, verification_type, challenge=None):
+        cache.delete(self._code_key(phone, verification_type))
+
+
+class SignedVerificationStore(_SlidingWindowLimitMixin):
+    """암호화·서명된 challenge 토큰 기반(서버에 코드를 저장하지 않음)."""
+
+    def __init__(self):
+        digest = hashlib.sha256(f"{settings.SECRET_KEY}:phone-verification".encode()).digest()
+        self._fernet = Fernet(base64.urlsafe_b64encode(digest))
+
+    def _used_key(self, challenge):
+        return f"{CACHE_PREFIX}used:{hashlib.sha256(challenge.encode()).hexdigest()}"
+
+    def save(self, phone, verification_type, code):
+        payload = json.dumps({"phone": phone, "type": verification_type, "code": code})
+        self._record_send(phone, verification_type)
+        return self._fernet.encrypt(payload.encode()).decode()
+
+    def load(self, phone, verification_type, challenge=None):
+        if not challenge or cache.get(self._used_key(challenge)):
+            return None
+        try:
+            payload = json.loads(
+                self._fernet.decrypt(challenge.encode(), ttl=VERIFICATION_TIMEOUT)
+            )
+        except (InvalidToken, ValueError):
+            return None  # 위조·만료
+        if payload.get("phone") != phone or payload.get("type") != verification_type:
+            return None
+        return payload.get("code")
+
+    def discard(self, phone, verification_type, challenge=None):
+        if challenge:
+            cache.set(self._used_key(challenge), 1, VERIFICATION_TIMEOUT)
+
+
+_STORES = {
+    "db": DatabaseVerificationStore,
+    "cache": CacheVerificationStore,
+    "signed": SignedVerificationStore,
+}
+_store = None
+
+
+def get_verification_store():
+    """settings.VERIFICATION_CODE_STORE 에 맞는 저장소(프로세스당 1개)."""
+    global _store
+    if _store is None:
+        _store = _STORES[getattr(settings, "VERIFICATION_CODE_STORE", "db")]()
+    return _store
@@ -9,18 +9,20 @@ import os
 import requests
 from django.conf import settings
 
-from users.models import PhoneVerification
-from .serializers import PhoneSendRequestSerializer, PhoneVerifyRequestSerializer
+from common import http_client
+
+from users.models import PhoneVerification, SmsOutbox
+from .serializers import PhoneSendRequestSerializer, PhoneVerifyRequestSerializer, OctomoVerifyRequestSerializer
 import random
 import secrets
 import string
 from .verification_service import sms_service
 from .utils import parse_phone_number
 from .token_utils import generate_verification_token
+from .verification_store import DAILY_LIMIT, get_verification_store
+import logging
 
-DAILY_LIMIT = 10
-VERIFICATION_TIMEOUT = 300  # 5분 (초)
-CACHE_PREFIX = 'phone_verification:'
+logger = logging.getLogger(__name__)
 
 class PhoneVerificationView(APIView):
     # 전화번호 인증번호 발송 API (SMS)
@@ -39,7 +41,9 @@ class PhoneVerificationView(APIView):
                     'message': {'type': 'string'},
                     'remaining_requests': {'type': 'integer'},
                     'sent_at': {'type': 'string'},
+                    'sms_status': {'type': 'string', 'description': 'SMS 발송 상태 (pending: 발송 대기, sent: 발송 완료)'},
                     'verification_code': {'type': 'string'},
+                    'verification_challenge': {'type': 'string', 'description': 'signed 모드에서만 포함 - 검증 요청에 그대로 전달'},
                 }
             },
             400: {
@@ -85,18 +89,12 @@ class PhoneVerificationView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # 기존 레코드 조회 또는 생성
-        obj, created = PhoneVerification.objects.get_or_create(
-            phone_number=parsed_phone,
-            verification_type=PhoneVerification.VERIFICATION_TYPE_SMS,
-            defaults={
-                'daily_count' : 0,
-                'sent_at' : None,
-            }
-        )
-        
+        store = get_verification_store()
+        verification_type = PhoneVerification.VERIFICATION_TYPE_SMS
+
         # 하루 제한 확인
-        if obj.is_daily_limit_exceeded():
+        remaining = store.remaining(parsed_phone, verification_type)
+        if remaining <= 0:
             return Response(
                 {
                     'error': f'하루 최대 {DAILY_LIMIT}회까지만 요청 가능합니다. 내일 다시 시도해주세요.',
@@ -104,41 +102,54 @@ class PhoneVerificationView(APIView):
                 },
                 status=status.HTTP_429_TOO_MANY_REQUESTS
             )
-
-        # 날짜 바뀌었으면 daily_count 리셋
-        if obj.sent_at and obj.sent_at.date() < timezone.now().date():
-            obj.daily_count = 0
         
         # 인증번호 생성
         verification_code = ''.join([str(random.randint(0, 9)) for _ in range(6)])
         
-        # SMS 발송
-        sms_result = sms_service.send_verification_sms(parsed_phone, verification_code)
-        
-        if not sms_result['success']:
-            return Response(
-                {
-                    'error': 'SMS 발송에 실패했습니다.',
-                    'details': sms_result['message']
-                }, 
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        if settings.SMS_ASYNC_DISPATCH:
+            # SMS 발송 큐 등록 - run_sms_worker 가 발송하고 여기서는 바로 응답
+            try:
+                outbox = sms_service.enqueue_verification_sms(parsed_phone, verification_code)
+            except Exception:
+                logger.exception('SMS 발송 큐 등록 실패')
+                return Response(
+                    {'error': 'SMS 발송에 실패했습니다.'},
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                )
+            sms_status = outbox.status
+        else:
+            # 기본값(워커 없음): 요청 안에서 바로 발송 - 큐 행을 만들지 않으므로
+            # 실패한 코드를 워커가 나중에 다시 보내는 일이 없다
+            sms_result = sms_service.send_verification_sms(parsed_phone, verification_code)
+            if not sms_result['success']:
+                return Response(
+                    {
+                        'error': 'SMS 발송에 실패했습니다.',
+                        'details': sms_result['message']
+                    },
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                )
+            sms_status = SmsOutbox.STATUS_SENT
         
-        # DB 저장
-        obj.verification_code = verification_code
-        obj.sent_at = timezone.now()
-        obj.daily_count += 1
-        obj.save()
+        # 발송(또는 큐 등록)에 성공했을 때만 인증번호 저장·발송 횟수 차감
+        # (signed 모드면 검증 때 되돌려 받을 challenge 반환)
+        challenge = store.save(parsed_phone, verification_type, verification_code)
+
+        sent_at = timezone.now()
         
-        return Response({
+        response_data = {
             'success': True,
             'original_phone': phone_number,
             'parsed_phone': parsed_phone,
             'message': '인증번호가 성공적으로 발송되었습니다.',
-            'remaining_requests': DAILY_LIMIT - obj.daily_count,
-            'sent_at': obj.sent_at.strftime('%Y-%m-%d %H:%M:%S'),
+            'remaining_requests': remaining - 1,
+            'sent_at': sent_at.strftime('%Y-%m-%d %H:%M:%S'),
+            'sms_status': sms_status,
             'verification_code': verification_code  # 개발용 - 운영에서는 제거
-        }, status=status.HTTP_200_OK)
+        }
+        if challenge:
+            response_data['verification_challenge'] = challenge
+        return Response(response_data, status=status.HTTP_200_OK)
 
 class VerifyCodeView(APIView):
     # 인증번호 검증 후 verification_token 발급 (SMS)
@@ -188,43 +199,26 @@ class VerifyCodeView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # DB에서 레코드 조회
-        try:
-            obj = PhoneVerification.objects.get(
-                phone_number=parsed_phone,
-                verification_type=PhoneVerification.VERIFICATION_TYPE_SMS,
-            )
-        except PhoneVerification.DoesNotExist:
+        # 저장된 인증번호 조회 (없거나 5분 지났으면 None)
+        store = get_verification_store()
+        verification_type = PhoneVerification.VERIFICATION_TYPE_SMS
+        challenge = request.data.get('verification_challenge')
+        saved_code = store.load(parsed_phone, verification_type, challenge)
+        if not saved_code:
             return Response(
-                {'error': '인증번호를 먼저 발송해주세요.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        # 인증번호 존재 여부 확인
-        if not obj.verification_code:
-            return Response(
-                {'error': '인증번호가 만료되었습니다. 다시 발송해주세요.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        # 만료 확인
-        if obj.is_code_expired():
-            obj.verification_code = None
-            obj.save(update_fields=['verification_code'])
-            return Response(
-                {'error': '인증번호가 만료되었습니다. (5분 초과)'},
+                {'error': '인증번호가 없거나 만료되었습니다. 다시 발송해주세요.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
         # 인증번호 검증
-        if obj.verification_code != verification_code:
+        if saved_code != verification_code:
             return Response(
                 {'error': '인증번호가 일치하지 않습니다.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
         # 인증 성공 - 인증번호 삭제 + JWT 발급
-        obj.delete()
+        store.discard(parsed_phone, verification_type, challenge)
 
         token_data = generate_verification_token(parsed_phone)
 
@@ -251,6 +245,7 @@ class OctomoVerificationView(APIView):
                     'parsed_phone': {'type': 'string'},
                     'code': {'type': 'string'},
                     'message': {'type': 'string'},
+                    'verification_challenge': {'type': 'string', 'description': 'signed 모드에서만 포함 - 확인 요청에 그대로 전달'},
                 }
             },
             400: {
@@ -296,18 +291,11 @@ class OctomoVerificationView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # 기존 레코드 조회 또는 생성
-        obj, created = PhoneVerification.objects.get_or_create(
-            phone_number=parsed_phone,
-            verification_type=PhoneVerification.VERIFICATION_TYPE_OCTOMO,
-            defaults={
-                'daily_count': 0,
-                'sent_at': None,
-            }
-        )
+        store = get_verification_store()
+        verification_type = PhoneVerification.VERIFICATION_TYPE_OCTOMO
 
         # 하루 제한 확인
-        if obj.is_daily_limit_exceeded():
+        if store.remaining(parsed_phone, verification_type) <= 0:
             return Response(
                 {
                     'error': f'하루 최대 {DAILY_LIMIT}회까지만 요청 가능합니다. 내일 다시 시도해주세요.',
@@ -316,26 +304,22 @@ class OctomoVerificationView(APIView):
                 status=status.HTTP_429_TOO_MANY_REQUESTS
             )
 
-        # 날짜 바뀌었으면 daily_count 리셋
-        if obj.sent_at and obj.sent_at.date() < timezone.now().date():
-            obj.daily_count = 0
-
         # 인증코드 생성
         chars = string.ascii_uppercase + string.digits
         verification_code = ''.join(secrets.choice(chars) for _ in range(32))
 
-        # DB 저장
-        obj.verification_code = verification_code
-        obj.sent_at = timezone.now()
-        obj.daily_count += 1
-        obj.save()
+        # 인증코드 저장 (signed 모드면 검증 때 되돌려 받을 challenge 반환)
+        challenge = store.save(parsed_phone, verification_type, verification_code)
 
-        return Response({
+        response_data = {
             'success': True,
             'parsed_phone': parsed_phone,
             'code': verification_code,
             'message': '인증코드가 발급되었습니다. Octomo(1666-3538)로 문자를 보내주세요.',
-        }, status=status.HTTP_200_OK)
+        }
+        if challenge:
+            response_data['verification_challenge'] = challenge
+        return Response(response_data, status=status.HTTP_200_OK)
 
 class OctomoVerifyView(APIView):
     # 수신 여부 확인 후 verification_token 발급
@@ -343,7 +327,7 @@ class OctomoVerifyView(APIView):
     permission_classes = [AllowAny]
 
     @extend_schema(
-        request=PhoneSendRequestSerializer,
+        request=OctomoVerifyRequestSerializer,
         responses={
             200: {
                 'type': 'object',
@@ -390,39 +374,22 @@ class OctomoVerifyView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # DB에서 레코드 조회
-        try:
-            obj = PhoneVerification.objects.get(
-                phone_number=parsed_phone,
-                verification_type=PhoneVerification.VERIFICATION_TYPE_OCTOMO,
-            )
-        except PhoneVerification.DoesNotExist:
-            return Response(
-                {'error': '인증코드를 먼저 발급해주세요.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        # 인증코드 존재 여부 확인
-        if not obj.verification_code:
-            return Response(
-                {'error': '인증코드가 만료되었습니다. 다시 발급해주세요.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        # 만료 확인
-        if obj.is_code_expired():
-            obj.verification_code = None
-            obj.save(update_fields=['verification_code'])
-
+        # 저장된 인증코드 조회 (없거나 5분 지났으면 None)
+        store = get_verification_store()
+        verification_type = PhoneVerification.VERIFICATION_TYPE_OCTOMO
+        challenge = request.data.get('verification_challenge')
+        verification_code = store.load(parsed_phone, verification_type, challenge)
+        if not verification_code:
             return Response(
-                {'error': '인증코드가 만료되었습니다. (5분 초과)'},
+                {'error': '인증코드가 없거나 만료되었습니다. 다시 발급해주세요.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
         # Octomo API 호출
         try:
-            res = requests.post(
+            res = http_client.post(
                 'https://api.octoverse.kr/octomo/v1/public/message/exists',
+                service='octomo',
                 headers={
                     'Accept': 'application/json',
                     'Content-Type': 'application/json',
@@ -430,7 +397,7 @@ class OctomoVerifyView(APIView):
                 },
                 json={
                     'mobileNum': parsed_phone.replace('-', ''),
-                    'text': obj.verification_code,
+                    'text': verification_code,
                 },
                 timeout=5, # 5초 안에 서버 응답이 없을 경우 에러 발생
             )
@@ -448,8 +415,8 @@ class OctomoVerifyView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # 인증 성공 - row 삭제 + JWT 발급
-        obj.delete()
+        # 인증 성공 - 인증코드 폐기 + JWT 발급
+        store.discard(parsed_phone, verification_type, challenge)
 
         token_data = generate_verification_token(parsed_phone)
 
@@ -0,0 +1,20 @@
+from django.apps import AppConfig
+
+class CommonConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "common"
+
+    def ready(self):
+        # DB 커넥션 수 시스템 체크 등록
+        from common import checks  # noqa: F401
+
+        from django.db.models.signals import post_delete
+
+        from common.metrics import record_user_deletion
+
+        # 탈퇴·삭제를 대시보드 일별 집계(DailyMetrics)에 반영
+        def _record_deletion(sender, instance, **kwargs):
+            record_user_deletion(instance)
+
+        post_delete.connect(_record_deletion, sender="users.User", weak=False,
+                            dispatch_uid="common.record_user_deletion")
@@ -0,0 +1,65 @@
+"""DB 커넥션 수 점검 (시스템 체크).
+
+runserver/migrate/`manage.py check` 시작 시 워커 수 × 워커당 최대 커넥션 수를
+PostgreSQL max_connections(DB_MAX_CONNECTIONS)와 비교한다.
+
+- 풀 사용(DB_POOL): 워커당 최대 커넥션 = 풀 max_size. 스레드 수보다 작으면 요청이 풀을 기다린다.
+- 풀 미사용: 스레드마다 커넥션 하나(CONN_MAX_AGE 동안 유지)라 워커당 최대 = 스레드 수.
+"""
+
+from importlib.util import find_spec
+
+from django.conf import settings
+from django.core.checks import Error, Warning, register
+
+
+def connection_budget(alias="default"):
+    """(워커 수, 워커당 최대 커넥션, 전체 최대 커넥션, 풀 설정 또는 None)."""
+    db = settings.DATABASES[alias]
+    pool = (db.get("OPTIONS") or {}).get("pool")
+    workers = getattr(settings, "WEB_CONCURRENCY", 1)
+    threads = getattr(settings, "WEB_THREADS", 1)
+    if pool:
+        per_worker = pool.get("max_size", threads) if isinstance(pool, dict) else threads
+    else:
+        per_worker = threads
+    return workers, per_worker, workers * per_worker, pool
+
+
+@register()
+def check_db_connections(app_configs, **kwargs):
+    messages = []
+    if "postgresql" not in settings.DATABASES["default"]["ENGINE"]:
+        return messages
+
+    workers, per_worker, total, pool = connection_budget()
+    threads = getattr(settings, "WEB_THREADS", 1)
+    limit = getattr(settings, "DB_MAX_CONNECTIONS", 100)
+
+    if pool and find_spec("psycopg_pool") is None:
+        messages.append(
+            Error(
+                "DB_POOL 이 켜져 있지만 psycopg 3 풀 패키지가 없습니다.",
+                hint="pip install 'psycopg[binary,pool]' 후 다시 시작하거나 DB_POOL=False 로 둡니다.",
+                id="common.E001",
+            )
+        )
+    if total > limit:
+        messages.append(
+            Warning(
+                f"최대 DB 커넥션 {total}개(워커 {workers} × 워커당 {per_worker})가 "
+                f"DB_MAX_CONNECTIONS({limit})를 넘습니다.",
+                hint="WEB_CONCURRENCY / DB_POOL_MAX_SIZE(풀 미사용이면 WEB_THREADS)를 줄이거나 "
+                "PostgreSQL max_connections 를 늘립니다.",
+                id="common.W001",
+            )
+        )
+    if pool and per_worker < threads:
+        messages.append(
+            Warning(
+                f"풀 max_size({per_worker})가 워커당 스레드 수({threads})보다 작습니다.",
+                hint="동시 요청이 풀을 기다리다 DB_POOL_TIMEOUT 후 실패할 수 있습니다.",
+                id="common.W002",
+            )
+        )
+    return messages
@@ -0,0 +1,184 @@
+"""외부 API 호출 공용 HTTP 클라이언트.
+
+카카오·Apple·쿠팡·식약처 OpenAPI·Octomo 등 외부 연동이 요청마다 requests.get/post 로
+새 커넥션(TLS 핸드셰이크)을 맺던 것을 프로세스 공용 세션으로 모은다.
+
+- 세션 1개 + 호스트별 커넥션 풀(keep-alive) 재사용
+- 기본 타임아웃(OUTBOUND_HTTP_TIMEOUT) - 호출 측이 timeout 을 주면 그 값을 쓴다
+- 재시도: 연결 실패와 멱등 메서드(GET/HEAD 등)의 502/503/504 만 짧은 backoff 로 재시도
+  (POST 는 카카오 인가 코드처럼 재사용 불가한 요청이 있어 응답 상태로는 재시도하지 않음)
+- 서비스(기본값 호스트)별 서킷 브레이커: 연속 실패가 쌓이면 잠시 호출을 막고
+  CircuitOpenError 를 낸다. requests.RequestException 하위 클래스라 기존 예외 처리에 그대로 걸린다.
+- 서비스별 지연시간/오류 집계(get_metrics)
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = (3.05, 10)  # (connect, read) 초
+FAILURE_THRESHOLD = 5  # 연속 실패 N회면 차단
+RESET_TIMEOUT = 30  # 차단 후 N초 뒤 시험 호출 1회 허용
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """서킷 브레이커가 열려 호출하지 않고 바로 실패시킨 경우."""
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD, reset_timeout: float = RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            # half-open: reset_timeout 이 지나면 시험 호출 하나만 통과시킨다
+            if time.monotonic() - self._opened_at >= self.reset_timeout and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_metrics: Dict[str, Dict[str, float]] = {}
+_registry_lock = threading.Lock()
+
+
+def _breaker(service: str) -> CircuitBreaker:
+    with _registry_lock:
+        if service not in _breakers:
+            _breakers[service] = CircuitBreaker()
+        return _breakers[service]
+
+
+def _record(service: str, elapsed_ms: float, error: bool):
+    with _registry_lock:
+        m = _metrics.setdefault(
+            service, {"count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0}
+        )
+        m["count"] += 1
+        m["errors"] += int(error)
+        m["total_ms"] += elapsed_ms
+        m["max_ms"] = max(m["max_ms"], elapsed_ms)
+
+
+def get_metrics() -> Dict[str, Dict]:
+    """서비스별 호출 수·오류 수·평균/최대 지연(ms)·브레이커 상태 스냅샷."""
+    with _registry_lock:
+        snapshot = {service: dict(m) for service, m in _metrics.items()}
+        breakers = dict(_breakers)
+    for service, m in snapshot.items():
+        m["avg_ms"] = round(m["total_ms"] / m["count"], 2) if m["count"] else 0.0
+        m["circuit"] = breakers[service].state if service in breakers else "closed"
+    return snapshot
+
+
+def get_session() -> requests.Session:
+    """프로세스 공용 세션(최초 호출 시 1회 생성)."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                retry = Retry(
+                    total=2,
+                    connect=2,
+                    read=0,
+                    status=2,
+                    backoff_factor=0.3,
+                    status_forcelist=(502, 503, 504),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=getattr(settings, "OUTBOUND_HTTP_POOL_CONNECTIONS", 10),
+                    pool_maxsize=getattr(settings, "OUTBOUND_HTTP_POOL_MAXSIZE", 20),
+                    max_retries=retry,
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+def request(method: str, url: str, service: Optional[str] = None, **kwargs) -> requests.Response:
+    """공용 세션으로 요청한다. 인자는 requests.request 와 같다.
+
+    service: 브레이커·지표를 묶을 이름(기본값: URL 호스트)
+    5xx 응답과 호출 중 난 모든 예외(네트워크 오류, urllib3 의 URL 파싱 오류 등)를 실패로 센다.
+    응답은 상태와 무관하게 그대로 돌려준다.
+    """
+    service = service or urlsplit(url).hostname or "unknown"
+    kwargs.setdefault("timeout", getattr(settings, "OUTBOUND_HTTP_TIMEOUT", DEFAULT_TIMEOUT))
+
+    breaker = _breaker(service)
+    if not breaker.allow():
+        _record(service, 0.0, error=True)
+        raise CircuitOpenError(f"{service} 호출 일시 차단(연속 실패)")
+
+    started = time.perf_counter()
+    try:
+        response = get_session().request(method, url, **kwargs)
+    except BaseException:
+        # RequestException 외의 예외도 실패로 기록해야 half-open 시험 호출 표시가 풀린다
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        breaker.record_failure()
+        _record(service, elapsed_ms, error=True)
+        logger.warning("외부 호출 실패: %s %s (%.0fms)", service, method, elapsed_ms)
+        raise
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    failed = response.status_code >= 500
+    if failed:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    _record(service, elapsed_ms, error=failed)
+    logger.debug("외부 호출: %s %s %s (%.0fms)", service, method, response.status_code, elapsed_ms)
+    return response
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return request("POST", url, **kwargs)
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from common.metrics import rollup_daily_metrics
+
+
+class Command(BaseCommand):
+    help = "관리자 홈 대시보드 일별 집계(DailyMetrics)를 갱신합니다. (cron 으로 주기 실행)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="첫 가입일부터 전체 다시 집계",
+        )
+
+    def handle(self, *args, **options):
+        days = rollup_daily_metrics(full=options["full"])
+        self.stdout.write(self.style.SUCCESS(f"일별 집계 완료: {days}일 갱신"))
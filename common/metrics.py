@@ -0,0 +1,162 @@
+"""관리자 홈 대시보드 일별 집계(DailyMetrics).
+
+대시보드를 열 때마다 users 테이블 전체를 GROUP BY/count 하던 것을, 스케줄 커맨드
+(rollup_daily_metrics)가 KST 날짜별로 미리 집계해 둔 DailyMetrics 행을 읽는 방식으로 바꾼다.
+
+- 지난 날짜: DailyMetrics 행의 가입 수(그날 가입해 지금 남아 있는 회원 수)와 누적 회원 수
+- 오늘: 가입 수만 실시간(created_at 인덱스 범위 count)으로 센다
+- 사용자가 삭제되면(회원 탈퇴, delete_pending_users - User post_delete) record_user_deletion 이
+  그 사용자의 가입일 행의 가입 수와 가입일 이후 행들의 누적 회원 수에서 1을 뺀다. 그래서
+  총 회원 수도 users 테이블 전체 count 없이 집계 행에서 바로 읽는다.
+- 카탈로그 규모(제품/원료/소분류/배너 수): 가장 최근 행의 스냅샷
+- 커맨드는 마지막으로 집계한 날부터 오늘까지만 다시 계산한다(증분). 오늘 행은 임시값으로,
+  다음 실행 때 덮어쓴다.
+- 집계가 비어 있거나 기간 중 빠진 날이 있으면 예전처럼 실시간으로 계산한다.
+"""
+
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from common.models import Banner, DailyMetrics
+from products.models import Ingredient, OtherIngredient, Product, SmallCategory
+from users.models import User
+
+KST = ZoneInfo("Asia/Seoul")
+
+CATALOG_FIELDS = ("products", "ingredients", "other_ingredients", "small_categories", "banners")
+
+
+def today_kst():
+    return timezone.now().astimezone(KST).date()
+
+
+def _day_start(d):
+    return datetime.combine(d, time.min, tzinfo=KST)
+
+
+def _signups_by_day(start_date):
+    """start_date 이후 KST 일자별 가입 수."""
+    daily = (
+        User.objects.filter(created_at__gte=_day_start(start_date))
+        .annotate(day=TruncDate("created_at", tzinfo=KST))
+        .values("day")
+        .annotate(count=Count("id"))
+    )
+    return {row["day"]: row["count"] for row in daily}
+
+
+def catalog_counts():
+    """카탈로그 규모 실시간 count."""
+    return {
+        "products": Product.objects.count(),
+        "ingredients": Ingredient.objects.count(),
+        "other_ingredients": OtherIngredient.objects.count(),
+        "small_categories": SmallCategory.objects.count(),
+        "banners": Banner.objects.count(),
+    }
+
+
+def rollup_daily_metrics(full=False):
+    """마지막 집계일(또는 full 이면 첫 가입일)부터 오늘까지 DailyMetrics 를 갱신한다.
+
+    Returns:
+        갱신한 날짜 수
+    """
+    today = today_kst()
+    last = None if full else (
+        DailyMetrics.objects.filter(date__lt=today).order_by("-date").first()
+    )
+    if last is not None:
+        start_date = last.date  # 그날 집계 중에 돌았을 수 있으므로 다시 계산
+    else:
+        first = User.objects.order_by("created_at").values_list("created_at", flat=True).first()
+        start_date = first.astimezone(KST).date() if first else today
+
+    counts_by_day = _signups_by_day(start_date)
+    total = User.objects.filter(created_at__lt=_day_start(start_date)).count()
+
+    rows = []
+    d = start_date
+    while d <= today:
+        signups = counts_by_day.get(d, 0)
+        total += signups
+        rows.append(DailyMetrics(date=d, signups=signups, total_users=total))
+        d += timedelta(days=1)
+
+    past, today_row = rows[:-1], rows[-1]
+    if past:
+        DailyMetrics.objects.bulk_create(
+            past,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=["date"],
+            update_fields=["signups", "total_users", "updated_at"],
+        )
+    for field, value in catalog_counts().items():
+        setattr(today_row, field, value)
+    DailyMetrics.objects.bulk_create(
+        [today_row],
+        update_conflicts=True,
+        unique_fields=["date"],
+        update_fields=["signups", "total_users", *CATALOG_FIELDS, "updated_at"],
+    )
+    return len(rows)
+
+
+def record_user_deletion(user):
+    """삭제된 사용자를 집계 행에서 뺀다(User post_delete). 가입일 행이 아직 없으면 rollup 이 센다."""
+    if not user.created_at:
+        return
+    signup_day = user.created_at.astimezone(KST).date()
+    DailyMetrics.objects.filter(date=signup_day).update(signups=F("signups") - 1)
+    DailyMetrics.objects.filter(date__gte=signup_day).update(total_users=F("total_users") - 1)
+
+
+def signup_series(start_date, today):
+    """start_date ~ today 일자별 가입 수와 start_date 이전 누적 회원 수.
+
+    Returns:
+        (counts_by_day, base_total)
+    """
+    rows = {
+        row.date: row
+        for row in DailyMetrics.objects.filter(date__gte=start_date, date__lt=today)
+    }
+    missing = [
+        start_date + timedelta(days=i)
+        for i in range((today - start_date).days)
+        if start_date + timedelta(days=i) not in rows
+    ]
+    if missing:
+        # 첫 집계일(첫 가입일) 이전 날짜는 가입 0 으로 본다. 그 외에 빠진 날이 있으면 실시간 계산
+        earliest = DailyMetrics.objects.order_by("date").first()
+        if not (
+            earliest
+            and earliest.total_users == earliest.signups
+            and all(d < earliest.date for d in missing)
+        ):
+            counts_by_day = _signups_by_day(start_date)
+            base_total = User.objects.filter(created_at__lt=_day_start(start_date)).count()
+            return counts_by_day, base_total
+
+    counts_by_day = {d: row.signups for d, row in rows.items()}
+    counts_by_day[today] = User.objects.filter(created_at__gte=_day_start(today)).count()
+    # start_date 전날까지의 누적 = 기간 첫 집계 행의 누적 - 그날 가입 (행이 없으면 첫 가입일 이전)
+    first = rows.get(start_date)
+    base_total = first.total_users - first.signups if first else 0
+    return counts_by_day, base_total
+
+
+def latest_catalog_counts():
+    """가장 최근 집계 행의 카탈로그 스냅샷(없으면 실시간 count)."""
+    row = (
+        DailyMetrics.objects.filter(products__isnull=False)
+        .order_by("-date")
+        .values(*CATALOG_FIELDS)
+        .first()
+    )
+    return row or catalog_counts()
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.5 on 2026-10-19 08:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0004_banner_order_unique_bannerdetail_order_unique_together'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyMetrics',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True)),
+                ('signups', models.IntegerField(default=0)),
+                ('total_users', models.IntegerField(default=0)),
+                ('products', models.IntegerField(blank=True, null=True)),
+                ('ingredients', models.IntegerField(blank=True, null=True)),
+                ('other_ingredients', models.IntegerField(blank=True, null=True)),
+                ('small_categories', models.IntegerField(blank=True, null=True)),
+                ('banners', models.IntegerField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'daily_metrics',
+                'ordering': ['date'],
+            },
+        ),
+    ]
@@ -17,4 +17,22 @@ class BannerDetail(models.Model):
 
     class Meta:
         ordering = ['order', 'id']
-        unique_together = [('banner', 'order')]
\ No newline at end of file
+        unique_together = [('banner', 'order')]
+
+
+class DailyMetrics(models.Model):
+    """관리자 홈 대시보드용 일별 집계 (KST 날짜 기준, rollup_daily_metrics 커맨드가 채움)"""
+    date = models.DateField(unique=True)
+    signups = models.IntegerField(default=0)
+    total_users = models.IntegerField(default=0)  # 그날 끝까지의 누적 회원 수
+    # 카탈로그 규모 스냅샷 (집계한 시점 값, 과거 날짜를 새로 채운 경우 null)
+    products = models.IntegerField(null=True, blank=True)
+    ingredients = models.IntegerField(null=True, blank=True)
+    other_ingredients = models.IntegerField(null=True, blank=True)
+    small_categories = models.IntegerField(null=True, blank=True)
+    banners = models.IntegerField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "daily_metrics"
+        ordering = ['date']
@@ -0,0 +1,231 @@
+"""요청 단위 프로파일링 미들웨어(옵트인).
+
+뷰별로 쿼리 수·DB 시간·중복 쿼리(N+1 의심)·응답 렌더링(직렬화) 시간을 재서 응답의
+Server-Timing 헤더로 내보내고, 프로세스 메모리에 뷰별 히스토그램으로 모은다.
+집계는 /admin/home/perf/ (get_view_stats) 에서 JSON 으로 본다. 운영 환경에서는 관리자 페이지가
+막혀 있으므로 X-Profiling-Token 헤더에 PROFILING_TOKEN 값을 실어 읽는다.
+
+- PROFILING_ENABLED 가 False 면 아무것도 하지 않는다(기본값). 설정은 요청마다 읽는다.
+- PROFILING_SAMPLE_RATE 비율의 요청만 잰다. 샘플에서 빠진 요청은 난수 하나만 뽑고 지나간다.
+- 쿼리는 connection.execute_wrapper 로 센다. SQL 정규화(리터럴·IN 목록 → ?)는 요청이 끝난 뒤
+  서로 다른 SQL 에 대해서만 한 번씩 하므로, 실행 경로에는 시간 측정과 dict 갱신만 남는다.
+- 같은 정규화 SQL 이 한 요청에서 두 번 이상 돌면 중복으로 센다(반복 횟수 - 1).
+- render 는 뷰가 TemplateResponse/DRF Response 를 돌려준 뒤 렌더링·후속 미들웨어까지 걸린 시간이다.
+  DRF 는 serializer.data 를 뷰 안에서 만들므로 그 시간은 view 쪽에 들어간다.
+- 집계는 워커 프로세스마다 따로다(http_client.get_metrics 와 같음). 응답에 pid 를 같이 싣는다.
+"""
+
+import os
+import random
+import re
+import threading
+import time
+from contextlib import ExitStack
+from functools import lru_cache
+from typing import Dict
+
+from django.conf import settings
+from django.db import connections
+
+# 히스토그램 구간 상한 (마지막 구간은 그 이상)
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500)
+QUERY_BUCKETS = (1, 5, 10, 20, 50, 100)
+TOP_DUPLICATES = 5  # 뷰별로 보여 줄 중복 쿼리 수
+MAX_TRACKED_DUPLICATES = 50  # 뷰별로 들고 있는 중복 쿼리 시그니처 수 상한
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM_RE = re.compile(r"%s|\?")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+_stats: Dict[str, Dict] = {}
+_stats_lock = threading.Lock()
+
+
+@lru_cache(maxsize=2048)
+def normalize_sql(sql):
+    """파라미터·리터럴을 ? 로 바꾸고 IN (?, ?, ...) 을 하나로 접은 쿼리 시그니처."""
+    sql = _STRING_RE.sub("?", sql)
+    sql = _NUMBER_RE.sub("?", sql)
+    sql = _PARAM_RE.sub("?", sql)
+    sql = _IN_LIST_RE.sub("(...)", sql)
+    return " ".join(sql.split())
+
+
+def _bucket(value, bounds):
+    for i, bound in enumerate(bounds):
+        if value <= bound:
+            return i
+    return len(bounds)
+
+
+def _bucket_labels(bounds):
+    return [f"<={b}" for b in bounds] + [f">{bounds[-1]}"]
+
+
+class QueryRecorder:
+    """execute_wrapper — 요청 하나 동안의 쿼리 수·DB 시간·SQL 별 실행 횟수."""
+
+    def __init__(self):
+        self.count = 0
+        self.db_ms = 0.0
+        self.by_sql = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_ms += (time.perf_counter() - started) * 1000
+            self.count += 1
+            self.by_sql[sql] = self.by_sql.get(sql, 0) + 1
+
+    def duplicates(self):
+        """{정규화 SQL: 실행 횟수} 중 두 번 이상 실행된 것."""
+        signatures = {}
+        for sql, hits in self.by_sql.items():
+            signature = normalize_sql(sql)
+            signatures[signature] = signatures.get(signature, 0) + hits
+        return {signature: hits for signature, hits in signatures.items() if hits > 1}
+
+
+def _record(view, total_ms, view_ms, render_ms, recorder, duplicates):
+    duplicate_queries = sum(hits - 1 for hits in duplicates.values())
+    with _stats_lock:
+        s = _stats.get(view)
+        if s is None:
+            s = _stats[view] = {
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "view_ms": 0.0,
+                "render_ms": 0.0,
+                "db_ms": 0.0,
+                "queries": 0,
+                "max_queries": 0,
+                "duplicate_queries": 0,
+                "latency_hist": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                "query_hist": [0] * (len(QUERY_BUCKETS) + 1),
+                "duplicates": {},
+            }
+        s["count"] += 1
+        s["total_ms"] += total_ms
+        s["max_ms"] = max(s["max_ms"], total_ms)
+        s["view_ms"] += view_ms
+        s["render_ms"] += render_ms
+        s["db_ms"] += recorder.db_ms
+        s["queries"] += recorder.count
+        s["max_queries"] = max(s["max_queries"], recorder.count)
+        s["duplicate_queries"] += duplicate_queries
+        s["latency_hist"][_bucket(total_ms, LATENCY_BUCKETS_MS)] += 1
+        s["query_hist"][_bucket(recorder.count, QUERY_BUCKETS)] += 1
+        tracked = s["duplicates"]
+        for signature, hits in duplicates.items():
+            if signature in tracked or len(tracked) < MAX_TRACKED_DUPLICATES:
+                tracked[signature] = tracked.get(signature, 0) + hits
+
+
+def _percentile_bound(hist, bounds, q):
+    """히스토그램에서 q 분위가 들어 있는 구간의 상한(마지막 구간이면 None)."""
+    total = sum(hist)
+    if not total:
+        return None
+    target = total * q
+    seen = 0
+    for i, n in enumerate(hist):
+        seen += n
+        if seen >= target:
+            return bounds[i] if i < len(bounds) else None
+    return None
+
+
+def get_view_stats() -> Dict[str, Dict]:
+    """뷰별 샘플 수·평균/최대 지연·DB/렌더 시간·쿼리 수·중복 쿼리·히스토그램 스냅샷."""
+    with _stats_lock:
+        snapshot = {
+            view: {**s, "latency_hist": list(s["latency_hist"]), "query_hist": list(s["query_hist"]),
+                   "duplicates": dict(s["duplicates"])}
+            for view, s in _stats.items()
+        }
+    result = {}
+    for view, s in snapshot.items():
+        n = s["count"]
+        top = sorted(s["duplicates"].items(), key=lambda item: item[1], reverse=True)[:TOP_DUPLICATES]
+        result[view] = {
+            "count": n,
+            "avg_ms": round(s["total_ms"] / n, 2),
+            "max_ms": round(s["max_ms"], 2),
+            "p50_ms_le": _percentile_bound(s["latency_hist"], LATENCY_BUCKETS_MS, 0.5),
+            "p95_ms_le": _percentile_bound(s["latency_hist"], LATENCY_BUCKETS_MS, 0.95),
+            "avg_view_ms": round(s["view_ms"] / n, 2),
+            "avg_render_ms": round(s["render_ms"] / n, 2),
+            "avg_db_ms": round(s["db_ms"] / n, 2),
+            "avg_queries": round(s["queries"] / n, 2),
+            "max_queries": s["max_queries"],
+            "avg_duplicate_queries": round(s["duplicate_queries"] / n, 2),
+            "latency_hist": dict(zip(_bucket_labels(LATENCY_BUCKETS_MS), s["latency_hist"])),
+            "query_hist": dict(zip(_bucket_labels(QUERY_BUCKETS), s["query_hist"])),
+            "top_duplicates": [{"sql": sql, "hits": hits} for sql, hits in top],
+        }
+    return result
+
+
+def reset_view_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+def profiling_info():
+    return {
+        "enabled": getattr(settings, "PROFILING_ENABLED", False),
+        "sample_rate": getattr(settings, "PROFILING_SAMPLE_RATE", 0.0),
+        "pid": os.getpid(),
+    }
+
+
+class ProfilingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not getattr(settings, "PROFILING_ENABLED", False) or (
+            random.random() >= getattr(settings, "PROFILING_SAMPLE_RATE", 0.0)
+        ):
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        request._profiling_view_done = None
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(recorder))
+            response = self.get_response(request)
+        finished = time.perf_counter()
+
+        total_ms = (finished - started) * 1000
+        view_done = request._profiling_view_done
+        render_ms = (finished - view_done) * 1000 if view_done else 0.0
+        view_ms = total_ms - render_ms
+        duplicates = recorder.duplicates()
+
+        match = getattr(request, "resolver_match", None)
+        view = (match.view_name or match.route) if match else "<unresolved>"
+        _record(view, total_ms, view_ms, render_ms, recorder, duplicates)
+
+        duplicate_queries = sum(hits - 1 for hits in duplicates.values())
+        response["Server-Timing"] = ", ".join(
+            [
+                f'db;dur={recorder.db_ms:.1f};desc="{recorder.count} queries"',
+                f'dup;desc="{duplicate_queries} duplicate queries"',
+                f"view;dur={view_ms:.1f}",
+                f"render;dur={render_ms:.1f}",
+                f"total;dur={total_ms:.1f}",
+            ]
+        )
+        return response
+
+    def process_template_response(self, request, response):
+        # 뷰가 끝나고 렌더링 직전 — 샘플된 요청에서만 의미가 있다
+        if hasattr(request, "_profiling_view_done"):
+            request._profiling_view_done = time.perf_counter()
+        return response
@@ -0,0 +1,67 @@
+"""랜덤 샘플링 유틸.
+
+`order_by("?")`(테이블 전체 정렬)나 `random.sample(list(queryset), k)`(전체 로딩) 대신,
+캐시해 둔 pk 배열에서 k개 후보를 뽑아 `pk__in` 으로 가져온다. 요청당 DB 작업이 표본 크기
+k 에만 비례한다.
+
+- pk 배열은 Django 캐시에 SAMPLE_POOL_TIMEOUT 동안 보관한다. 그 사이 삭제된 행은 조회에서
+  빠지고, 새로 추가된 행은 다음 갱신 때부터 뽑힌다.
+- 제외 조건(예: 이미 리뷰한 제품)은 서브쿼리로 SQL 에서 거른다. 걸러져 모자라면 후보를 늘려
+  몇 번 더 뽑고, 그래도 모자라면(거의 전부 제외된 경우) 남은 행에서 SQL 로 직접 뽑는다.
+"""
+
+import random
+from typing import List
+
+from django.core.cache import cache
+
+SAMPLE_POOL_TIMEOUT = 600  # 10분
+_OVERSAMPLE = 3
+_MAX_ROUNDS = 3
+
+
+def _id_pool(queryset, cache_key: str) -> List:
+    ids = cache.get(cache_key)
+    if ids is None:
+        ids = list(queryset.order_by().values_list("pk", flat=True))
+        cache.set(cache_key, ids, SAMPLE_POOL_TIMEOUT)
+    return ids
+
+
+def invalidate_sample_pool(cache_key: str):
+    """캐시된 pk 배열을 버린다(다음 샘플링 때 다시 만든다)."""
+    cache.delete(cache_key)
+
+
+def random_sample(queryset, k: int, cache_key: str, exclude_ids=None) -> List:
+    """queryset 에서 k개를 무작위로 뽑아 리스트로 반환한다(행이 모자라면 있는 만큼).
+
+    Args:
+        queryset: 샘플링 대상(select_related 등은 결과 조회에 그대로 적용)
+        k: 표본 크기
+        cache_key: pk 배열 캐시 키 (대상 queryset 마다 고유해야 함)
+        exclude_ids: 제외할 pk 목록 또는 values_list 쿼리셋(서브쿼리로 SQL 에서 제외)
+    """
+    ids = _id_pool(queryset, cache_key)
+    if k <= 0 or not ids:
+        return []
+
+    filtered = queryset if exclude_ids is None else queryset.exclude(pk__in=exclude_ids)
+    picked = []
+    tried = set()
+    for round_ in range(_MAX_ROUNDS):
+        if len(tried) >= len(ids):
+            break
+        size = min(len(ids), (k - len(picked)) * _OVERSAMPLE * (round_ + 1))
+        candidates = [pk for pk in random.sample(ids, size) if pk not in tried]
+        tried.update(candidates)
+
+        rows = filtered.filter(pk__in=candidates).in_bulk()
+        # 후보를 뽑은 (무작위) 순서를 유지
+        picked += [rows[pk] for pk in candidates if pk in rows][: k - len(picked)]
+        if len(picked) >= k:
+            return picked
+
+    # 대부분 제외된 경우: 남은 행이 적으므로 SQL 에서 직접 뽑는다
+    rest = filtered.exclude(pk__in=[obj.pk for obj in picked]).order_by("?")
+    return picked + list(rest[: k - len(picked)])
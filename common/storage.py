@@ -0,0 +1,189 @@
+"""S3 스토리지 공용 서비스.
+
+요청마다 boto3 클라이언트를 새로 만들던 review.utils.S3Uploader /
+products.utils.upload_images_to_s3 / common.utils.upload_banner_to_s3 가 함께 쓰는
+프로세스 단위 클라이언트와 업로드/presigned URL 헬퍼를 모아 둔다.
+
+- 클라이언트는 프로세스당 1개만 만들고(스레드 안전) 커넥션 풀을 재사용한다.
+- presigned URL(PUT)·presigned POST 는 N개를 한 번에 만든다
+  (서명은 로컬 연산이라 네트워크 왕복 없음).
+- 관리자 다중 이미지 폼은 스레드 풀로 병렬 업로드한다.
+- AWS_S3_ENDPOINT_URL 을 지정하면 MinIO/LocalStack/moto 서버 같은 로컬 S3 로 붙는다.
+  moto 의 mock_aws 처럼 프로세스 내부에서 가로채는 경우 reset_s3_client() 로
+  클라이언트를 다시 만들게 한다.
+"""
+
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import boto3
+from botocore.config import Config
+from django.conf import settings
+
+PRESIGNED_URL_EXPIRES = 3600  # 1시간 유효
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def _max_workers() -> int:
+    return getattr(settings, "S3_UPLOAD_MAX_WORKERS", 8)
+
+
+def get_s3_client():
+    """프로세스 공용 S3 클라이언트를 반환한다(최초 호출 시 1회 생성).
+
+    boto3 클라이언트는 스레드 안전하므로 업로드 스레드 풀과도 공유한다.
+    max_pool_connections 는 병렬 업로드 워커 수 이상으로 맞춰 풀 고갈을 막는다.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = boto3.client(
+                    "s3",
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                    region_name=settings.AWS_S3_REGION_NAME,
+                    endpoint_url=getattr(settings, "AWS_S3_ENDPOINT_URL", None),
+                    config=Config(
+                        max_pool_connections=max(10, _max_workers()),
+                        retries={"max_attempts": 3, "mode": "standard"},
+                    ),
+                )
+    return _client
+
+
+def reset_s3_client():
+    """캐시된 클라이언트를 버린다(설정 변경·테스트용 스텁 교체 시)."""
+    global _client
+    with _client_lock:
+        _client = None
+
+
+def build_public_url(key: str) -> str:
+    """S3 키를 CloudFront 공개 URL 로 바꾼다(도메인에 https:// 가 없으면 붙인다)."""
+    domain = settings.CLOUDFRONT_DOMAIN
+    if not domain.startswith(("https://", "http://")):
+        domain = f"https://{domain}"
+    return f"{domain}/{key}"
+
+
+def key_from_public_url(url: str) -> str:
+    """build_public_url 로 만든 URL 을 S3 키로 되돌린다(이미 키면 그대로 반환)."""
+    prefix = build_public_url("")
+    return url[len(prefix):] if url.startswith(prefix) else url
+
+
+def make_key(prefix: str, filename: str, default_ext: str = "") -> str:
+    """원본 파일명에서 확장자만 취해 `prefix/uuid.ext` 형태의 안전한 키를 만든다."""
+    _, ext = os.path.splitext(filename or "")
+    ext = ext.lower() or default_ext
+    return f"{prefix}/{uuid.uuid4().hex}{ext}"
+
+
+def generate_presigned_put_urls(
+    keys: List[str], expires_in: int = PRESIGNED_URL_EXPIRES
+) -> List[Dict[str, str]]:
+    """키 N개에 대한 PUT presigned URL 을 한 번에 만든다.
+
+    Returns:
+        [{"key", "upload_url", "final_url"}, ...] (입력 순서 유지)
+    """
+    client = get_s3_client()
+    bucket = settings.AWS_STORAGE_BUCKET_NAME
+    return [
+        {
+            "key": key,
+            "upload_url": client.generate_presigned_url(
+                "put_object",
+                Params={"Bucket": bucket, "Key": key},
+                ExpiresIn=expires_in,
+            ),
+            "final_url": build_public_url(key),
+        }
+        for key in keys
+    ]
+
+
+def generate_presigned_posts(
+    files: List[Dict[str, str]],
+    max_bytes: int,
+    expires_in: int = PRESIGNED_URL_EXPIRES,
+) -> List[Dict]:
+    """브라우저가 S3 로 직접 올릴 수 있는 presigned POST 를 파일 N개에 대해 만든다.
+
+    Args:
+        files: [{"key", "content_type"}, ...]
+        max_bytes: 파일당 허용 최대 크기(content-length-range 정책)
+
+    Returns:
+        [{"key", "url", "fields", "final_url"}, ...] (입력 순서 유지).
+        클라이언트는 fields 를 그대로 폼 필드로 넣고 마지막에 file 을 붙여 url 로 POST 한다.
+    """
+    client = get_s3_client()
+    bucket = settings.AWS_STORAGE_BUCKET_NAME
+    posts = []
+    for item in files:
+        content_type = item["content_type"]
+        post = client.generate_presigned_post(
+            Bucket=bucket,
+            Key=item["key"],
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", 1, max_bytes],
+            ],
+            ExpiresIn=expires_in,
+        )
+        posts.append(
+            {
+                "key": item["key"],
+                "url": post["url"],
+                "fields": post["fields"],
+                "final_url": build_public_url(item["key"]),
+            }
+        )
+    return posts
+
+
+def upload_file(fileobj, key: str, content_type: Optional[str] = None) -> str:
+    """파일 하나를 업로드하고 키를 반환한다."""
+    extra_args = {"ContentType": content_type} if content_type else None
+    get_s3_client().upload_fileobj(
+        fileobj,
+        settings.AWS_STORAGE_BUCKET_NAME,
+        key,
+        ExtraArgs=extra_args,
+    )
+    return key
+
+
+def upload_files(files: List, prefix: str) -> List[str]:
+    """업로드 파일 여러 개를 스레드 풀로 병렬 업로드하고, 입력 순서대로 키를 반환한다.
+
+    파일이 1개면 스레드 풀을 띄우지 않는다. 하나라도 실패하면 예외를 그대로 올린다.
+    """
+    if not files:
+        return []
+
+    keys = [make_key(prefix, f.name) for f in files]
+    jobs = [
+        (f, key, getattr(f, "content_type", None)) for f, key in zip(files, keys)
+    ]
+    if len(jobs) == 1:
+        upload_file(*jobs[0])
+        return keys
+
+    with ThreadPoolExecutor(max_workers=min(_max_workers(), len(jobs))) as pool:
+        # list() 로 모든 결과를 모아 예외가 있으면 여기서 전파되게 한다.
+        list(pool.map(lambda job: upload_file(*job), jobs))
+    return keys
+
+
+def delete_object(key: str):
+    """S3 객체 하나를 삭제한다."""
+    get_s3_client().delete_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)
@@ -0,0 +1,387 @@
+import io
+from datetime import timedelta
+from unittest import mock
+
+import requests
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.http import JsonResponse
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import include, path, reverse
+from django.utils import timezone
+from moto import mock_aws
+from PIL import Image
+
+from common import http_client, storage
+from common.thumbnails import render_thumbnail
+from common.profiling import get_view_stats, normalize_sql, reset_view_stats
+from common.metrics import rollup_daily_metrics, signup_series, today_kst
+from common.models import DailyMetrics
+from products.admin_home_views import _home_kpis, _signup_chart
+from users.models import User
+
+BUCKET = "dasii-test-bucket"
+PROFILING_TOKEN = "perf-secret"
+
+
+def _n_plus_one(request):
+    """사용자마다 따로 조회하는 N+1 뷰 (프로파일링 테스트용)."""
+    users = list(User.objects.order_by("id"))
+    nicknames = [User.objects.get(id=user.id).nickname for user in users]
+    return JsonResponse({"nicknames": nicknames})
+
+
+urlpatterns = [
+    path("n-plus-one/", _n_plus_one, name="n_plus_one"),
+    path("admin/", include("products.admin_urls")),
+]
+
+
+@override_settings(
+    AWS_ACCESS_KEY_ID="testing",
+    AWS_SECRET_ACCESS_KEY="testing",
+    AWS_S3_REGION_NAME="ap-northeast-2",
+    AWS_STORAGE_BUCKET_NAME=BUCKET,
+    AWS_S3_ENDPOINT_URL=None,
+    CLOUDFRONT_DOMAIN="cdn.example.com",
+)
+class StorageTest(SimpleTestCase):
+    """common.storage - moto 로 가로챈 S3 에 presign/업로드/삭제."""
+
+    def setUp(self):
+        aws = mock_aws()
+        aws.start()
+        self.addCleanup(aws.stop)
+        # mock 안에서 새 클라이언트를 만들게 하고, 끝나면 실제 설정용 클라이언트를 다시 만들게 한다
+        storage.reset_s3_client()
+        self.addCleanup(storage.reset_s3_client)
+        self.client = storage.get_s3_client()
+        self.client.create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"},
+        )
+
+    def test_client_is_shared(self):
+        self.assertIs(storage.get_s3_client(), self.client)
+
+    def test_build_public_url_adds_scheme(self):
+        self.assertEqual(
+            storage.build_public_url("products/a.jpg"),
+            "https://cdn.example.com/products/a.jpg",
+        )
+        with self.settings(CLOUDFRONT_DOMAIN="http://localhost:9000"):
+            self.assertEqual(
+                storage.build_public_url("products/a.jpg"),
+                "http://localhost:9000/products/a.jpg",
+            )
+
+    def test_key_from_public_url_round_trip(self):
+        key = storage.make_key("products", "사진.JPG")
+        self.assertTrue(key.startswith("products/"))
+        self.assertTrue(key.endswith(".jpg"))
+        self.assertEqual(storage.key_from_public_url(storage.build_public_url(key)), key)
+        # 이미 키거나 다른 도메인이면 그대로
+        self.assertEqual(storage.key_from_public_url(key), key)
+        other = "https://other.example.com/products/a.jpg"
+        self.assertEqual(storage.key_from_public_url(other), other)
+
+    def test_presigned_put_urls_keep_order(self):
+        keys = ["reviews/1.jpg", "reviews/2.jpg", "reviews/3.jpg"]
+        urls = storage.generate_presigned_put_urls(keys, expires_in=60)
+
+        self.assertEqual([u["key"] for u in urls], keys)
+        for item in urls:
+            self.assertIn(BUCKET, item["upload_url"])
+            self.assertIn(item["key"], item["upload_url"])
+            self.assertIn("X-Amz-Expires=60", item["upload_url"])
+            self.assertEqual(item["final_url"], f"https://cdn.example.com/{item['key']}")
+
+    def test_presigned_posts_carry_policy(self):
+        posts = storage.generate_presigned_posts(
+            [
+                {"key": "products/a.png", "content_type": "image/png"},
+                {"key": "products/b.jpg", "content_type": "image/jpeg"},
+            ],
+            max_bytes=1024,
+        )
+
+        self.assertEqual([p["key"] for p in posts], ["products/a.png", "products/b.jpg"])
+        self.assertEqual(posts[0]["fields"]["key"], "products/a.png")
+        self.assertEqual(posts[0]["fields"]["Content-Type"], "image/png")
+        self.assertIn("policy", posts[0]["fields"])
+        self.assertEqual(posts[1]["final_url"], "https://cdn.example.com/products/b.jpg")
+
+    def test_upload_files_and_delete(self):
+        files = [
+            SimpleUploadedFile("a.png", b"a" * 10, content_type="image/png"),
+            SimpleUploadedFile("b.jpg", b"b" * 20, content_type="image/jpeg"),
+        ]
+        keys = storage.upload_files(files, "products")
+
+        self.assertEqual(len(keys), 2)
+        head = self.client.head_object(Bucket=BUCKET, Key=keys[0])
+        self.assertEqual(head["ContentType"], "image/png")
+        self.assertEqual(self.client.head_object(Bucket=BUCKET, Key=keys[1])["ContentLength"], 20)
+
+        storage.delete_object(keys[0])
+        listed = self.client.list_objects_v2(Bucket=BUCKET).get("Contents", [])
+        self.assertEqual([obj["Key"] for obj in listed], [keys[1]])
+
+
+def _png(mode, color, size=(800, 600)):
+    buf = io.BytesIO()
+    Image.new(mode, size, color).save(buf, format="PNG")
+    buf.seek(0)
+    return buf
+
+
+@override_settings(THUMBNAIL_SIZE=(400, 400), THUMBNAIL_QUALITY=80)
+class RenderThumbnailTest(SimpleTestCase):
+    def render(self, source):
+        with Image.open(render_thumbnail(source)) as thumb:
+            thumb.load()
+            return thumb
+
+    @override_settings(THUMBNAIL_FORMAT="WEBP")
+    def test_webp_keeps_transparency(self):
+        thumb = self.render(_png("RGBA", (255, 0, 0, 0)))
+        self.assertEqual(thumb.format, "WEBP")
+        self.assertEqual(thumb.size, (400, 300))
+        self.assertEqual(thumb.mode, "RGBA")
+        self.assertEqual(thumb.getpixel((10, 10))[3], 0)
+
+    @override_settings(THUMBNAIL_FORMAT="JPEG")
+    def test_jpeg_puts_transparency_on_white(self):
+        thumb = self.render(_png("RGBA", (0, 0, 0, 0)))
+        self.assertEqual((thumb.format, thumb.mode), ("JPEG", "RGB"))
+        self.assertTrue(all(channel > 240 for channel in thumb.getpixel((10, 10))))
+
+    @override_settings(THUMBNAIL_FORMAT="WEBP")
+    def test_opaque_image_stays_rgb(self):
+        thumb = self.render(_png("RGB", (0, 128, 0), size=(200, 100)))
+        self.assertEqual((thumb.mode, thumb.size), ("RGB", (200, 100)))  # 키우지 않는다
+
+
+class DailyMetricsTest(TestCase):
+    """대시보드 가입 통계 - 집계 행(DailyMetrics)과 실시간 count 의 조합."""
+
+    def make_users(self, count, days_ago):
+        start = User.objects.count()
+        users = [
+            User.objects.create_user(email=f"m{n}@example.com", password="pw", nickname=f"m{n}")
+            for n in range(start, start + count)
+        ]
+        ids = [u.id for u in users]
+        User.objects.filter(id__in=ids).update(created_at=timezone.now() - timedelta(days=days_ago))
+        return list(User.objects.filter(id__in=ids))
+
+    def test_rollup_matches_live_series(self):
+        self.make_users(2, 40)
+        self.make_users(3, 10)
+        self.make_users(1, 0)
+        today = today_kst()
+        start = today - timedelta(days=29)
+        live_counts, live_base = signup_series(start, today)  # 집계 전: 실시간 계산
+
+        rollup_daily_metrics()
+        self.assertTrue(DailyMetrics.objects.exists())
+        counts, base = signup_series(start, today)
+        self.assertEqual({d: n for d, n in counts.items() if n}, live_counts)
+        self.assertEqual(base, live_base)
+        self.assertEqual(_signup_chart()["grand_total"], 6)
+
+    def test_total_users_reflects_deletions(self):
+        old = self.make_users(2, 40)
+        recent = self.make_users(3, 10)
+        rollup_daily_metrics()
+
+        old[0].delete()
+        recent[0].delete()
+        rollup_daily_metrics()
+
+        chart = _signup_chart()
+        self.assertEqual(chart["grand_total"], User.objects.count())
+        self.assertEqual(chart["grand_total"], 3)
+        self.assertEqual(chart["points"][-1]["total"], 3)
+        self.assertEqual(_home_kpis(chart)[0]["value"], 3)
+
+    def test_deletions_before_next_rollup(self):
+        old = self.make_users(2, 40)
+        recent = self.make_users(3, 10)
+        self.make_users(1, 0)
+        rollup_daily_metrics()
+
+        old[0].delete()
+        recent[0].delete()
+        # 다음 rollup 전에도 집계 행이 바로 맞는다
+        chart = _signup_chart()
+        self.assertEqual(chart["grand_total"], 4)
+        ten_days_ago = today_kst() - timedelta(days=10)
+        self.assertEqual(next(p["new"] for p in chart["points"] if p["date"] == ten_days_ago), 2)
+
+    def test_dashboard_does_not_count_users_table(self):
+        self.make_users(2, 40)
+        self.make_users(1, 0)
+        rollup_daily_metrics()
+        with CaptureQueriesContext(connection) as ctx:
+            counts, base = signup_series(today_kst() - timedelta(days=29), today_kst())
+        self.assertEqual(base + sum(counts.values()), 3)
+        user_queries = [q["sql"] for q in ctx.captured_queries if '"users"' in q["sql"]]
+        self.assertEqual(len(user_queries), 1)  # 오늘 가입 수(created_at 범위)만
+        self.assertIn("created_at", user_queries[0])
+
+
+@override_settings(ROOT_URLCONF="common.tests", PROFILING_ENABLED=True, PROFILING_SAMPLE_RATE=1.0)
+class ProfilingMiddlewareTest(TestCase):
+    """common.profiling - Server-Timing 헤더와 뷰별 집계."""
+
+    def setUp(self):
+        reset_view_stats()
+        self.addCleanup(reset_view_stats)
+        for n in range(3):
+            User.objects.create_user(email=f"p{n}@example.com", password="pw", nickname=f"p{n}")
+
+    def server_timing(self, response):
+        return dict(part.split(";", 1) for part in response["Server-Timing"].split(", "))
+
+    def test_server_timing_counts_duplicate_queries(self):
+        response = self.client.get("/n-plus-one/")
+        self.assertEqual(response.status_code, 200)
+
+        timing = self.server_timing(response)
+        self.assertEqual(set(timing), {"db", "dup", "view", "render", "total"})
+        self.assertIn('desc="4 queries"', timing["db"])  # 목록 1 + 사용자별 3
+        self.assertEqual(timing["dup"], 'desc="2 duplicate queries"')
+
+        stats = get_view_stats()["n_plus_one"]
+        self.assertEqual(stats["count"], 1)
+        self.assertEqual(stats["max_queries"], 4)
+        self.assertEqual(stats["avg_duplicate_queries"], 2)
+        self.assertEqual(stats["top_duplicates"][0]["hits"], 3)
+        self.assertIn("WHERE", stats["top_duplicates"][0]["sql"])
+        self.assertNotIn("%s", stats["top_duplicates"][0]["sql"])
+
+    def test_stats_accumulate_per_view(self):
+        self.client.get("/n-plus-one/")
+        self.client.get("/n-plus-one/")
+        stats = get_view_stats()["n_plus_one"]
+        self.assertEqual(stats["count"], 2)
+        self.assertEqual(sum(stats["latency_hist"].values()), 2)
+        self.assertEqual(stats["query_hist"]["<=5"], 2)
+
+    @override_settings(PROFILING_SAMPLE_RATE=0.0)
+    def test_nothing_recorded_when_not_sampled(self):
+        response = self.client.get("/n-plus-one/")
+        self.assertNotIn("Server-Timing", response)
+        self.assertEqual(get_view_stats(), {})
+
+    @override_settings(PROFILING_ENABLED=False)
+    def test_nothing_recorded_when_disabled(self):
+        response = self.client.get("/n-plus-one/")
+        self.assertNotIn("Server-Timing", response)
+        self.assertEqual(get_view_stats(), {})
+
+
+class NormalizeSqlTest(SimpleTestCase):
+    def test_literals_and_params(self):
+        self.assertEqual(
+            normalize_sql("SELECT * FROM t WHERE id = 12 AND name = 'it''s'  AND x = %s"),
+            "SELECT * FROM t WHERE id = ? AND name = ? AND x = ?",
+        )
+
+    def test_in_lists_fold(self):
+        self.assertEqual(
+            normalize_sql("SELECT * FROM t WHERE id IN (%s, %s, %s)"),
+            normalize_sql("SELECT * FROM t WHERE id IN (1, 2)"),
+        )
+        self.assertEqual(normalize_sql("SELECT * FROM t WHERE id IN (1, 2)"), "SELECT * FROM t WHERE id IN (...)")
+
+
+@override_settings(ROOT_URLCONF="common.tests", PROFILING_TOKEN=PROFILING_TOKEN)
+class PerfStatsAccessTest(TestCase):
+    """/admin/home/perf/ - 운영에서는 토큰 헤더로만, 개발에서는 관리자 세션으로도."""
+
+    def setUp(self):
+        self.url = reverse("admin_home_perf")
+
+    @override_settings(DJANGO_ENV="production")
+    def test_token_works_in_production(self):
+        response = self.client.get(self.url, HTTP_X_PROFILING_TOKEN=PROFILING_TOKEN)
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual({"ok", "pid", "views", "outbound"}, set(response.json()))
+
+    @override_settings(DJANGO_ENV="production")
+    def test_production_rejects_missing_or_wrong_token(self):
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+        response = self.client.get(self.url, HTTP_X_PROFILING_TOKEN="wrong")
+        self.assertEqual(response.status_code, 403)
+
+    @override_settings(DJANGO_ENV="production", PROFILING_TOKEN="")
+    def test_empty_token_setting_disables_token_access(self):
+        response = self.client.get(self.url, HTTP_X_PROFILING_TOKEN="")
+        self.assertEqual(response.status_code, 403)
+
+    def test_reset_with_token_skips_csrf(self):
+        client = self.client_class(enforce_csrf_checks=True)
+        response = client.post(self.url, {"action": "reset"}, HTTP_X_PROFILING_TOKEN=PROFILING_TOKEN)
+        self.assertEqual(response.status_code, 200)
+
+    def test_admin_session_in_development(self):
+        self.assertRedirects(self.client.get(self.url), reverse("admin_login"), fetch_redirect_response=False)
+        session = self.client.session
+        session["admin_authenticated"] = True
+        session.save()
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+        # 세션 경로의 reset 은 CSRF 검사를 그대로 받는다
+        client = self.client_class(enforce_csrf_checks=True)
+        client.cookies = self.client.cookies
+        self.assertEqual(client.post(self.url, {"action": "reset"}).status_code, 403)
+
+
+class CircuitBreakerTest(SimpleTestCase):
+    """common.http_client - 서킷 브레이커 상태 전이."""
+
+    def setUp(self):
+        self.service = f"test-{id(self)}"
+        self.breaker = http_client._breaker(self.service)
+        self.breaker.failure_threshold = 1
+        self.addCleanup(http_client._breakers.pop, self.service, None)
+
+    def call(self, side_effect=None, status=200):
+        session = mock.Mock()
+        session.request.side_effect = side_effect
+        session.request.return_value = mock.Mock(status_code=status)
+        with mock.patch.object(http_client, "get_session", return_value=session):
+            return http_client.get("https://example.com/x", service=self.service)
+
+    def open_and_wait(self):
+        with self.assertRaises(requests.ConnectionError):
+            self.call(requests.ConnectionError("down"))
+        self.assertEqual(self.breaker.state, "open")
+        self.breaker._opened_at -= http_client.RESET_TIMEOUT
+        self.assertEqual(self.breaker.state, "half-open")
+
+    def test_open_circuit_rejects_calls(self):
+        with self.assertRaises(requests.ConnectionError):
+            self.call(requests.ConnectionError("down"))
+        with self.assertRaises(http_client.CircuitOpenError):
+            self.call()
+
+    def test_successful_trial_closes(self):
+        self.open_and_wait()
+        self.call()
+        self.assertEqual(self.breaker.state, "closed")
+
+    def test_non_request_error_in_trial_does_not_wedge_breaker(self):
+        self.open_and_wait()
+        with self.assertRaises(ValueError):
+            self.call(ValueError("bad url"))
+        self.assertFalse(self.breaker._trial_in_flight)
+
+        # 다시 reset_timeout 이 지나면 시험 호출이 또 허용된다
+        self.breaker._opened_at -= http_client.RESET_TIMEOUT
+        self.call()
+        self.assertEqual(self.breaker.state, "closed")
@@ -0,0 +1,103 @@
+"""이미지 파생본(썸네일) 파이프라인.
+
+목록 카드(10개 그리드 등)가 원본 대신 쓰도록 고정 크기 썸네일을 만들어 원본 옆
+`<디렉터리>/thumbs/<이름>.<webp|jpg>` 키로 올린다.
+
+- 업로드 시점: 서버를 거쳐 올라오는 파일은 이미 손에 있는 파일 객체로 바로 만든다.
+- 직접 업로드(presigned)된 원본·기존 이미지: S3 에서 원본을 받아 만든다
+  (backfill: generate_thumbnails 커맨드).
+- 썸네일 생성 실패는 업로드 자체를 실패시키지 않는다. None 을 돌려주고 카드는 원본으로 폴백한다.
+"""
+
+import io
+import logging
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from django.conf import settings
+from PIL import Image, ImageOps
+
+from common.storage import get_s3_client, upload_file
+
+logger = logging.getLogger(__name__)
+
+_EXTENSIONS = {"WEBP": ".webp", "JPEG": ".jpg"}
+_CONTENT_TYPES = {"WEBP": "image/webp", "JPEG": "image/jpeg"}
+_ALPHA_FORMATS = {"WEBP"}  # 투명도를 담을 수 있는 출력 형식
+
+
+def _thumbnail_format() -> str:
+    fmt = getattr(settings, "THUMBNAIL_FORMAT", "WEBP").upper()
+    return fmt if fmt in _EXTENSIONS else "WEBP"
+
+
+def thumbnail_key(key: str) -> str:
+    """원본 키에 대응하는 썸네일 키. 예) products/abc.png → products/thumbs/abc.webp"""
+    directory, filename = posixpath.split(key)
+    stem, _ = posixpath.splitext(filename)
+    return posixpath.join(directory, "thumbs", stem + _EXTENSIONS[_thumbnail_format()])
+
+
+def _to_output_mode(img: Image.Image, fmt: str) -> Image.Image:
+    has_alpha = img.mode in ("RGBA", "LA", "PA") or (
+        img.mode == "P" and "transparency" in img.info
+    )
+    if not has_alpha:
+        return img.convert("RGB")
+    rgba = img.convert("RGBA")
+    if fmt in _ALPHA_FORMATS:
+        return rgba
+    background = Image.new("RGB", rgba.size, (255, 255, 255))
+    background.paste(rgba, mask=rgba.getchannel("A"))
+    return background
+
+
+def render_thumbnail(source) -> io.BytesIO:
+    """원본 이미지(파일 객체)를 THUMBNAIL_SIZE 안에 들어오도록 줄여 인코딩한다.
+
+    EXIF 회전을 반영하고, 원본보다 크게 늘리지는 않는다(비율 유지).
+    투명 배경(PNG 등)은 WEBP 면 그대로 두고, JPEG 면 흰 배경에 합성한다(검게 칠해지지 않게).
+    """
+    fmt = _thumbnail_format()
+    size = tuple(getattr(settings, "THUMBNAIL_SIZE", (400, 400)))
+    with Image.open(source) as img:
+        thumb = _to_output_mode(ImageOps.exif_transpose(img), fmt)
+        thumb.thumbnail(size, Image.Resampling.LANCZOS)
+        buf = io.BytesIO()
+        thumb.save(buf, format=fmt, quality=getattr(settings, "THUMBNAIL_QUALITY", 80))
+    buf.seek(0)
+    return buf
+
+
+def create_thumbnail(key: str, source=None) -> Optional[str]:
+    """원본 key 의 썸네일을 만들어 업로드하고 썸네일 키를 반환한다(실패 시 None).
+
+    source 가 없으면 S3 에서 원본을 내려받는다.
+    """
+    try:
+        if source is None:
+            obj = get_s3_client().get_object(
+                Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key
+            )
+            source = io.BytesIO(obj["Body"].read())
+        else:
+            source.seek(0)
+        return upload_file(
+            render_thumbnail(source),
+            thumbnail_key(key),
+            _CONTENT_TYPES[_thumbnail_format()],
+        )
+    except Exception:
+        logger.exception("썸네일 생성 실패: %s", key)
+        return None
+
+
+def create_thumbnails(keys: List[str], sources: Optional[List] = None) -> List[Optional[str]]:
+    """여러 원본의 썸네일을 스레드 풀로 병렬 생성한다(입력 순서대로 썸네일 키 또는 None)."""
+    if not keys:
+        return []
+    sources = sources or [None] * len(keys)
+    workers = min(getattr(settings, "S3_UPLOAD_MAX_WORKERS", 8), len(keys))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(create_thumbnail, keys, sources))
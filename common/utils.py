@@ -1,24 +1,11 @@
-import os
-import uuid
-import boto3
-from django.conf import settings
+from typing import List
 
-def upload_banner_to_s3(image) -> str:
-    s3 = boto3.client(
-        "s3",
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name=settings.AWS_S3_REGION_NAME,
-    )
-
-    _, ext = os.path.splitext(image.name)
-    filename = f"banners/{uuid.uuid4().hex}{ext.lower()}"
+from common.storage import build_public_url, upload_file, upload_files, make_key
 
-    s3.upload_fileobj(
-        image,
-        settings.AWS_STORAGE_BUCKET_NAME,
-        filename,
-        ExtraArgs={"ContentType": image.content_type},
-    )
+def upload_banner_to_s3(image) -> str:
+    key = upload_file(image, make_key("banners", image.name), image.content_type)
+    return build_public_url(key)
 
-    return f"{settings.CLOUDFRONT_DOMAIN}/{filename}"
\ No newline at end of file
+def upload_banners_to_s3(images: List) -> List[str]:
+    """배너 이미지 여러 장을 병렬 업로드하고 입력 순서대로 URL 을 반환한다."""
+    return [build_public_url(key) for key in upload_files(images, prefix="banners")]
@@ -52,6 +52,8 @@ OCTOMO_API_KEY = os.getenv("OCTOMO_API_KEY", "")
 # Coupang Partners
 COUPANG_ACCESS_KEY = os.getenv("COUPANG_ACCESS_KEY", "")
 COUPANG_SECRET_KEY = os.getenv("COUPANG_SECRET_KEY", "")
+# CoupangRedirectView 검색 결과 캐시 유효 시간 (products.coupang)
+COUPANG_LINK_TTL_HOURS = int(os.getenv("COUPANG_LINK_TTL_HOURS", "24"))
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
@@ -104,6 +106,7 @@ SIMPLE_JWT = {
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "common.profiling.ProfilingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -143,9 +146,64 @@ DATABASES = {
         "PASSWORD": config("DB_PASSWORD"),
         "HOST": config("DB_HOST"),
         "PORT": config("DB_PORT"),
+        # 요청마다 새 커넥션을 맺지 않고 워커 스레드별로 재사용 (0 이면 요청마다 닫음, none 이면 무제한)
+        "CONN_MAX_AGE": config("DB_CONN_MAX_AGE", default=60, cast=lambda v: None if str(v).lower() == "none" else int(v)),
+        # 재사용 전에 커넥션이 살아 있는지 확인 (DB 재시작·유휴 끊김 대비)
+        "CONN_HEALTH_CHECKS": config("DB_CONN_HEALTH_CHECKS", default=True, cast=bool),
     }
 }
 
+# 워커 프로세스별 커넥션 풀 (Django 5.x psycopg 3 네이티브 풀) - psycopg[pool] 설치가 필요하다
+# 풀을 쓰면 CONN_MAX_AGE 는 0 이어야 한다(커넥션 반환은 풀이 맡음)
+DB_POOL = config("DB_POOL", default=False, cast=bool)
+if DB_POOL:
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": config("DB_POOL_MIN_SIZE", default=2, cast=int),
+            "max_size": config("DB_POOL_MAX_SIZE", default=4, cast=int),
+            "timeout": config("DB_POOL_TIMEOUT", default=10, cast=float),
+        }
+    }
+
+# 커넥션 수 점검 (common.checks) - 워커 수 × 워커당 커넥션이 PostgreSQL max_connections 를 넘는지
+WEB_CONCURRENCY = config("WEB_CONCURRENCY", default=1, cast=int)  # gunicorn 워커 프로세스 수
+WEB_THREADS = config("WEB_THREADS", default=1, cast=int)  # 워커당 스레드 수 (gunicorn --threads)
+DB_MAX_CONNECTIONS = config("DB_MAX_CONNECTIONS", default=100, cast=int)
+
+# Cache - REDIS_URL 이 있으면 워커 간 공유 Redis, 없으면 프로세스 로컬 메모리
+REDIS_URL = config("REDIS_URL", default="")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# JWT 인증 사용자 캐시 (auth.authentication) - 무효화가 모든 워커에 닿아야 하므로
+# 공유 캐시(REDIS_URL)가 있을 때만 켠다
+JWT_USER_CACHE = config("JWT_USER_CACHE", default=bool(REDIS_URL), cast=bool)
+
+# 전화번호 인증코드 저장 방식 (auth.verification_store) - db / cache / signed
+# cache·signed 는 DB 쓰기 없이 캐시에 발송 제한을 두므로 REDIS_URL 과 함께 쓴다
+VERIFICATION_CODE_STORE = config("VERIFICATION_CODE_STORE", default="db")
+# False(기본값): 인증 SMS 를 요청 안에서 바로 발송
+# True: SmsOutbox 큐에 넣고 바로 응답 - run_sms_worker 커맨드를 같이 띄워야 발송된다
+SMS_ASYNC_DISPATCH = config("SMS_ASYNC_DISPATCH", default=False, cast=bool)
+# 요청 프로파일링 (common.profiling) - 쿼리 수·DB/렌더 시간을 Server-Timing 헤더와 /admin/home/perf/ 로
+# 운영에서는 낮은 비율로 켠다 (0.0 ~ 1.0)
+PROFILING_ENABLED = config("PROFILING_ENABLED", default=False, cast=bool)
+PROFILING_SAMPLE_RATE = config("PROFILING_SAMPLE_RATE", default=0.05, cast=float)
+# /admin/home/perf/ 를 X-Profiling-Token 헤더로 읽기 위한 토큰 - 비우면 개발 환경 관리자 세션으로만 접근
+PROFILING_TOKEN = config("PROFILING_TOKEN", default="")
+
 # AWS Settings
 AWS_ACCESS_KEY_ID = config("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = config("AWS_SECRET_ACCESS_KEY")
@@ -153,6 +211,15 @@ AWS_STORAGE_BUCKET_NAME = config("AWS_STORAGE_BUCKET_NAME")
 AWS_S3_REGION_NAME = config("AWS_S3_REGION_NAME")
 AWS_S3_BASE_URL = config("AWS_S3_BASE_URL")
 CLOUDFRONT_DOMAIN = config("CLOUDFRONT_DOMAIN")
+# 로컬 S3 호환 서버(MinIO/LocalStack/moto server) 사용 시에만 지정
+AWS_S3_ENDPOINT_URL = config("AWS_S3_ENDPOINT_URL", default=None)
+# 관리자 다중 이미지 병렬 업로드 워커 수 (common.storage)
+S3_UPLOAD_MAX_WORKERS = config("S3_UPLOAD_MAX_WORKERS", default=8, cast=int)
+# 목록 카드용 썸네일 (common.thumbnails) - 긴 변 기준 px, WEBP 또는 JPEG
+THUMBNAIL_MAX_SIZE = config("THUMBNAIL_MAX_SIZE", default=400, cast=int)
+THUMBNAIL_SIZE = (THUMBNAIL_MAX_SIZE, THUMBNAIL_MAX_SIZE)
+THUMBNAIL_FORMAT = config("THUMBNAIL_FORMAT", default="WEBP")
+THUMBNAIL_QUALITY = config("THUMBNAIL_QUALITY", default=80, cast=int)
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -176,7 +243,7 @@ AUTH_USER_MODEL = "users.User"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "auth.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "EXCEPTION_HANDLER": "users.exceptions.custom_exception_handler",
@@ -216,7 +283,7 @@ API_PREFIX = "api/"
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'auth.authentication.CachedJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -1,9 +1,11 @@
+import hmac
 from functools import wraps
 from django.shortcuts import redirect, render
 from django.contrib import messages
 from django.conf import settings
 from django.http import HttpResponseForbidden, JsonResponse
 from django.urls import reverse
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
 import os
 from decouple import config
 
@@ -28,6 +30,29 @@ def admin_auth_required(view_func):
 
     return wrapper
 
+def perf_auth_required(view_func):
+    """프로파일링 집계 인증 데코레이터 - 운영 환경에서도 읽을 수 있도록 토큰 헤더를 허용
+
+    X-Profiling-Token 헤더가 PROFILING_TOKEN 과 같으면 환경과 관계없이 통과한다(세션·CSRF 없이).
+    PROFILING_TOKEN 이 비어 있으면 토큰 접근은 꺼지고, 개발 환경의 관리자 세션만 남는다.
+    """
+    session_view = csrf_protect(admin_auth_required(view_func))
+
+    @csrf_exempt
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        expected = getattr(settings, "PROFILING_TOKEN", "")
+        token = request.headers.get("X-Profiling-Token", "")
+        if expected and token:
+            if hmac.compare_digest(token.encode(), expected.encode()):
+                return view_func(request, *args, **kwargs)
+            return HttpResponseForbidden("프로파일링 토큰이 올바르지 않습니다.")
+
+        # 토큰이 없으면 기존 관리자 세션 인증 (CSRF 검사 포함)
+        return session_view(request, *args, **kwargs)
+
+    return wrapper
+
 def admin_login_view(request):
     """관리자 로그인 - ADMIN_CODE 입력 및 .env 값과 비교"""
     # 운영 환경에서는 접근 차단
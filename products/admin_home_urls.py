@@ -7,7 +7,7 @@
 
 from django.urls import path
 
-from products.admin_auth import admin_auth_required
+from products.admin_auth import admin_auth_required, perf_auth_required
 from products.admin_home_views import (
     banner_list,
     category_tree,
@@ -15,7 +15,10 @@ from products.admin_home_views import (
     ingredient_guide,
     ingredient_list,
     ingredient_other,
+    perf_stats,
+    product_edit_data,
     product_list,
+    product_lookup,
     styleguide,
 )
 
@@ -26,6 +29,18 @@ urlpatterns = [
     path("category/", admin_auth_required(category_tree), name="admin_home_category"),
     # 제품 관리 · 읽기 전용 목록 (추가/수정/삭제는 기존 admin 편집기로 링크)
     path("product/", admin_auth_required(product_list), name="admin_home_product"),
+    # 제품 상세/수정 모달 prefill 데이터(JSON) · 모달을 열 때 불러옴
+    path(
+        "product/<int:product_id>/data/",
+        admin_auth_required(product_edit_data),
+        name="admin_home_product_data",
+    ),
+    # 제품 모달 선택기 type-ahead(JSON) · ingredients / others / categories
+    path(
+        "product/lookup/<str:kind>/",
+        admin_auth_required(product_lookup),
+        name="admin_home_product_lookup",
+    ),
     # 원료 · 기능성 원료(Ingredient) 관리 (목록/추가/삭제)
     path(
         "ingredient/",
@@ -46,6 +61,9 @@ urlpatterns = [
     ),
     # 배너 관리 · 목록/추가/삭제 (상세 이미지는 하위 라우트에서)
     path("banner/", admin_auth_required(banner_list), name="admin_home_banner"),
+    # 요청 프로파일링 집계(JSON) · PROFILING_ENABLED 일 때 샘플된 요청의 뷰별 통계
+    # 운영에서는 X-Profiling-Token 헤더(PROFILING_TOKEN)로 읽는다
+    path("perf/", perf_auth_required(perf_stats), name="admin_home_perf"),
     # 검수 전용 스타일가이드 (admin 로그인 필요)
     path("_styleguide/", admin_auth_required(styleguide), name="admin_home_styleguide"),
 ]
@@ -5,20 +5,25 @@
 """
 
 import json
-from datetime import datetime, time, timedelta
+from urllib.parse import urlencode
+from datetime import timedelta
 from zoneinfo import ZoneInfo
 
 from django.contrib import messages
 from django.db import IntegrityError, transaction
-from django.db.models import Count, Max, Prefetch, ProtectedError
-from django.db.models.functions import TruncDate
+from django.core.paginator import Paginator
+from django.db.models import Count, Max, Prefetch, ProtectedError, Q, prefetch_related_objects
 from django.http import JsonResponse
 from django.shortcuts import redirect, render
 from django.urls import reverse
 from django.utils import timezone
 
+from common.http_client import get_metrics
+from common.metrics import latest_catalog_counts, signup_series
+from common.profiling import get_view_stats, profiling_info, reset_view_stats
 from common.models import Banner, BannerDetail
-from common.utils import upload_banner_to_s3
+from common.storage import build_public_url, generate_presigned_posts, make_key
+from common.utils import upload_banner_to_s3, upload_banners_to_s3
 from products.models import (
     BigCategory,
     CategoryProduct,
@@ -33,8 +38,13 @@ from products.models import (
     ProductRequest,
     SmallCategory,
 )
-from products.utils import upload_images_to_s3
-from users.models import User
+from products.autocomplete import ingredient_index, other_ingredient_index
+from products.utils import (
+    make_product_thumbnails,
+    refresh_cover_images,
+    sync_product_relations,
+    upload_product_images,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -154,26 +164,19 @@ def _signup_chart(days=30):
 
     - KST(Asia/Seoul) 기준으로 날짜를 자른다(DB 는 UTC 저장이므로
       TruncDate 에 tzinfo 를 넘겨 KST 자정 경계로 보정).
+    - 지난 날짜는 DailyMetrics 집계(rollup_daily_metrics)를 읽고 오늘만 실시간으로 센다
+      (common.metrics.signup_series).
     - 일자별 "신규 가입 수"와 그날까지의 "누적 총 회원 수"를 함께 만든다.
+      누적선의 끝(grand_total)은 탈퇴·삭제를 반영한 총 회원 수다(집계 행 + 오늘 가입).
     - 외부 차트 라이브러리 없이 템플릿에서 CSS 바 + 인라인 SVG 로 그릴 수 있도록
       막대 높이(%)와 누적 스파크라인의 SVG 좌표까지 미리 계산해 돌려준다.
     """
     now_kst = timezone.now().astimezone(KST)
     today = now_kst.date()
     start_date = today - timedelta(days=days - 1)
-    # 윈도 시작(=start_date 00:00 KST)을 aware datetime 으로 만들어 필터 경계로 사용
-    start_dt = datetime.combine(start_date, time.min, tzinfo=KST)
-
-    daily = (
-        User.objects.filter(created_at__gte=start_dt)
-        .annotate(day=TruncDate("created_at", tzinfo=KST))
-        .values("day")
-        .annotate(count=Count("id"))
-    )
-    counts_by_day = {row["day"]: row["count"] for row in daily}
 
-    # 윈도 이전까지의 총 회원 수 → 누적선의 시작 기준값
-    base_total = User.objects.filter(created_at__lt=start_dt).count()
+    # 일자별 신규 가입 수 + 윈도 이전까지의 총 회원 수(누적선의 시작 기준값)
+    counts_by_day, base_total = signup_series(start_date, today)
 
     points = []
     cumulative = base_total
@@ -232,38 +235,40 @@ def _home_kpis(chart):
 
     카탈로그/회원 규모를 한눈에 보여준다. 각 타일은 label/value/icon 과
     선택적으로 관리 페이지로 가는 href 를 갖는다(_stat.html 컴포넌트가 렌더).
-    오늘 신규 가입은 이미 계산된 signup_chart(chart) 값을 재사용한다.
+    총 회원·오늘 신규 가입은 이미 계산된 signup_chart(chart) 값을 재사용하고,
+    카탈로그 규모는 DailyMetrics 최근 스냅샷을 쓴다(집계가 없으면 실시간 count).
     """
+    catalog = latest_catalog_counts()
     return [
-        {"label": "총 회원", "value": User.objects.count(), "icon": "👥"},
+        {"label": "총 회원", "value": chart["grand_total"], "icon": "👥"},
         {"label": "오늘 신규 가입", "value": chart["today_new"], "icon": "🌱"},
         {
             "label": "제품",
-            "value": Product.objects.count(),
+            "value": catalog["products"],
             "icon": "📦",
             "href": reverse("admin_home_product"),
         },
         {
             "label": "기능성 원료",
-            "value": Ingredient.objects.count(),
+            "value": catalog["ingredients"],
             "icon": "🧪",
             "href": reverse("admin_home_ingredient"),
         },
         {
             "label": "기타 원료",
-            "value": OtherIngredient.objects.count(),
+            "value": catalog["other_ingredients"],
             "icon": "🧴",
             "href": reverse("admin_home_ingredient_other"),
         },
         {
             "label": "소분류",
-            "value": SmallCategory.objects.count(),
+            "value": catalog["small_categories"],
             "icon": "🗂️",
             "href": reverse("admin_home_category"),
         },
         {
             "label": "배너",
-            "value": Banner.objects.count(),
+            "value": catalog["banners"],
             "icon": "🖼️",
             "href": reverse("admin_home_banner"),
         },
@@ -322,6 +327,24 @@ def styleguide(request):
     return _ah_render(request, "admin_home/_styleguide.html", context)
 
 
+def perf_stats(request):
+    """요청 프로파일링 집계(JSON) — 뷰별 지연/쿼리 히스토그램·중복 쿼리 + 외부 API 호출 지표.
+
+    common.profiling 이 이 요청을 처리한 워커 프로세스에 모아 둔 값이다(pid 로 구분).
+    POST action=reset 이면 이 프로세스의 뷰별 집계를 비운다.
+    """
+    if request.method == "POST" and request.POST.get("action") == "reset":
+        reset_view_stats()
+    return JsonResponse(
+        {
+            "ok": True,
+            **profiling_info(),
+            "views": get_view_stats(),
+            "outbound": get_metrics(),
+        }
+    )
+
+
 # ---------------------------------------------------------------------------
 # 카테고리 관리 — 대/중/소 통합 트리(category_tree) + 공통 헬퍼
 # ---------------------------------------------------------------------------
@@ -554,71 +577,192 @@ def _get_small_category(request):
 # ---------------------------------------------------------------------------
 # 제품 관리 — 목록 + 추가/수정(모달)
 # 추가·수정 모두 admin_home 모달에서 처리한다(기존 admin 편집기로 이동하지 않음).
-# 성분/기타원료/카테고리 연결 생성은 _save_product_relations 로 create·update 공용,
-# update 는 기존 연결을 지운 뒤 다시 만드는 replace-all 방식이다.
+# 성분/기타원료/카테고리 연결은 _save_product_relations 로 create·update 공용,
+# update 는 현재 연결과의 차이만 반영한다(sync_product_relations).
+# 이미지는 브라우저가 presigned POST 로 S3 에 직접 올리고 Django 는 최종 URL 만 기록한다
+# (S3 네트워크 I/O 는 DB 트랜잭션 밖에서만 일어난다).
 # ---------------------------------------------------------------------------
+_PRODUCT_IMAGE_MAX_FILES = 20
+_PRODUCT_IMAGE_MAX_BYTES = 10 * 1024 * 1024  # 파일당 10MB
+
+
+def _presign_product_images(request):
+    """action=presign_images(AJAX) — 제품 이미지 직접 업로드용 presigned POST 를 발급한다.
+
+    filenames[] / content_types[] 를 같은 순서로 받아 파일별 S3 키(products/uuid.ext)를
+    서버에서 정하고, 브라우저가 그대로 쓸 url/fields 와 저장용 final_url 을 돌려준다.
+    content_type 은 image/* 만 허용하고 크기는 정책(content-length-range)으로 제한한다.
+    """
+    names = request.POST.getlist("filenames[]")
+    content_types = request.POST.getlist("content_types[]")
+    if not names or len(names) != len(content_types):
+        return JsonResponse(
+            {"ok": False, "error": "업로드할 파일 정보가 없습니다."}, status=400
+        )
+    if len(names) > _PRODUCT_IMAGE_MAX_FILES:
+        return JsonResponse(
+            {
+                "ok": False,
+                "error": f"이미지는 한 번에 {_PRODUCT_IMAGE_MAX_FILES}장까지 올릴 수 있습니다.",
+            },
+            status=400,
+        )
+    if any(not ct.startswith("image/") for ct in content_types):
+        return JsonResponse(
+            {"ok": False, "error": "이미지 파일만 업로드할 수 있습니다."}, status=400
+        )
+
+    try:
+        uploads = generate_presigned_posts(
+            [
+                {"key": make_key("products", name, ".jpg"), "content_type": ct}
+                for name, ct in zip(names, content_types)
+            ],
+            max_bytes=_PRODUCT_IMAGE_MAX_BYTES,
+        )
+    except Exception as e:
+        return JsonResponse(
+            {"ok": False, "error": f"업로드 URL 생성 실패: {e}"}, status=500
+        )
+    return JsonResponse({"ok": True, "uploads": uploads})
+
+
+def _collect_product_images(request):
+    """create·update 에서 새로 붙일 제품 이미지를 (URL, 썸네일 URL) 목록으로 만든다(트랜잭션 밖에서 호출).
+
+    - image_urls[]: 브라우저가 presigned POST 로 직접 올린 결과. 우리 CDN 의
+      products/ 경로만 받아들인다(임의 외부 URL 저장 방지). 썸네일은 S3 원본으로 만든다.
+    - image_files: JS 없이 폼이 그대로 제출된 경우의 폴백 — 여기서 병렬 업로드한다.
+    썸네일 생성에 실패한 이미지는 썸네일 URL 이 None(카드에서 원본으로 폴백).
+    """
+    prefix = build_public_url("products/")
+    urls = [
+        url.strip()
+        for url in request.POST.getlist("image_urls[]")
+        if url.strip().startswith(prefix)
+    ]
+    images = list(zip(urls, make_product_thumbnails(urls)))
+    images += upload_product_images(request.FILES.getlist("image_files"))
+    return images
+
+
 def _save_product_relations(product, request):
-    """POST 배열로 제품의 성분/기타원료/카테고리 연결을 생성한다(create·update 공용).
+    """POST 배열 값으로 제품의 성분/기타원료/카테고리 연결을 맞춘다(create·update 공용).
 
-    같은 항목을 중복 선택해도 unique/중복이 생기지 않도록 seen 집합으로 거른다.
-    update 에서는 호출 전에 기존 연결(ProductIngredient/ProductOtherIngredient/
-    CategoryProduct)을 모두 지워 replace-all 로 동작시킨다(링크 행 삭제는 PROTECT 무관).
+    products.utils.sync_product_relations 로 현재 연결과의 차이(추가/제거/용량 변경)만
+    반영한다 — 바뀌지 않은 연결 행은 그대로 두고, 없는 id·중복 선택은 걸러진다.
     """
-    # 성분 + 용량 → ProductIngredient
-    seen_ing = set()
-    for ingredient_id, amount in zip(
-        request.POST.getlist("ingredient_ids[]"),
-        request.POST.getlist("amounts[]"),
-    ):
-        ingredient_id = ingredient_id.strip()
-        amount = amount.strip()
-        if not (ingredient_id and amount) or ingredient_id in seen_ing:
-            continue
-        try:
-            ingredient = Ingredient.objects.get(id=ingredient_id)
-        except (Ingredient.DoesNotExist, ValueError):
-            continue
-        seen_ing.add(ingredient_id)
-        ProductIngredient.objects.create(
-            product=product, ingredient=ingredient, amount=amount
+    return sync_product_relations(
+        product,
+        zip(
+            request.POST.getlist("ingredient_ids[]"),
+            request.POST.getlist("amounts[]"),
+        ),
+        request.POST.getlist("other_ingredient_ids[]"),
+        request.POST.getlist("category_ids[]"),
+    )
+
+
+_PRODUCT_PAGE_SIZE = 40
+_LOOKUP_LIMIT = 20
+
+
+def _small_category_label(sc):
+    """소분류 표시명 — "대분류 > 중분류 > 소분류"."""
+    return (
+        f"{sc.middle_category.big_category.category} > "
+        f"{sc.middle_category.category} > {sc.category}"
+    )
+
+
+def product_edit_data(request, product_id):
+    """GET — 제품 1개의 상세/수정 모달 prefill 데이터(JSON). 모달을 열 때 불러온다.
+
+    선택기(type-ahead)에 바로 표시할 수 있도록 연결 항목은 id 와 이름(label)을 함께 준다.
+    """
+    try:
+        product = Product.objects.prefetch_related(
+            "images",
+            "ingredients__ingredient",
+            "product_other_ingredients__other_ingredient",
+            "category_products__category__middle_category__big_category",
+        ).get(id=product_id)
+    except Product.DoesNotExist:
+        return JsonResponse(
+            {"ok": False, "error": "제품을 찾을 수 없습니다."}, status=404
         )
 
-    # 기타 원료 → ProductOtherIngredient
-    seen_oi = set()
-    for oi_id in request.POST.getlist("other_ingredient_ids[]"):
-        oi_id = oi_id.strip()
-        if not oi_id or oi_id in seen_oi:
-            continue
-        try:
-            oi = OtherIngredient.objects.get(id=oi_id)
-        except (OtherIngredient.DoesNotExist, ValueError):
-            continue
-        seen_oi.add(oi_id)
-        ProductOtherIngredient.objects.create(product=product, other_ingredient=oi)
-
-    # 소분류 카테고리 → CategoryProduct
-    seen_cat = set()
-    for category_id in request.POST.getlist("category_ids[]"):
-        category_id = category_id.strip()
-        if not category_id or category_id in seen_cat:
-            continue
-        try:
-            category = SmallCategory.objects.get(id=category_id)
-        except (SmallCategory.DoesNotExist, ValueError):
-            continue
-        seen_cat.add(category_id)
-        CategoryProduct.objects.create(product=product, category=category)
+    return JsonResponse(
+        {
+            "ok": True,
+            "product": {
+                "id": product.id,
+                "name": product.name,
+                "company": product.company,
+                "productType": product.productType,
+                "coupang": product.coupang or "",
+                "images": [{"id": img.id, "url": img.url} for img in product.images.all()],
+                "ingredients": [
+                    {"id": pi.ingredient_id, "label": pi.ingredient.name, "amount": pi.amount}
+                    for pi in product.ingredients.all()
+                ],
+                "others": [
+                    {"id": poi.other_ingredient_id, "label": poi.other_ingredient.name}
+                    for poi in product.product_other_ingredients.all()
+                ],
+                "categories": [
+                    {"id": cp.category_id, "label": _small_category_label(cp.category)}
+                    for cp in product.category_products.all()
+                ],
+            },
+        }
+    )
+
+
+def product_lookup(request, kind):
+    """GET ?q= — 제품 모달의 성분/기타 원료/소분류 선택기 type-ahead(JSON).
+
+    kind: ingredients | others | categories. 최대 _LOOKUP_LIMIT 개(q 가 비면 앞에서부터).
+    성분/기타 원료는 메모리 자동완성 인덱스(products.autocomplete)에서 접두 일치 → 중간 일치
+    순으로, 소분류는 DB 에서 이름에 q 가 들어간 항목을 가나다순으로 찾는다.
+    """
+    q = request.GET.get("q", "").strip()
+    if kind == "ingredients":
+        results = ingredient_index.search(q, _LOOKUP_LIMIT)
+    elif kind == "others":
+        results = other_ingredient_index.search(q, _LOOKUP_LIMIT)
+    elif kind == "categories":
+        qs = SmallCategory.objects.select_related("middle_category__big_category").order_by(
+            "middle_category__big_category__category",
+            "middle_category__category",
+            "category",
+        )
+        if q:
+            qs = qs.filter(
+                Q(category__icontains=q)
+                | Q(middle_category__category__icontains=q)
+                | Q(middle_category__big_category__category__icontains=q)
+            )
+        results = [{"id": sc.id, "label": _small_category_label(sc)} for sc in qs[:_LOOKUP_LIMIT]]
+    else:
+        return JsonResponse({"ok": False, "error": "알 수 없는 항목입니다."}, status=404)
+    return JsonResponse({"ok": True, "results": results})
 
 
 def product_list(request):
     """제품 리스트 + 제품 추가(create)/수정(update) — 모두 모달에서 처리.
 
-    - action=create: Product 기본필드 + 이미지 업로드 + 성분/기타원료/카테고리 연결 생성.
-    - action=update: 기본필드·이미지(선택 삭제/추가) 갱신 + 연결 replace-all.
+    - action=presign_images: 이미지 직접 업로드용 presigned POST 발급(AJAX, JSON 응답).
+    - action=create: Product 기본필드 + 이미지 URL 기록 + 성분/기타원료/카테고리 연결 생성.
+    - action=update: 기본필드·이미지(선택 삭제/추가) 갱신 + 연결 차이 반영.
     두 경로 모두 연결 생성은 _save_product_relations 공용 헬퍼를 쓴다.
-    목록에는 모달 렌더용 선택지(ingredients/other_ingredients/small_categories)와
-    행별 상세/수정 prefill 데이터(product.edit_data, json_script 용)를 함께 내려준다.
+    목록은 서버에서 검색(q: 이름/브랜드)·카테고리(category: 소분류 id) 필터 후
+    _PRODUCT_PAGE_SIZE 개씩 페이지로 나눠 그 페이지 제품의 관계만 prefetch 한다.
+    모달 prefill 은 product_edit_data, 선택기 옵션은 product_lookup 이 필요할 때 JSON 으로 준다.
     """
+    if request.method == "POST" and request.POST.get("action") == "presign_images":
+        return _presign_product_images(request)
+
     if request.method == "POST" and request.POST.get("action") == "create":
         name = request.POST.get("name", "").strip()
         company = request.POST.get("company", "").strip()
@@ -630,6 +774,7 @@ def product_list(request):
             return redirect("admin_home_product")
 
         try:
+            images = _collect_product_images(request)
             with transaction.atomic():
                 product = Product.objects.create(
                     name=name,
@@ -638,11 +783,14 @@ def product_list(request):
                     coupang=coupang,
                 )
 
-                image_files = request.FILES.getlist("image_files")
-                if image_files:
+                if images:
                     ProductImage.objects.bulk_create(
-                        upload_images_to_s3(product, image_files)
+                        [
+                            ProductImage(product=product, url=url, thumbnail_url=thumb)
+                            for url, thumb in images
+                        ]
                     )
+                    refresh_cover_images([product.id])
 
                 _save_product_relations(product, request)
 
@@ -652,7 +800,7 @@ def product_list(request):
         return redirect("admin_home_product")
 
     if request.method == "POST" and request.POST.get("action") == "update":
-        # 상세/수정 모달 저장 — 기본필드 + 이미지(선택 삭제/추가) + 연결 replace-all.
+        # 상세/수정 모달 저장 — 기본필드 + 이미지(선택 삭제/추가) + 연결 차이 반영.
         try:
             product = Product.objects.get(id=request.POST.get("id", ""))
         except (Product.DoesNotExist, ValueError):
@@ -669,6 +817,7 @@ def product_list(request):
             return redirect("admin_home_product")
 
         try:
+            new_images = _collect_product_images(request)
             with transaction.atomic():
                 product.name = name
                 product.company = company
@@ -676,7 +825,7 @@ def product_list(request):
                 product.coupang = coupang
                 product.save()
 
-                # 이미지 — 체크한 기존 이미지 삭제 + 새 이미지 업로드/추가
+                # 이미지 — 체크한 기존 이미지 삭제 + 업로드된 새 이미지 URL 추가
                 delete_ids = [
                     i for i in request.POST.getlist("delete_image_ids[]") if i.strip()
                 ]
@@ -684,16 +833,17 @@ def product_list(request):
                     ProductImage.objects.filter(
                         id__in=delete_ids, product=product
                     ).delete()
-                new_images = request.FILES.getlist("image_files")
                 if new_images:
                     ProductImage.objects.bulk_create(
-                        upload_images_to_s3(product, new_images)
+                        [
+                            ProductImage(product=product, url=url, thumbnail_url=thumb)
+                            for url, thumb in new_images
+                        ]
                     )
+                if delete_ids or new_images:
+                    refresh_cover_images([product.id])
 
-                # 성분/기타원료/카테고리 연결 — 기존을 지우고 폼 값으로 다시 생성(replace-all)
-                ProductIngredient.objects.filter(product=product).delete()
-                ProductOtherIngredient.objects.filter(product=product).delete()
-                CategoryProduct.objects.filter(product=product).delete()
+                # 성분/기타원료/카테고리 연결 — 폼 값과의 차이만 반영
                 _save_product_relations(product, request)
 
             messages.success(request, f'"{name}" 제품이 수정되었습니다.')
@@ -722,61 +872,50 @@ def product_list(request):
             messages.error(request, f"삭제 중 오류가 발생했습니다: {str(e)}")
         return redirect("admin_home_product")
 
-    products = Product.objects.annotate(
-        image_count=Count("images", distinct=True),
-        ingredient_count=Count("ingredients", distinct=True),
-        category_count=Count("category_products", distinct=True),
-    ).prefetch_related(
-        "images",
+    q = request.GET.get("q", "").strip()
+    category_id = request.GET.get("category", "").strip()
+
+    products = Product.objects.order_by("-id")
+    if q:
+        products = products.filter(Q(name__icontains=q) | Q(company__icontains=q))
+    selected_category = None
+    if category_id.isdigit():
+        selected_category = (
+            SmallCategory.objects.select_related("middle_category__big_category")
+            .filter(id=category_id)
+            .first()
+        )
+        products = products.filter(category_products__category_id=category_id)
+
+    page = Paginator(products, _PRODUCT_PAGE_SIZE).get_page(request.GET.get("page"))
+    # 카드에 표시할 관계는 현재 페이지 제품만 prefetch
+    page_products = list(page.object_list)
+    prefetch_related_objects(
+        page_products,
         "ingredients__ingredient",
-        "category_products__category__middle_category__big_category",
+        "category_products__category",
         "product_other_ingredients__other_ingredient",
-    ).order_by("-id")
-
-    # 상세/수정 모달 prefill 용 제품별 데이터 — 행마다 json_script 로 심어 JS 가 읽는다.
-    # (prefetch 된 관계만 사용하므로 추가 쿼리 없음)
-    products = list(products)
-    for p in products:
-        p.data_id = f"product-data-{p.id}"
-        p.edit_data = {
-            "id": p.id,
-            "name": p.name,
-            "company": p.company,
-            "productType": p.productType,
-            "coupang": p.coupang or "",
-            "images": [{"id": img.id, "url": img.url} for img in p.images.all()],
-            "ingredients": [
-                {"id": pi.ingredient_id, "amount": pi.amount}
-                for pi in p.ingredients.all()
-            ],
-            "others": [
-                {"id": poi.other_ingredient_id}
-                for poi in p.product_other_ingredients.all()
-            ],
-            "categories": [{"id": cp.category_id} for cp in p.category_products.all()],
-        }
-
-    # 모달 추가/수정 폼 렌더용 선택지 — 드롭다운 옵션은 가나다순 정렬(찾기 쉽게)
-    ingredients = Ingredient.objects.all().order_by("name")
-    other_ingredients = OtherIngredient.objects.all().order_by("name")
-    small_categories = (
-        SmallCategory.objects.select_related("middle_category__big_category")
-        .all()
-        .order_by(
-            "middle_category__big_category__category",
-            "middle_category__category",
-            "category",
-        )
     )
 
+    # 페이지 링크에 붙일 현재 필터 쿼리스트링
+    filters = {}
+    if q:
+        filters["q"] = q
+    if selected_category:
+        filters["category"] = selected_category.id
+
     return _ah_render(
         request,
         "admin_home/product_list.html",
         {
-            "products": products,
-            "ingredients": ingredients,
-            "other_ingredients": other_ingredients,
-            "small_categories": small_categories,
+            "products": page_products,
+            "page_obj": page,
+            "q": q,
+            "selected_category": selected_category,
+            "selected_category_label": (
+                _small_category_label(selected_category) if selected_category else ""
+            ),
+            "filter_query": urlencode(filters),
         },
     )
 
@@ -836,7 +975,8 @@ def _reorder_banner_details(banner_id, id_list):
 def banner_list(request):
     """배너 관리 — 활성/비활성 탭 목록 + 추가/수정/삭제/순서변경/토글.
 
-    이미지는 common.utils.upload_banner_to_s3 로 S3 업로드 후 URL 을 저장한다.
+    이미지는 common.utils.upload_banner_to_s3 로 S3 업로드 후 URL 을 저장한다
+    (상세 이미지 여러 장은 upload_banners_to_s3 로 병렬 업로드).
     - create: 썸네일(image) + 선택 상세 이미지(detail_image). order 는 항상 마지막(max+1).
     - update: 썸네일 교체(선택).
     - toggle_active / reorder: AJAX(X-Requested-With)면 JSON 으로 응답해 화면을 유지한다.
@@ -856,7 +996,7 @@ def banner_list(request):
             # 상세 이미지는 여러 장 가능. 폼에서 드래그로 정한 순서대로 전송되며,
             # 그 순서대로 BannerDetail.order 를 1..N 으로 부여한다.
             detail_images = [f for f in request.FILES.getlist("detail_images") if f]
-            detail_urls = [upload_banner_to_s3(f) for f in detail_images]
+            detail_urls = upload_banners_to_s3(detail_images)
             try:
                 with transaction.atomic():
                     banner = Banner.objects.create(
@@ -938,7 +1078,7 @@ def banner_list(request):
                 return redirect("admin_home_banner")
             existing = BannerDetail.objects.filter(banner=banner)
             next_detail_order = (existing.aggregate(m=Max("order"))["m"] or 0) + 1
-            detail_urls = [upload_banner_to_s3(f) for f in images]
+            detail_urls = upload_banners_to_s3(images)
             try:
                 with transaction.atomic():
                     for offset, detail_image_url in enumerate(detail_urls):
@@ -1056,6 +1196,8 @@ def ingredient_list(request):
                 messages.error(request, "성분 이름을 입력해주세요.")
             elif length_error:
                 messages.error(request, length_error)
+            elif Ingredient.objects.filter(name=name).exists():
+                messages.error(request, f'"{name}" 성분이 이미 존재합니다.')
             else:
                 Ingredient.objects.create(
                     name=name,
@@ -1082,6 +1224,9 @@ def ingredient_list(request):
             if length_error:
                 messages.error(request, length_error)
                 return redirect("admin_home_ingredient")
+            if Ingredient.objects.filter(name=name).exclude(id=ingredient.id).exists():
+                messages.error(request, f'"{name}" 성분이 이미 존재합니다.')
+                return redirect("admin_home_ingredient")
             # 기본 필드 + 효과·부작용(이 원료 모달에서 편집).
             # 핵심 포인트·출처(IngredientGuide)는 성분 가이드 전용 페이지에서만 다뤄
             # 여기서 건드리지 않는다(덮어쓰기 방지).
@@ -6,7 +6,7 @@ from django.db.models import Count
 from products.models import Product, BigCategory, MiddleCategory, SmallCategory, ProductIngredient, ProductImage, \
     Ingredient, \
     CategoryProduct, OtherIngredient, ProductOtherIngredient, ProductRequest, IngredientGuide
-from products.utils import upload_images_to_s3
+from products.utils import refresh_cover_images, sync_product_relations, upload_images_to_s3
 from django.conf import settings
 import json
 
@@ -285,52 +285,16 @@ def product_form(request):
                 if image_files:
                     uploaded_images = upload_images_to_s3(product, image_files)
                     ProductImage.objects.bulk_create(uploaded_images)
+                    refresh_cover_images([product.id])
                 
-                # 성분들 추가
-                ingredient_ids = request.POST.getlist('ingredient_ids[]')
-                amounts = request.POST.getlist('amounts[]')
-                for ingredient_id, amount in zip(ingredient_ids, amounts):
-                    ingredient_id = ingredient_id.strip()
-                    amount = amount.strip()
-                    if ingredient_id and amount:
-                        try:
-                            ingredient = Ingredient.objects.get(id=ingredient_id)
-                            ProductIngredient.objects.create(
-                                product=product,
-                                ingredient=ingredient,
-                                amount=amount
-                            )
-                        except Ingredient.DoesNotExist:
-                            pass
-
-                # 기타 원료들 추가
-                other_ingredient_ids = request.POST.getlist('other_ingredient_ids[]')
-                for oi_id in other_ingredient_ids:
-                    oi_id = oi_id.strip()
-                    if oi_id:
-                        try:
-                            oi = OtherIngredient.objects.get(id=oi_id)
-                            ProductOtherIngredient.objects.create(
-                                product=product,
-                                other_ingredient=oi
-                            )
-                        except OtherIngredient.DoesNotExist:
-                            pass
-                
-                # 카테고리들 추가
-                category_ids = request.POST.getlist('category_ids[]')
-                for category_id in category_ids:
-                    category_id = category_id.strip()
-                    if category_id:
-                        try:
-                            category = SmallCategory.objects.get(id=category_id)
-                            CategoryProduct.objects.create(
-                                product=product,
-                                category=category
-                            )
-                        except SmallCategory.DoesNotExist:
-                            pass
-                
+                # 성분/기타 원료/카테고리 추가 (없는 id 는 무시)
+                sync_product_relations(
+                    product,
+                    ingredients=zip(request.POST.getlist('ingredient_ids[]'), request.POST.getlist('amounts[]')),
+                    other_ingredient_ids=request.POST.getlist('other_ingredient_ids[]'),
+                    category_ids=request.POST.getlist('category_ids[]'),
+                )
+
                 messages.success(request, f'"{name}" 제품이 성공적으로 추가되었습니다.')
                 return redirect('admin_product_form')
             except ValueError:
@@ -338,14 +302,12 @@ def product_form(request):
             except Exception as e:
                 messages.error(request, f'오류가 발생했습니다: {str(e)}')
     
-    # 기존 데이터 가져오기
-    ingredients = Ingredient.objects.all().order_by('id')
+    # 기존 데이터 가져오기 (성분/기타 원료 선택지는 자동완성 API 로 받는다)
     small_categories = SmallCategory.objects.select_related('middle_category__big_category').all().order_by(
         'middle_category__big_category__id',
         'middle_category__id',
         'id'
     )
-    other_ingredients = OtherIngredient.objects.all().order_by("name")
 
     # 제품 정보를 더 자세히 가져오기 (이미지, 성분, 카테고리 개수 포함)
     products = Product.objects.annotate(
@@ -360,8 +322,6 @@ def product_form(request):
     ).order_by('-id')  # 전체 제품 표시 (ID 내림차순)
 
     return render(request, 'products/product_form.html', {
-        'ingredients': ingredients,
-        "other_ingredients": other_ingredients,
         'small_categories': small_categories,
         'products': products
     })
@@ -414,6 +374,9 @@ def ingredient_form(request):
         elif length_error:
             messages.error(request, length_error)
 
+        elif Ingredient.objects.filter(name=name).exists():
+            messages.error(request, f'"{name}" 성분이 이미 존재합니다.')
+
         else:
             Ingredient.objects.create(
                 name=name,
@@ -448,7 +411,12 @@ def ingredient_edit(request, ingredient_id):
             messages.error(request, length_error)
             return redirect('admin_ingredient_edit', ingredient_id=ingredient_id)
 
-        ingredient.name = request.POST.get('name', '').strip()
+        name = request.POST.get('name', '').strip()
+        if Ingredient.objects.filter(name=name).exclude(id=ingredient.id).exists():
+            messages.error(request, f'"{name}" 성분이 이미 존재합니다.')
+            return redirect('admin_ingredient_edit', ingredient_id=ingredient_id)
+
+        ingredient.name = name
         ingredient.mainIngredient = request.POST.get('mainIngredient', '').strip()
         ingredient.minRecommended = min_recommended
         ingredient.maxRecommended = max_recommended
@@ -543,6 +511,38 @@ def ingredient_delete(request, ingredient_id):
         'ingredient': ingredient
     })
 
+def _edited_links(current_rows, delete_ids, edited_rows, new_rows):
+    """
+    제품 수정 폼의 연결(성분/기타 원료/카테고리) 입력을 최종 값 목록으로 합친다.
+
+    Args:
+        current_rows: 현재 연결 행 (연결 id, 값...) 목록
+        delete_ids: 삭제할 연결 id 목록
+        edited_rows: 수정된 기존 행 (연결 id, 값...) 목록 — 빈 값이 있으면 기존 값 유지
+        new_rows: 새로 추가할 (값...) 목록 — 빈 값이 있으면 무시
+
+    Returns:
+        연결 id 를 뺀 값 튜플 목록 (기존 행 순서 + 새 행)
+    """
+    deleted = {str(i).strip() for i in delete_ids}
+    edited = {}
+    for row in edited_rows:
+        row = tuple(str(v).strip() for v in row)
+        if all(row):
+            edited[row[0]] = row[1:]
+    links = []
+    for row in current_rows:
+        link_id = str(row[0])
+        if link_id in deleted:
+            continue
+        links.append(edited.get(link_id, row[1:]))
+    for row in new_rows:
+        row = tuple(str(v).strip() for v in row)
+        if all(row):
+            links.append(row)
+    return links
+
+
 # Product 수정 화면 (템플릿 기반)
 @transaction.atomic
 def product_edit(request, product_id):
@@ -601,140 +601,60 @@ def product_edit(request, product_id):
         if new_image_files:
             uploaded_images = upload_images_to_s3(product, new_image_files)
             ProductImage.objects.bulk_create(uploaded_images)
-
-        # ---------- 성분 삭제 ----------
-        delete_ingredient_ids = [
-            i for i in request.POST.getlist('delete_ingredient_ids[]') if i.strip()
-        ]
-        if delete_ingredient_ids:
-            ProductIngredient.objects.filter(id__in=delete_ingredient_ids, product=product).delete()
-
-        # ---------- 기존 성분 수정 ----------
-        existing_pi_ids = request.POST.getlist('existing_product_ingredient_ids[]')
-        existing_ing_ids = request.POST.getlist('existing_ingredient_ids[]')
-        existing_amounts = request.POST.getlist('existing_amounts[]')
-
-        for pi_id, ing_id, amount in zip(existing_pi_ids, existing_ing_ids, existing_amounts):
-            pi_id = pi_id.strip()
-            ing_id = ing_id.strip()
-            amount = amount.strip()
-
-            if not (pi_id and ing_id and amount):
-                continue
-
-            try:
-                pi = ProductIngredient.objects.get(id=pi_id, product=product)
-                ingredient = Ingredient.objects.get(id=ing_id)
-                pi.ingredient = ingredient
-                pi.amount = amount
-                pi.save()
-            except (ProductIngredient.DoesNotExist, Ingredient.DoesNotExist):
-                pass
-
-        # ---------- 새 성분 추가 ----------
-        new_ing_ids = request.POST.getlist('new_ingredient_ids[]')
-        new_amounts = request.POST.getlist('new_amounts[]')
-
-        for ing_id, amount in zip(new_ing_ids, new_amounts):
-            ing_id = ing_id.strip()
-            amount = amount.strip()
-
-            if not (ing_id and amount):
-                continue
-
-            try:
-                ingredient = Ingredient.objects.get(id=ing_id)
-                ProductIngredient.objects.create(
-                    product=product,
-                    ingredient=ingredient,
-                    amount=amount
-                )
-            except Ingredient.DoesNotExist:
-                pass
-
-        # ---------- 기존 카테고리 수정 ----------
-        existing_cp_ids = request.POST.getlist('existing_category_product_ids[]')
-        existing_cat_ids = request.POST.getlist('existing_category_ids[]')
-
-        for cp_id, cat_id in zip(existing_cp_ids, existing_cat_ids):
-            cp_id = cp_id.strip()
-            cat_id = cat_id.strip()
-
-            if not (cp_id and cat_id):
-                continue
-
-            try:
-                cp = CategoryProduct.objects.get(id=cp_id, product=product)
-                category = SmallCategory.objects.get(id=cat_id)
-                cp.category = category
-                cp.save()
-            except (CategoryProduct.DoesNotExist, SmallCategory.DoesNotExist):
-                pass
-
-        # ---------- 기존 카테고리 삭제 ----------
-        delete_category_ids = [
-            i for i in request.POST.getlist('delete_category_ids[]') if i.strip()
-        ]
-        if delete_category_ids:
-            CategoryProduct.objects.filter(id__in=delete_category_ids, product=product).delete()
-
-        # ---------- 새 카테고리 추가 ----------
-        new_category_ids = request.POST.getlist('new_category_ids[]')
-
-        for cat_id in new_category_ids:
-            cat_id = cat_id.strip()
-            if not cat_id:
-                continue
-
-            try:
-                category = SmallCategory.objects.get(id=cat_id)
-                CategoryProduct.objects.get_or_create(
-                    product=product,
-                    category=category
+        if delete_image_ids or new_image_files:
+            refresh_cover_images([product.id])
+
+        # ---------- 성분/기타 원료/카테고리 ----------
+        # 폼의 삭제·수정·추가 목록을 최종 연결 목록으로 합친 뒤 차이만 반영한다
+        sync_product_relations(
+            product,
+            ingredients=_edited_links(
+                ProductIngredient.objects.filter(product=product).values_list('id', 'ingredient_id', 'amount'),
+                request.POST.getlist('delete_ingredient_ids[]'),
+                zip(
+                    request.POST.getlist('existing_product_ingredient_ids[]'),
+                    request.POST.getlist('existing_ingredient_ids[]'),
+                    request.POST.getlist('existing_amounts[]'),
+                ),
+                zip(request.POST.getlist('new_ingredient_ids[]'), request.POST.getlist('new_amounts[]')),
+            ),
+            other_ingredient_ids=[
+                oi_id for oi_id, in _edited_links(
+                    ProductOtherIngredient.objects.filter(product=product).values_list('id', 'other_ingredient_id'),
+                    request.POST.getlist('delete_other_ingredient_ids[]'),
+                    zip(
+                        request.POST.getlist('existing_product_other_ingredient_ids[]'),
+                        request.POST.getlist('existing_other_ingredient_ids[]'),
+                    ),
+                    ((oi_id,) for oi_id in request.POST.getlist('new_other_ingredient_ids[]')),
                 )
-            except SmallCategory.DoesNotExist:
-                pass
-
-        # 기존 기타 원료 삭제
-        delete_ids = request.POST.getlist("delete_other_ingredient_ids[]")
-        if delete_ids:
-            ProductOtherIngredient.objects.filter(id__in=delete_ids).delete()
-
-        # 기존 기타 원료 수정
-        existing_ids = request.POST.getlist("existing_product_other_ingredient_ids[]")
-        existing_oi_ids = request.POST.getlist("existing_other_ingredient_ids[]")
-
-        for poi_id, oi_id in zip(existing_ids, existing_oi_ids):
-            if oi_id:
-                ProductOtherIngredient.objects.filter(id=poi_id).update(
-                    other_ingredient_id=oi_id
-                )
-
-        # 신규 기타 원료 추가
-        new_oi_ids = request.POST.getlist("new_other_ingredient_ids[]")
-        for oi_id in new_oi_ids:
-            if oi_id:
-                ProductOtherIngredient.objects.get_or_create(
-                    product=product,
-                    other_ingredient_id=oi_id
+            ],
+            category_ids=[
+                cat_id for cat_id, in _edited_links(
+                    CategoryProduct.objects.filter(product=product).values_list('id', 'category_id'),
+                    request.POST.getlist('delete_category_ids[]'),
+                    zip(
+                        request.POST.getlist('existing_category_product_ids[]'),
+                        request.POST.getlist('existing_category_ids[]'),
+                    ),
+                    ((cat_id,) for cat_id in request.POST.getlist('new_category_ids[]')),
                 )
+            ],
+        )
 
         messages.success(request, f'"{product.name}" 제품이 성공적으로 수정되었습니다.')
         return redirect('admin_product_form')
 
     # ================= GET =================
-    ingredients = Ingredient.objects.all().order_by('id')
+    # 성분/기타 원료 선택지는 자동완성 API 로 받는다
     small_categories = SmallCategory.objects.select_related('middle_category__big_category').all().order_by(
         'middle_category__big_category__id',
         'middle_category__id',
         'id'
     )
-    other_ingredients = OtherIngredient.objects.all().order_by("name")
 
     return render(request, 'products/product_edit.html', {
         'product': product,
-        'ingredients': ingredients,
-        'other_ingredients': other_ingredients,
         'small_categories': small_categories,
         'action': request.GET.get('action')
     })
@@ -885,11 +805,9 @@ def ingredient_guide_form(request):
         messages.success(request, f'"{ingredient.name}" 가이드가 생성되었습니다.')
         return redirect("admin_ingredient_guide_form")
 
-    ingredients = Ingredient.objects.all().order_by("id")
     guides = IngredientGuide.objects.select_related("ingredient").order_by("-id")
 
     return render(request, "products/ingredient_guide_form.html", {
-        "ingredients": ingredients,
         "guides": guides
     })
 
@@ -953,12 +871,19 @@ import csv
 import io
 import re
 import time
-import requests
 import xml.etree.ElementTree as ET
 
 from rapidfuzz import process, fuzz
 from django.http import HttpResponse
 
+from common import http_client
+from products.source_sync import (
+    GARCINIA_SOURCE,
+    SourceChanges,
+    candidates_version,
+    save_source_state,
+)
+
 
 # ------------------------------------------------------------------ #
 #  설정값
@@ -1140,9 +1065,11 @@ def _parse_effect_for_ingredient(effect_text: str, ingredient_name: str) -> list
     return result
 
 
-def _fetch_garcinia_data():
+def _fetch_garcinia_data(full=False):
+    """가르시니아 제품 수집. 지난 DB 저장 이후 원본이 바뀐 제품만 파싱한다(full 이면 전부)."""
     db_names = list(Ingredient.objects.values_list("name", flat=True))
     candidates = list(set(db_names + STANDARD_INGREDIENTS))
+    changes = SourceChanges(GARCINIA_SOURCE, full=full, version=candidates_version(candidates))
     normalized_map = {_normalize(name): name for name in candidates}
 
     products, ingredients, pi_rows, unmatched = [], {}, [], []
@@ -1151,7 +1078,7 @@ def _fetch_garcinia_data():
 
     while True:
         end = start + BATCH_SIZE - 1
-        resp = requests.get(f"{BASE_URL}/{start}/{end}", timeout=30)
+        resp = http_client.get(f"{BASE_URL}/{start}/{end}", service="foodsafety", timeout=30)
         root = ET.fromstring(resp.content)
 
         if total is None:
@@ -1176,6 +1103,10 @@ def _fetch_garcinia_data():
                 continue
             seen_products.add(name)
 
+            payload = {"company": company, "effect": effect, "spec": spec, "indiv": indiv}
+            if not changes.check(name, payload):
+                continue
+
             parsed = _parse_spec(spec, normalized_map) if spec else []
             category_ids = sorted(set(
                 cat_id for item in parsed
@@ -1211,12 +1142,15 @@ def _fetch_garcinia_data():
             break
         time.sleep(1)
 
+    changes.finish()
     return {
         "products": products,
         "ingredients": ingredients,
         "pi_rows": pi_rows,
         "unmatched": unmatched,
         "total": len(products),
+        "delta": changes.delta,
+        "source_state": changes.state(),
     }
 
 
@@ -1339,7 +1273,7 @@ def import_csv_view(request):
     # ── 1. API 수집 → ImportJob 생성 ─────────────────────────────── #
     if request.method == "POST" and request.POST.get("action") == "fetch":
         try:
-            data = _fetch_garcinia_data()
+            data = _fetch_garcinia_data(full=request.POST.get("full") == "1")
 
             # 기존 job 있으면 삭제
             old_job = _get_job(request)
@@ -1353,12 +1287,14 @@ def import_csv_view(request):
                 pi_rows=data["pi_rows"],
                 unmatched=data["unmatched"],
                 total=data["total"],
+                source_state=data["source_state"],
             )
             request.session["import_job_id"] = job.id  # ID만 세션에 저장
 
             messages.success(
                 request,
-                f"수집 완료 — 제품 {data['total']}개 | "
+                f"수집 완료 — 원본 {data['delta']} | "
+                f"제품 {data['total']}개 | "
                 f"성분 {len(data['ingredients'])}종 | "
                 f"매칭 실패 {len(data['unmatched'])}개"
             )
@@ -1460,6 +1396,9 @@ def import_csv_view(request):
             else:
                 ing_updated += 1
 
+        # 원본 해시는 제품과 성분 연결이 모두 들어간 제품만 저장한다
+        imported, incomplete = set(), set()
+
         # Products + CategoryProduct — name 기준 update_or_create
         for row in job.products:
             product, created = Product.objects.update_or_create(
@@ -1473,6 +1412,7 @@ def import_csv_view(request):
                 prod_created += 1
             else:
                 prod_updated += 1
+            imported.add(row["name"])
 
             for cat_id in [
                 int(c) for c in row.get("category_ids", "1").split(";")
@@ -1490,6 +1430,8 @@ def import_csv_view(request):
 
         # ProductIngredients — product+ingredient 기준 update_or_create
         for row in job.pi_rows:
+            if row.get("method") == "unmatched":
+                incomplete.add(row["product_name"])
             try:
                 product = Product.objects.get(name=row["product_name"])
                 ingredient = Ingredient.objects.get(name=row["ingredient_name"])
@@ -1504,6 +1446,10 @@ def import_csv_view(request):
                     pi_updated += 1
             except (Product.DoesNotExist, Ingredient.DoesNotExist):
                 pi_fail += 1
+                incomplete.add(row["product_name"])
+
+        # 반영한 원본 해시 저장 — 다음 수집부터 바뀐 제품만 가져온다
+        save_source_state(job.source_state, imported=imported - incomplete)
 
         # Job 완료 처리
         job.status = "done"
@@ -1,18 +1,24 @@
-import requests
+import hashlib
+import json
+
 from django.conf import settings
+from common import http_client
+from products.autocomplete import ingredient_index
 from products.models import Ingredient
+from products.source_sync import SourceChanges
 from products.api.ingredients_parser import clean_name, clean_amount, clean_text
 
 API_KEY = settings.FOOD_API_KEY
 SERVICE_ID = "I-0050"
+SOURCE = f"foodsafety:{SERVICE_ID}"
 
 def fetch_page(start_idx, end_idx):
     url = f"http://openapi.foodsafetykorea.go.kr/api/{API_KEY}/{SERVICE_ID}/json/{start_idx}/{end_idx}"
-    response = requests.get(url)
+    response = http_client.get(url, service="foodsafety", timeout=30)
 
     if response.status_code != 200:
         print("⚠️ API 오류 상태코드:", response.status_code)
-        return []
+        return None  # 끝(빈 목록)과 구분 - 사라진 레코드 집계를 하지 않는다
 
     data = response.json()
     body = data.get(SERVICE_ID)
@@ -21,11 +27,91 @@ def fetch_page(start_idx, end_idx):
 
     return body.get("row", [])
 
-def update_ingredients_from_openapi():
+# OpenAPI 가 채우는 필드 — 이 값들의 해시가 같으면 다시 쓰지 않는다
+SYNC_FIELDS = ("minRecommended", "maxRecommended", "effect", "sideEffect")
+
+
+def _content_hash(values):
+    payload = json.dumps([values.get(field) for field in SYNC_FIELDS], ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _parse_item(item):
+    """API 행 → (이름, 필드 값). 이름이 없으면 None"""
+    raw_name = (item.get("RAWMTRL_NM") or "").strip()
+    if not raw_name:
+        return None
+
+    # 이름에서 괄호 안 제거
+    name = clean_name(raw_name.split("(")[0].strip())
+    if not name:
+        return None
+
+    effect = clean_text(item.get("PRIMARY_FNCLTY") or "")
+    side = clean_text(item.get("IFTKN_ATNT_MATR_CN") or "")
+    return name, {
+        # 권장량
+        "minRecommended": clean_amount(item.get("DAY_INTK_LOWLIMIT")),
+        "maxRecommended": clean_amount(item.get("DAY_INTK_HIGHLIMIT")),
+        "effect": effect or None,
+        "sideEffect": side or None,
+    }
+
+
+def sync_ingredient_page(items):
+    """API 한 페이지를 bulk upsert 한다.
+
+    - 페이지 안에서 같은 이름은 마지막 행만 쓴다(기존 update_or_create 순차 처리와 같은 결과).
+    - 기존 성분은 한 번의 쿼리로 읽어, 동기화 필드 해시가 같으면 건너뛴다.
+    - 새 성분·바뀐 성분만 bulk_create(update_conflicts) 한 번으로 쓴다(name unique 기준).
+
+    Returns:
+        (생성 수, 변경 수, 변경 없음 수)
+    """
+    rows = {}
+    for item in items:
+        parsed = _parse_item(item)
+        if parsed:
+            name, values = parsed
+            rows[name] = values
+
+    existing = {
+        row["name"]: _content_hash(row)
+        for row in Ingredient.objects.filter(name__in=list(rows)).values("name", *SYNC_FIELDS)
+    }
+    upserts = [
+        Ingredient(name=name, **values)
+        for name, values in rows.items()
+        if existing.get(name) != _content_hash(values)
+    ]
+    if upserts:
+        Ingredient.objects.bulk_create(
+            upserts,
+            update_conflicts=True,
+            unique_fields=["name"],
+            update_fields=list(SYNC_FIELDS),
+        )
+    created = sum(1 for ingredient in upserts if ingredient.name not in existing)
+    updated = len(upserts) - created
+    return created, updated, len(rows) - len(upserts)
+
+
+def update_ingredients_from_openapi(full=False):
+    """
+    식약처 기능성 원료(I-0050) 전체를 동기화한다.
+
+    원본 행(RAWMTRL_NM 기준) 해시가 지난 동기화와 같으면 파싱·저장하지 않는다.
+    full=True 면 해시와 관계없이 모든 행을 다시 처리한다.
+
+    Returns:
+        SyncDelta (원본 레코드 기준 추가/변경/변경 없음/사라짐)
+    """
+    changes = SourceChanges(SOURCE, full=full)
     batch = 500
     start = 1
-    total_imported = 0
     created_count = 0
+    updated_count = 0
+    unchanged_count = 0
 
     print("➡ 기능성 원료 동기화 시작...")
 
@@ -35,41 +121,32 @@ def update_ingredients_from_openapi():
 
         items = fetch_page(start, end)
 
+        if items is None:
+            break
         if not items:
             print("✓ 더 이상 데이터가 없어 종료합니다.")
+            changes.finish()
             break
 
-        for item in items:
-            raw_name = item.get("RAWMTRL_NM", "").strip()
-            if not raw_name:
-                continue
-
-            # 이름에서 괄호 안 제거
-            name = clean_name(raw_name.split("(")[0].strip())
-
-            # 권장량
-            min_rec = clean_amount(item.get("DAY_INTK_LOWLIMIT"))
-            max_rec = clean_amount(item.get("DAY_INTK_HIGHLIMIT"))
+        items = [
+            item for item in items
+            if changes.check((item.get("RAWMTRL_NM") or "").strip(), item)
+        ]
+        created, updated, unchanged = sync_ingredient_page(items)
+        created_count += created
+        updated_count += updated
+        unchanged_count += unchanged
 
-            effect = clean_text(item.get("PRIMARY_FNCLTY") or "")
-            side = clean_text(item.get("IFTKN_ATNT_MATR_CN") or "")
-
-            ingredient, created = Ingredient.objects.update_or_create(
-                name=name,
-                defaults={
-                    "minRecommended": min_rec,
-                    "maxRecommended": max_rec,
-                    "effect": effect or None,
-                    "sideEffect": side or None,
-                }
-            )
-
-            total_imported += 1
+        start += batch
 
-            if created:
-                created_count += 1
+    if created_count or updated_count:
+        # bulk_create 는 시그널이 없으므로 자동완성 인덱스를 직접 무효화
+        ingredient_index.invalidate()
 
-        start += batch
+    print(f"✓ 총 {created_count + updated_count + unchanged_count}개의 성분이 처리됨.")
+    print(f"✓ 새 성분 {created_count}개 / 변경 {updated_count}개 / 변경 없음 {unchanged_count}개")
+    print(f"✓ 원본 레코드: {changes.delta}")
 
-    print(f"✓ 총 {total_imported}개의 성분이 처리됨.")
-    print(f"✓ 총 {created_count}개의 기존 성분이 업데이트됨.")
\ No newline at end of file
+    # 반영을 마친 뒤에 해시를 저장한다
+    changes.save()
+    return changes.delta
@@ -3,3 +3,18 @@ from django.apps import AppConfig
 class ProductsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "products"
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+
+        from products.autocomplete import ingredient_index, other_ingredient_index
+
+        # 성분/기타 원료 이름이 바뀌면 자동완성 인덱스를 다시 읽게 한다
+        for index in (ingredient_index, other_ingredient_index):
+            def _invalidate(sender, index=index, **kwargs):
+                index.invalidate()
+
+            post_save.connect(_invalidate, sender=index.model, weak=False,
+                              dispatch_uid=f"products.autocomplete_save.{index.model.__name__}")
+            post_delete.connect(_invalidate, sender=index.model, weak=False,
+                                dispatch_uid=f"products.autocomplete_delete.{index.model.__name__}")
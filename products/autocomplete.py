@@ -0,0 +1,106 @@
+"""성분/기타 원료 이름 자동완성(type-ahead) 인덱스.
+
+관리자 폼이 Ingredient/OtherIngredient 전체를 select 로 내려보내던 것을, 프로세스 메모리에
+올려 둔 정렬 인덱스에서 상위 limit 개만 찾아 주는 방식으로 바꾼다.
+
+- 이름을 정규화(소문자, 공백·기호 제거)한 키로 정렬해 두고, 접두 일치는 bisect 로 바로 찾는다.
+  부족하면 중간 일치(infix)를 앞에서부터 훑어 채운다. 수천 건 규모라 조회는 ms 이하.
+- 모델이 저장·삭제되면(post_save/post_delete) 캐시의 버전 값을 바꾸고, 각 프로세스는 조회 때
+  버전이 다르면 인덱스를 다시 읽는다. bulk_create/update 처럼 시그널이 없는 변경은
+  invalidate() 를 직접 부르거나 REFRESH_INTERVAL 이 지나면 반영된다.
+"""
+
+import re
+import threading
+import time
+import uuid
+from bisect import bisect_left
+
+from django.core.cache import cache
+
+from products.models import Ingredient, OtherIngredient
+
+VERSION_PREFIX = "autocomplete_version:"
+REFRESH_INTERVAL = 5 * 60  # 초
+DEFAULT_LIMIT = 20
+
+_NON_WORD_RE = re.compile(r"[^A-Za-z0-9_가-힣]")
+
+
+def normalize(text):
+    """검색 키 — 대소문자·공백·기호 무시.
+
+    기존 select2 matcher 와 같은 규칙: 소문자로 바꾼 뒤 ASCII 영숫자·_·한글 음절(가-힣) 외에는
+    모두 뺀다. 이름과 검색어에 똑같이 적용하므로 "L-카르니틴"은 "l카르"로도 찾는다.
+    """
+    return _NON_WORD_RE.sub("", (text or "").lower())
+
+
+class NameIndex:
+    def __init__(self, model):
+        self.model = model
+        self._lock = threading.Lock()
+        self._keys = []  # 정규화 키 (정렬됨)
+        self._entries = []  # (키, 이름, id) — _keys 와 같은 순서
+        self._version = None
+        self._loaded_at = 0.0
+
+    @property
+    def version_key(self):
+        return f"{VERSION_PREFIX}{self.model._meta.label_lower}"
+
+    def invalidate(self):
+        """모든 프로세스의 인덱스를 다음 조회 때 다시 읽게 한다."""
+        cache.set(self.version_key, uuid.uuid4().hex, None)
+
+    def _load(self, version):
+        entries = sorted(
+            (normalize(name), name, pk)
+            for pk, name in self.model.objects.values_list("id", "name").iterator()
+        )
+        self._entries = entries
+        self._keys = [key for key, _, _ in entries]
+        self._version = version
+        self._loaded_at = time.monotonic()
+
+    def _ensure_fresh(self):
+        version = cache.get(self.version_key)
+        if version is None:
+            version = uuid.uuid4().hex
+            cache.add(self.version_key, version, None)
+            version = cache.get(self.version_key, version)
+        with self._lock:
+            if (
+                version != self._version
+                or time.monotonic() - self._loaded_at >= REFRESH_INTERVAL
+            ):
+                self._load(version)
+            return self._keys, self._entries
+
+    def search(self, q, limit=DEFAULT_LIMIT):
+        """q 로 시작하는 이름을 먼저, 그다음 q 가 들어간 이름을 가나다순으로 최대 limit 개.
+
+        Returns:
+            [{"id": ..., "label": 이름}, ...] (q 가 비면 앞에서부터)
+        """
+        keys, entries = self._ensure_fresh()
+        term = normalize(q)
+        if not term:
+            return [{"id": pk, "label": name} for _, name, pk in entries[:limit]]
+
+        start = bisect_left(keys, term)
+        end = start
+        while end < len(keys) and end - start < limit and keys[end].startswith(term):
+            end += 1
+        matches = entries[start:end]
+        if len(matches) < limit:
+            for entry in entries:
+                if term in entry[0] and not entry[0].startswith(term):
+                    matches.append(entry)
+                    if len(matches) >= limit:
+                        break
+        return [{"id": pk, "label": name} for _, name, pk in matches]
+
+
+ingredient_index = NameIndex(Ingredient)
+other_ingredient_index = NameIndex(OtherIngredient)
@@ -1,14 +1,29 @@
 import hashlib
 import hmac
-from datetime import datetime, timezone
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
 from urllib.parse import urlencode, quote
 
 import requests
 from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.utils import timezone as dj_timezone
+
+from common import http_client
+from products.models import CoupangLinkCache
+
+logger = logging.getLogger(__name__)
 
 _BASE_URL = "https://api-gateway.coupang.com"
 _PATH = "/v2/providers/affiliate_open_api/apis/openapi/v1/products/search"
 
+
+class CoupangAPIError(Exception):
+    """쿠팡 검색 API 호출 실패(429·5xx·인증 오류·네트워크 오류). "검색 결과 없음"과 구분한다."""
+
+
 def _build_authorization(method: str, query_string: str) -> tuple[str, str]:
     datetime_str = datetime.now(timezone.utc).strftime("%y%m%dT%H%M%SZ")
     message = datetime_str + method + _PATH + query_string
@@ -27,15 +42,21 @@ def _build_authorization(method: str, query_string: str) -> tuple[str, str]:
     return authorization, datetime_str
 
 def search_top_product_url(keyword: str) -> str | None:
+    """rank 1 상품 URL. 200 인데 결과가 없으면 None, 호출이 실패하면 CoupangAPIError."""
     params = {"keyword": keyword, "limit": "1"}
     query_string = urlencode(sorted(params.items()), quote_via=quote)
     full_url = f"{_BASE_URL}{_PATH}?{query_string}"
     authorization, _ = _build_authorization("GET", query_string)
 
-    response = requests.get(full_url, headers={"Authorization": authorization}, timeout=5)
+    try:
+        response = http_client.get(
+            full_url, service="coupang", headers={"Authorization": authorization}, timeout=5
+        )
+    except requests.RequestException as e:
+        raise CoupangAPIError(str(e)) from e
 
     if response.status_code != 200:
-        return None
+        raise CoupangAPIError(f"HTTP {response.status_code}")
 
     data = response.json()
     products = data.get("data", {}).get("productData", [])
@@ -51,7 +72,9 @@ def debug_search(keyword: str) -> dict:
     full_url = f"{_BASE_URL}{_PATH}?{query_string}"
     authorization, datetime_str = _build_authorization("GET", query_string)
 
-    response = requests.get(full_url, headers={"Authorization": authorization}, timeout=5)
+    response = http_client.get(
+        full_url, service="coupang", headers={"Authorization": authorization}, timeout=5
+    )
 
     return {
         "request": {
@@ -64,3 +87,73 @@ def debug_search(keyword: str) -> dict:
             "body": response.json() if response.headers.get("content-type", "").startswith("application/json") else response.text,
         },
     }
+
+# --------------------------------------------------------------------------
+# 제품별 검색 결과 캐시 (CoupangRedirectView)
+# --------------------------------------------------------------------------
+# 검색 결과(rank 1 상품 URL)는 COUPANG_LINK_TTL_HOURS 동안 그대로 리다이렉트에 쓰고,
+# 지나면 기존 URL 로 바로 응답한 뒤 백그라운드에서 다시 조회한다.
+# 검색 결과가 없던 제품(200 + 빈 결과)은 짧게(_EMPTY_RESULT_TTL) 캐시한다.
+# API 호출이 실패하면(CoupangAPIError) 아무것도 저장하지 않아 기존 URL 을 덮어쓰지 않는다.
+_EMPTY_RESULT_TTL = timedelta(hours=1)
+_REFRESH_LOCK_TIMEOUT = 60  # 초
+
+
+def product_keyword(company: str, name: str) -> str:
+    return f"{company} {name}"
+
+def _link_ttl() -> timedelta:
+    return timedelta(hours=getattr(settings, "COUPANG_LINK_TTL_HOURS", 24))
+
+def save_product_url(product_id: int, keyword: str, url: str | None):
+    CoupangLinkCache.objects.update_or_create(
+        product_id=product_id,
+        defaults={"keyword": keyword, "url": url, "resolved_at": dj_timezone.now()},
+    )
+
+def resolve_product_url(product_id: int, keyword: str) -> str | None:
+    """쿠팡 검색 API 로 조회해 캐시에 저장하고 URL 을 반환한다(실패하면 저장 없이 CoupangAPIError)."""
+    url = search_top_product_url(keyword)
+    save_product_url(product_id, keyword, url)
+    return url
+
+def is_link_fresh(link: CoupangLinkCache) -> bool:
+    ttl = _link_ttl() if link.url else _EMPTY_RESULT_TTL
+    return dj_timezone.now() - link.resolved_at < ttl
+
+def _refresh_in_background(product_id: int, keyword: str):
+    # 같은 제품을 여러 요청이 동시에 다시 조회하지 않도록 캐시 락을 잡은 요청만 갱신
+    lock_key = f"coupang:refresh:{product_id}"
+    if not cache.add(lock_key, 1, _REFRESH_LOCK_TIMEOUT):
+        return
+
+    def run():
+        try:
+            resolve_product_url(product_id, keyword)
+        except Exception:
+            logger.exception("쿠팡 링크 갱신 실패: product %s", product_id)
+        finally:
+            cache.delete(lock_key)
+            connections.close_all()  # 이 스레드의 DB 커넥션 정리
+
+    threading.Thread(target=run, daemon=True).start()
+
+def get_product_url(product_id: int, keyword: str) -> str | None:
+    """캐시된 쿠팡 상품 URL 을 반환한다.
+
+    캐시가 없거나 키워드(회사·제품명)가 바뀌었으면 바로 조회하고,
+    만료됐으면 기존 값을 반환하면서 백그라운드에서 갱신한다.
+    바로 조회가 실패하면 기존 URL 이 있으면 그것을 쓰고, 없으면 CoupangAPIError 를 올린다.
+    """
+    link = CoupangLinkCache.objects.filter(product_id=product_id).first()
+    if link is None or link.keyword != keyword:
+        try:
+            return resolve_product_url(product_id, keyword)
+        except CoupangAPIError:
+            if link is None or not link.url:
+                raise
+            logger.warning("쿠팡 링크 조회 실패, 기존 URL 사용: product %s", product_id)
+            return link.url
+    if not is_link_fresh(link):
+        _refresh_in_background(product_id, keyword)
+    return link.url
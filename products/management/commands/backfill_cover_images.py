@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from products.models import Product
+from products.utils import refresh_cover_images
+
+
+class Command(BaseCommand):
+    help = "모든 제품의 대표 이미지(cover_image_url)를 첫 ProductImage 기준으로 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="UPDATE 한 번에 처리할 제품 수 (기본값: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        product_ids = list(Product.objects.order_by("id").values_list("id", flat=True))
+
+        updated = 0
+        for start in range(0, len(product_ids), batch_size):
+            updated += refresh_cover_images(product_ids[start:start + batch_size])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"대표 이미지 갱신 완료: {updated}개 제품")
+        )
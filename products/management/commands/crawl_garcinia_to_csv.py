@@ -5,13 +5,15 @@ products/management/commands/crawl_garcinia_to_csv.py
 퍼지매칭으로 ingredient 이름을 정제합니다.
 
 사용법:
-    python manage.py crawl_garcinia_to_csv
+    python manage.py crawl_garcinia_to_csv          # 지난 DB 저장 이후 바뀐 제품만
+    python manage.py crawl_garcinia_to_csv --full   # 전체
 
 출력 파일:
     data/products.csv
     data/product_ingredients.csv
     data/ingredients.csv
     data/unmatched_ingredients.csv  ← 매칭 실패한 것들 (수동 검토용)
+    data/source_state.json          ← 원본 해시 (import_garcinia_from_csv 가 저장 후 반영)
 
 필요한 패키지:
     pip install requests rapidfuzz
@@ -19,14 +21,17 @@ products/management/commands/crawl_garcinia_to_csv.py
 
 import re
 import csv
+import json
 import time
 import os
-import requests
 import xml.etree.ElementTree as ET
 
 from rapidfuzz import process, fuzz
 from django.core.management.base import BaseCommand
+
+from common import http_client
 from products.models import Ingredient
+from products.source_sync import GARCINIA_SOURCE, SourceChanges, candidates_version
 
 
 # ------------------------------------------------------------------ #
@@ -37,6 +42,7 @@ SERVICE_ID = "I0030"
 BASE_URL   = f"https://openapi.foodsafetykorea.go.kr/api/{API_KEY}/{SERVICE_ID}/xml"
 BATCH_SIZE = 1000
 OUTPUT_DIR = "data"
+SOURCE_STATE_FILE = "source_state.json"
 
 GARCINIA_KEYWORDS    = ["가르시니아"]
 FUZZY_THRESHOLD      = 90   # 90% 이상 유사도면 매칭
@@ -287,12 +293,24 @@ def is_garcinia_product(indiv_rawmtrl_nm: str) -> bool:
 class Command(BaseCommand):
     help = "API 데이터를 퍼지매칭으로 정제하여 CSV로 저장합니다"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="지난 DB 저장 이후 바뀌지 않은 제품도 모두 수집"
+        )
+
     def handle(self, *args, **options):
         os.makedirs(OUTPUT_DIR, exist_ok=True)
 
         # 퍼지매처 초기화
         self.stdout.write("퍼지매처 초기화 중...")
         matcher = IngredientMatcher(self.stdout)
+        changes = SourceChanges(
+            GARCINIA_SOURCE,
+            full=options["full"],
+            version=candidates_version(matcher.all_candidates),
+        )
 
         # CSV 파일 열기
         products_file = open(
@@ -322,6 +340,7 @@ class Command(BaseCommand):
         product_count    = 0
         start = 1
         total = None
+        complete = False
 
         while True:
             end = start + BATCH_SIZE - 1
@@ -329,7 +348,7 @@ class Command(BaseCommand):
             self.stdout.write(f"\nAPI 요청: {start}~{end}번째...")
 
             try:
-                resp = requests.get(url, timeout=30)
+                resp = http_client.get(url, service="foodsafety", timeout=30)
                 root = ET.fromstring(resp.content)
             except Exception as e:
                 self.stdout.write(self.style.ERROR(f"✗ 요청 실패: {e}"))
@@ -342,6 +361,7 @@ class Command(BaseCommand):
 
             rows = root.findall("row")
             if not rows:
+                complete = True
                 break
 
             for row in rows:
@@ -359,6 +379,11 @@ class Command(BaseCommand):
 
                 seen_products.add(name)
 
+                # 지난 DB 저장 이후 원본이 그대로면 파싱·퍼지매칭 생략
+                payload = {"company": company, "effect": effect, "spec": spec, "indiv": indiv_rawmtrl_nm}
+                if not changes.check(name, payload):
+                    continue
+
                 # 가르시니아 effect (최초 1회)
                 if not garcinia_effect and "가르시니아" in effect:
                     garcinia_effect = parse_garcinia_effect(effect)
@@ -401,6 +426,7 @@ class Command(BaseCommand):
 
             start += BATCH_SIZE
             if start > total:
+                complete = True
                 break
 
             time.sleep(1)
@@ -409,6 +435,13 @@ class Command(BaseCommand):
         pi_file.close()
         ing_file.close()
 
+        # 원본 해시는 import_garcinia_from_csv 로 DB 에 저장한 뒤에 반영한다
+        if complete:
+            changes.finish()
+        with open(os.path.join(OUTPUT_DIR, SOURCE_STATE_FILE), "w", encoding="utf-8") as f:
+            json.dump(changes.state(), f, ensure_ascii=False)
+        self.stdout.write(f"\n원본 레코드: {changes.delta}")
+
         # 매칭 실패 목록 저장
         if matcher.unmatched:
             unmatched_path = os.path.join(OUTPUT_DIR, "unmatched_ingredients.csv")
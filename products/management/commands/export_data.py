@@ -1,9 +1,53 @@
+import gzip
 import json
 from pathlib import Path
 
 from django.core.management.base import BaseCommand
+from django.db.models import Prefetch
 
-from products.models import Ingredient, Product
+from products.models import Ingredient, Product, ProductIngredient
+
+INGREDIENT_FIELDS = (
+    "id",
+    "name",
+    "mainIngredient",
+    "effect",
+    "sideEffect",
+    "minRecommended",
+    "maxRecommended",
+)
+
+
+class RecordWriter:
+    """레코드를 하나씩 파일에 바로 쓴다(전체 목록을 메모리에 모으지 않음).
+
+    - json: 한 줄에 한 레코드인 JSON 배열 (json.load 로 그대로 읽힘)
+    - ndjson: 줄마다 JSON 객체 하나
+    """
+
+    def __init__(self, path, fmt, compress):
+        self.path = path
+        self.fmt = fmt
+        self.count = 0
+        self.last_id = None
+        opener = gzip.open if compress else open
+        self._file = opener(path, "wt", encoding="utf-8")
+        if fmt == "json":
+            self._file.write("[")
+
+    def write(self, record):
+        line = json.dumps(record, ensure_ascii=False)
+        if self.fmt == "json":
+            self._file.write(("\n" if self.count == 0 else ",\n") + line)
+        else:
+            self._file.write(line + "\n")
+        self.count += 1
+        self.last_id = record["id"]
+
+    def close(self):
+        if self.fmt == "json":
+            self._file.write("\n]\n" if self.count else "]\n")
+        self._file.close()
 
 
 class Command(BaseCommand):
@@ -15,50 +59,105 @@ class Command(BaseCommand):
             default=".",
             help="JSON 파일을 저장할 디렉토리 (기본값: 현재 디렉토리)",
         )
+        parser.add_argument(
+            "--format",
+            choices=["json", "ndjson"],
+            default="json",
+            help="json(배열) 또는 ndjson(줄마다 객체 하나) (기본값: json)",
+        )
+        parser.add_argument(
+            "--gzip",
+            action="store_true",
+            help="gzip 으로 압축해 .gz 파일로 저장",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="DB 에서 한 번에 읽을 행 수 (기본값: 2000)",
+        )
+        parser.add_argument(
+            "--since-ingredient-id",
+            type=int,
+            default=0,
+            help=(
+                "이 id 보다 큰 성분만 export (증분, 기본값: 0 = 전체). "
+                "새로 추가된 행만 나오고 기존 행의 수정은 반영되지 않으므로 주기적으로 전체 export 필요"
+            ),
+        )
+        parser.add_argument(
+            "--since-product-id",
+            type=int,
+            default=0,
+            help=(
+                "이 id 보다 큰 제품만 export (증분, 기본값: 0 = 전체). "
+                "새로 추가된 행만 나오고 기존 행의 수정은 반영되지 않으므로 주기적으로 전체 export 필요"
+            ),
+        )
 
     def handle(self, *args, **options):
         output_dir = Path(options["output_dir"])
         output_dir.mkdir(parents=True, exist_ok=True)
+        fmt = options["format"]
+        compress = options["gzip"]
+        chunk_size = max(1, options["chunk_size"])
 
-        ingredients = list(
-            Ingredient.objects.values(
-                "id",
-                "name",
-                "mainIngredient",
-                "effect",
-                "sideEffect",
-                "minRecommended",
-                "maxRecommended",
-            )
-        )
-        ingredients_path = output_dir / "ingredients_export.json"
-        with ingredients_path.open("w", encoding="utf-8") as f:
-            json.dump(ingredients, f, ensure_ascii=False, indent=2)
-        self.stdout.write(
-            self.style.SUCCESS(f"{ingredients_path} 저장 완료 ({len(ingredients)}건)")
+        def open_writer(name):
+            path = output_dir / f"{name}.{fmt}{'.gz' if compress else ''}"
+            return RecordWriter(path, fmt, compress)
+
+        ingredients = (
+            Ingredient.objects.filter(id__gt=options["since_ingredient_id"])
+            .order_by("id")
+            .values(*INGREDIENT_FIELDS)
         )
+        writer = open_writer("ingredients_export")
+        try:
+            for ingredient in ingredients.iterator(chunk_size=chunk_size):
+                writer.write(ingredient)
+        finally:
+            writer.close()
+        self._report(writer)
 
-        products = []
-        queryset = Product.objects.prefetch_related("ingredients__ingredient")
-        for product in queryset:
-            products.append(
-                {
-                    "id": product.id,
-                    "name": product.name,
-                    "company": product.company,
-                    "ingredients": [
-                        {
-                            "ingredient_id": pi.ingredient_id,
-                            "ingredient_name": pi.ingredient.name,
-                            "amount": pi.amount,
-                        }
-                        for pi in product.ingredients.all()
-                    ],
-                }
+        # 제품 묶음(chunk_size)마다 그 제품들의 성분만 prefetch 한다
+        products = (
+            Product.objects.filter(id__gt=options["since_product_id"])
+            .order_by("id")
+            .only("id", "name", "company")
+            .prefetch_related(
+                Prefetch(
+                    "ingredients",
+                    queryset=ProductIngredient.objects.select_related("ingredient")
+                    .only("product_id", "ingredient_id", "ingredient__name", "amount")
+                    .order_by("id"),
+                )
             )
-        products_path = output_dir / "products_export.json"
-        with products_path.open("w", encoding="utf-8") as f:
-            json.dump(products, f, ensure_ascii=False, indent=2)
+        )
+        writer = open_writer("products_export")
+        try:
+            for product in products.iterator(chunk_size=chunk_size):
+                writer.write(
+                    {
+                        "id": product.id,
+                        "name": product.name,
+                        "company": product.company,
+                        "ingredients": [
+                            {
+                                "ingredient_id": pi.ingredient_id,
+                                "ingredient_name": pi.ingredient.name,
+                                "amount": pi.amount,
+                            }
+                            for pi in product.ingredients.all()
+                        ],
+                    }
+                )
+        finally:
+            writer.close()
+        self._report(writer)
+
+    def _report(self, writer):
+        # 마지막 id 를 다음 증분 export 의 --since-*-id 로 쓴다
+        last = f", 마지막 id {writer.last_id}" if writer.last_id is not None else ""
         self.stdout.write(
-            self.style.SUCCESS(f"{products_path} 저장 완료 ({len(products)}건)")
+            self.style.SUCCESS(f"{writer.path} 저장 완료 ({writer.count}건{last})")
         )
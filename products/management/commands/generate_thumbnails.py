@@ -0,0 +1,101 @@
+from django.core.management.base import BaseCommand
+
+from common.storage import build_public_url, key_from_public_url
+from common.thumbnails import create_thumbnails
+from products.models import ProductImage
+from products.utils import refresh_cover_images
+from review.models import ReviewImage
+
+
+class Command(BaseCommand):
+    help = "썸네일이 없는 제품/리뷰 이미지의 썸네일을 배치 단위로 병렬 생성합니다(backfill)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target",
+            choices=("products", "reviews", "all"),
+            default="all",
+            help="처리 대상 (기본값: all)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="한 번에 처리·저장할 이미지 수 (기본값: 100)",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="대상별 최대 처리 개수 (기본값: 전체)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="이미 썸네일이 있는 이미지도 다시 생성",
+        )
+
+    def handle(self, *args, **options):
+        if options["target"] in ("products", "all"):
+            # 제품 이미지는 CDN URL 로 저장 - 우리 버킷(products/) 이미지만 대상
+            queryset = ProductImage.objects.filter(
+                url__startswith=build_public_url("products/")
+            )
+            self._backfill(
+                "제품 이미지",
+                queryset,
+                to_key=key_from_public_url,
+                to_value=build_public_url,
+                options=options,
+                on_batch=lambda images: refresh_cover_images(
+                    {image.product_id for image in images}
+                ),
+            )
+
+        if options["target"] in ("reviews", "all"):
+            # 리뷰 이미지는 url 에 S3 키를 그대로 저장
+            self._backfill(
+                "리뷰 이미지",
+                ReviewImage.objects.all(),
+                to_key=lambda url: url,
+                to_value=lambda key: key,
+                options=options,
+            )
+
+    def _backfill(self, label, queryset, to_key, to_value, options, on_batch=None):
+        if not options["force"]:
+            queryset = queryset.filter(thumbnail_url__isnull=True)
+        queryset = queryset.order_by("id")
+
+        batch_size = max(1, options["batch_size"])
+        limit = options["limit"]
+        done = failed = 0
+        last_id = 0
+
+        # 실패한 행은 null 로 남으므로 id 커서로 넘어가며 배치 처리한다
+        while limit is None or done + failed < limit:
+            size = batch_size if limit is None else min(batch_size, limit - done - failed)
+            batch = list(queryset.filter(id__gt=last_id)[:size])
+            if not batch:
+                break
+            last_id = batch[-1].id
+
+            thumb_keys = create_thumbnails([to_key(image.url) for image in batch])
+            updated = []
+            for image, thumb_key in zip(batch, thumb_keys):
+                if thumb_key:
+                    image.thumbnail_url = to_value(thumb_key)
+                    updated.append(image)
+                else:
+                    failed += 1
+            queryset.model.objects.bulk_update(updated, ["thumbnail_url"])
+            if on_batch and updated:
+                # 제품 대표 이미지(cover_image_url)가 썸네일을 가리키도록 갱신
+                on_batch(updated)
+            done += len(updated)
+
+            self.stdout.write(f"{label}: {done}건 생성, {failed}건 실패 (~id {last_id})")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{label} 썸네일 생성 완료: {done}건 (실패 {failed}건)")
+        )
@@ -10,6 +10,7 @@ crawl_garcinia_to_csv 커맨드로 먼저 CSV를 생성하세요.
 """
 
 import csv
+import json
 import os
 
 from django.core.management.base import BaseCommand
@@ -17,8 +18,10 @@ from products.models import (
     Ingredient, Product, ProductIngredient,
     CategoryProduct, SmallCategory
 )
+from products.source_sync import save_source_state
 
 OUTPUT_DIR = "data"
+SOURCE_STATE_FILE = "source_state.json"
 
 
 class Command(BaseCommand):
@@ -85,6 +88,8 @@ class Command(BaseCommand):
         # ── 2단계: products.csv → Product + CategoryProduct 저장 ─── #
         self.stdout.write("2단계: Product + CategoryProduct 저장 중...")
         prod_success, prod_skip, cat_success = 0, 0, 0
+        # 원본 해시는 제품과 성분 연결이 모두 들어간 제품만 저장한다
+        imported, incomplete = set(), set()
 
         with open(products_path, encoding="utf-8-sig") as f:
             for row in csv.DictReader(f):
@@ -111,6 +116,7 @@ class Command(BaseCommand):
                         prod_success += 1
                     else:
                         prod_skip += 1
+                    imported.add(name)
 
                     for cat_id in category_ids:
                         try:
@@ -149,6 +155,9 @@ class Command(BaseCommand):
                 if not product_name or not ingredient_name:
                     continue
 
+                if row.get("match_method") == "unmatched":
+                    incomplete.add(product_name)
+
                 if not dry_run:
                     try:
                         product    = Product.objects.get(name=product_name)
@@ -164,6 +173,7 @@ class Command(BaseCommand):
                             self.style.WARNING(f"  ⚠ Product 없음: {product_name}")
                         )
                         pi_fail += 1
+                        incomplete.add(product_name)
                     except Ingredient.DoesNotExist:
                         self.stdout.write(
                             self.style.WARNING(
@@ -172,6 +182,7 @@ class Command(BaseCommand):
                             )
                         )
                         pi_fail += 1
+                        incomplete.add(product_name)
                 else:
                     self.stdout.write(
                         f"  [DRY] {product_name} → {ingredient_name} ({amount}) "
@@ -186,4 +197,10 @@ class Command(BaseCommand):
                 "DRY RUN 완료 — 실제 저장하려면 --dry-run 없이 실행하세요"
             ))
         else:
+            # crawl_garcinia_to_csv 가 남긴 원본 해시 반영 — 다음 수집부터 바뀐 제품만 가져온다
+            state_path = os.path.join(OUTPUT_DIR, SOURCE_STATE_FILE)
+            if os.path.exists(state_path):
+                with open(state_path, encoding="utf-8") as f:
+                    save_source_state(json.load(f), imported=imported - incomplete)
+                os.remove(state_path)
             self.stdout.write(self.style.SUCCESS("DB 삽입 완료!"))
\ No newline at end of file
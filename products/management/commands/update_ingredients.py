@@ -4,6 +4,13 @@ from products.api.import_ingredients import update_ingredients_from_openapi
 class Command(BaseCommand):
     help = "식약처 OpenAPI로부터 성분 데이터를 업데이트합니다."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="지난 동기화 이후 바뀌지 않은 원본 레코드도 모두 다시 처리",
+        )
+
     def handle(self, *args, **options):
-        update_ingredients_from_openapi()
-        self.stdout.write(self.style.SUCCESS("Ingredient 업데이트 완료"))
\ No newline at end of file
+        delta = update_ingredients_from_openapi(full=options["full"])
+        self.stdout.write(self.style.SUCCESS(f"Ingredient 업데이트 완료 ({delta})"))
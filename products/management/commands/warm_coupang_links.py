@@ -0,0 +1,97 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand
+
+from products.coupang import (
+    is_link_fresh,
+    product_keyword,
+    save_product_url,
+    search_top_product_url,
+)
+from products.models import CoupangLinkCache, Product
+
+
+class RateLimiter:
+    """분당 호출 수 제한 - 호출 간 최소 간격을 스레드 간에 공유한다."""
+
+    def __init__(self, per_minute: int):
+        self.interval = 60.0 / per_minute
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            wait_for = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if wait_for > 0:
+            time.sleep(wait_for)
+
+
+class Command(BaseCommand):
+    help = "전체 제품의 쿠팡 검색 결과(리다이렉트 URL)를 미리 조회해 캐시합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="동시 요청 수 (기본값: 4)",
+        )
+        parser.add_argument(
+            "--per-minute",
+            type=int,
+            default=30,
+            help="쿠팡 검색 API 분당 최대 호출 수 (기본값: 30)",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="아직 유효한 캐시도 다시 조회",
+        )
+
+    def handle(self, *args, **options):
+        links = {link.product_id: link for link in CoupangLinkCache.objects.all()}
+        targets = []
+        for product in Product.objects.order_by("id").only("id", "name", "company"):
+            keyword = product_keyword(product.company, product.name)
+            link = links.get(product.id)
+            if (
+                options["all"]
+                or link is None
+                or link.keyword != keyword
+                or not is_link_fresh(link)
+            ):
+                targets.append((product.id, keyword))
+
+        self.stdout.write(f"조회 대상: {len(targets)}개 제품")
+        limiter = RateLimiter(max(1, options["per_minute"]))
+
+        def resolve(product_id, keyword):
+            limiter.wait()
+            return product_id, keyword, search_top_product_url(keyword)
+
+        found = empty = failed = 0
+        # 워커는 API 호출만 하고 DB 저장은 메인 스레드에서 한다
+        with ThreadPoolExecutor(max_workers=max(1, options["workers"])) as pool:
+            futures = [pool.submit(resolve, *target) for target in targets]
+            for future in as_completed(futures):
+                try:
+                    product_id, keyword, url = future.result()
+                except Exception as e:
+                    failed += 1
+                    self.stdout.write(self.style.WARNING(f"조회 실패(기존 캐시 유지): {e}"))
+                    continue
+                save_product_url(product_id, keyword, url)
+                if url:
+                    found += 1
+                else:
+                    empty += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"쿠팡 링크 캐시 완료: {found}건 저장, 결과 없음 {empty}건, 실패 {failed}건"
+            )
+        )
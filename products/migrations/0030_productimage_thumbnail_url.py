@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-19 07:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0029_importjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productimage',
+            name='thumbnail_url',
+            field=models.URLField(blank=True, max_length=500, null=True, verbose_name='썸네일 URL'),
+        ),
+    ]
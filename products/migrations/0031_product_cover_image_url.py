@@ -0,0 +1,40 @@
+# Generated by Django 5.2.5 on 2026-10-19 07:59
+
+from django.db import migrations, models
+from django.db.models import Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+BATCH_SIZE = 1000
+
+
+def fill_cover_images(apps, schema_editor):
+    # products.utils.refresh_cover_images 와 같은 UPDATE 를 id 구간별로 - 배포 직후 카드가 비지 않게
+    Product = apps.get_model('products', 'Product')
+    ProductImage = apps.get_model('products', 'ProductImage')
+    first_image = (
+        ProductImage.objects.filter(product_id=OuterRef('pk'))
+        .order_by('id')
+        .annotate(card_url=Coalesce('thumbnail_url', 'url'))
+        .values('card_url')[:1]
+    )
+    last_id = Product.objects.aggregate(last=Max('id'))['last'] or 0
+    for start in range(0, last_id + 1, BATCH_SIZE):
+        Product.objects.filter(id__gte=start, id__lt=start + BATCH_SIZE).update(
+            cover_image_url=Subquery(first_image)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0030_productimage_thumbnail_url'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='cover_image_url',
+            field=models.URLField(blank=True, max_length=500, null=True, verbose_name='대표 이미지 URL'),
+        ),
+        migrations.RunPython(fill_cover_images, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.5 on 2026-10-19 08:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0031_product_cover_image_url'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CoupangLinkCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('keyword', models.TextField(verbose_name='검색 키워드')),
+                ('url', models.TextField(blank=True, null=True, verbose_name='상품 URL')),
+                ('resolved_at', models.DateTimeField(verbose_name='조회 시각')),
+                ('product', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='coupang_link', to='products.product')),
+            ],
+            options={
+                'db_table': 'coupang_link_cache',
+            },
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.2.5 on 2026-10-19 08:20
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def _collapse_product_links(ProductIngredient, ingredient_id):
+    # 합친 뒤 같은 제품-성분 연결이 둘 이상이면 하나만 남긴다(용량이 있는 것, 그중 id 가 작은 것)
+    kept = {}
+    drop_ids = []
+    links = (
+        ProductIngredient.objects.filter(ingredient_id=ingredient_id)
+        .order_by('product_id', 'id')
+        .values_list('id', 'product_id', 'amount')
+    )
+    for link_id, product_id, amount in links:
+        current = kept.get(product_id)
+        if current is None:
+            kept[product_id] = (link_id, amount)
+        elif amount and not current[1]:
+            drop_ids.append(current[0])
+            kept[product_id] = (link_id, amount)
+        else:
+            drop_ids.append(link_id)
+    ProductIngredient.objects.filter(id__in=drop_ids).delete()
+
+
+def merge_duplicate_names(apps, schema_editor):
+    # unique 제약 전에 이름이 같은 성분을 id 가 가장 작은 행으로 합친다
+    Ingredient = apps.get_model('products', 'Ingredient')
+    ProductIngredient = apps.get_model('products', 'ProductIngredient')
+    IngredientGuide = apps.get_model('products', 'IngredientGuide')
+    SavedRecommendationItem = apps.get_model('recommendations', 'SavedRecommendationItem')
+
+    duplicates = (
+        Ingredient.objects.values('name')
+        .annotate(keep_id=Min('id'), count=Count('id'))
+        .filter(count__gt=1)
+    )
+    for row in duplicates:
+        drop_ids = list(
+            Ingredient.objects.filter(name=row['name'])
+            .exclude(id=row['keep_id'])
+            .values_list('id', flat=True)
+        )
+        ProductIngredient.objects.filter(ingredient_id__in=drop_ids).update(ingredient_id=row['keep_id'])
+        _collapse_product_links(ProductIngredient, row['keep_id'])
+        SavedRecommendationItem.objects.filter(ingredient_id__in=drop_ids).update(
+            ingredient_id=row['keep_id']
+        )
+        # 가이드는 1:1 — 남길 성분에 없으면 하나를 옮기고 나머지는 성분과 함께 지운다
+        if not IngredientGuide.objects.filter(ingredient_id=row['keep_id']).exists():
+            guide = IngredientGuide.objects.filter(ingredient_id__in=drop_ids).order_by('id').first()
+            if guide:
+                guide.ingredient_id = row['keep_id']
+                guide.save(update_fields=['ingredient'])
+        Ingredient.objects.filter(id__in=drop_ids).delete()
+
+
+class Migration(migrations.Migration):
+    # 합치기(FK 갱신)와 제약 추가를 한 트랜잭션에 두면 PostgreSQL 에서 pending trigger events 오류가 난다.
+    # 마이그레이션 전체는 non-atomic 으로 두고, 합치기(RunPython)만 자체 트랜잭션으로 돌린다
+    atomic = False
+
+    dependencies = [
+        ('products', '0032_coupanglinkcache'),
+        ('recommendations', '0003_alter_savedrecommendation_user'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_names, migrations.RunPython.noop, atomic=True),
+        migrations.AlterField(
+            model_name='ingredient',
+            name='name',
+            field=models.TextField(unique=True, verbose_name='성분 이름'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.5 on 2026-10-19 08:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0033_ingredient_name_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importjob',
+            name='source_state',
+            field=models.JSONField(default=dict),
+        ),
+        migrations.CreateModel(
+            name='SourceRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=50, verbose_name='소스')),
+                ('key', models.TextField(verbose_name='레코드 키')),
+                ('content_hash', models.CharField(max_length=40, verbose_name='내용 해시')),
+                ('last_seen_at', models.DateTimeField(verbose_name='마지막 확인 시각')),
+            ],
+            options={
+                'db_table': 'source_records',
+                'constraints': [models.UniqueConstraint(fields=('source', 'key'), name='uniq_source_record_key')],
+            },
+        ),
+    ]
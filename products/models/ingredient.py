@@ -1,7 +1,8 @@
 from django.db import models
 
 class Ingredient(models.Model):
-    name = models.TextField(verbose_name="성분 이름")
+    # 식약처 OpenAPI 동기화(bulk upsert)의 충돌 기준이라 unique
+    name = models.TextField(unique=True, verbose_name="성분 이름")
     mainIngredient = models.TextField(max_length=100, verbose_name="주성분이름", null=True, blank=True)
     minRecommended = models.CharField(max_length=50, verbose_name="최소권장량", null=True, blank=True)
     maxRecommended = models.CharField(max_length=50, verbose_name="최대권장량", null=True, blank=True)
@@ -10,6 +10,10 @@ class Product(models.Model):
     productType = models.TextField(verbose_name="식품의 유형")
     viewCount = models.IntegerField(verbose_name="조회수", default=0)
     coupang = models.TextField(verbose_name="쿠팡 링크", null=True, blank=True)
+    # 첫 이미지(id 최소)의 카드용 URL(썸네일 우선) 비정규화 - products.utils.refresh_cover_images 로 갱신
+    cover_image_url = models.URLField(
+        max_length=500, null=True, blank=True, verbose_name="대표 이미지 URL"
+    )
 
     class Meta:
         db_table = "products"
@@ -26,10 +30,21 @@ class ProductImage(models.Model):
         max_length=500,
         verbose_name="이미지 URL"
     )
+    thumbnail_url = models.URLField(
+        max_length=500,
+        null=True,
+        blank=True,
+        verbose_name="썸네일 URL"
+    )
 
     class Meta:
         db_table = "product_images"
 
+    @property
+    def card_url(self):
+        # 목록 카드용: 썸네일이 아직 없으면 원본으로 폴백
+        return self.thumbnail_url or self.url
+
     def __str__(self):
         return f"{self.product.name} 이미지"
 
@@ -77,9 +92,44 @@ class ImportJob(models.Model):
     pi_rows = models.JSONField(default=list)
     unmatched = models.JSONField(default=list)
     total = models.IntegerField(default=0)
+    # 수집한 소스 레코드 해시 {"hashes": {key: hash}, "removed": [key]} - DB 저장 때 SourceRecord 에 반영
+    source_state = models.JSONField(default=dict)
 
     class Meta:
         db_table = "import_jobs"
 
     def __str__(self):
-        return f"ImportJob #{self.id} ({self.status}, {self.total}개)"
\ No newline at end of file
+        return f"ImportJob #{self.id} ({self.status}, {self.total}개)"
+
+class SourceRecord(models.Model):
+    # 외부 소스(식약처 API 등) 레코드별 마지막 반영 내용 해시 - products.source_sync 에서 관리
+    source = models.CharField(max_length=50, verbose_name="소스")
+    key = models.TextField(verbose_name="레코드 키")  # PRDLST_NM, RAWMTRL_NM 등
+    content_hash = models.CharField(max_length=40, verbose_name="내용 해시")
+    last_seen_at = models.DateTimeField(verbose_name="마지막 확인 시각")
+
+    class Meta:
+        db_table = "source_records"
+        constraints = [
+            models.UniqueConstraint(fields=["source", "key"], name="uniq_source_record_key"),
+        ]
+
+    def __str__(self):
+        return f"{self.source}:{self.key}"
+
+class CoupangLinkCache(models.Model):
+    # CoupangRedirectView 용 쿠팡 검색 결과(rank 1 상품 URL) 캐시 - products.coupang 에서 관리
+    product = models.OneToOneField(
+        Product,
+        on_delete=models.CASCADE,
+        related_name="coupang_link",
+    )
+    keyword = models.TextField(verbose_name="검색 키워드")
+    url = models.TextField(verbose_name="상품 URL", null=True, blank=True)  # 검색 결과 없음이면 null
+    resolved_at = models.DateTimeField(verbose_name="조회 시각")
+
+    class Meta:
+        db_table = "coupang_link_cache"
+
+    def __str__(self):
+        return f"{self.product_id} - {self.url}"
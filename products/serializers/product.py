@@ -8,7 +8,7 @@ from rest_framework import serializers
 
 from products.models import Product, ProductImage, Ingredient, ProductIngredient, OtherIngredient, \
     ProductOtherIngredient, ProductRequest, IngredientGuide
-from products.utils import upload_images_to_s3
+from products.utils import refresh_cover_images, upload_images_to_s3
 
 
 class ProductIngredientInputSerializer(serializers.Serializer):
@@ -60,6 +60,7 @@ class ProductCreateSerializer(serializers.ModelSerializer):
         if images:
             uploaded_images = upload_images_to_s3(product, images)
             ProductImage.objects.bulk_create(uploaded_images)
+            refresh_cover_images([product.id])
 
         # --- Ingredients 저장 ---
         if ingredients_input:
@@ -92,7 +93,7 @@ class ProductIngredientReadSerializer(serializers.ModelSerializer):
 class ProductImageSerializer(serializers.ModelSerializer):
     class Meta:
         model = ProductImage
-        fields = ("url",)
+        fields = ("url", "thumbnail_url")
 
 class ProductReadSerializer(serializers.ModelSerializer):
     images = ProductImageSerializer(many=True, read_only=True)
@@ -170,7 +171,7 @@ class ProductDetailSerializer(serializers.ModelSerializer):
         review_images = ReviewImage.objects.filter(
             review__product=obj
         ).order_by('-id')[:6]
-        return [{'url': img.url} for img in review_images]
+        return [{'url': img.url, 'thumbnail_url': img.thumbnail_url} for img in review_images]
 
     def get_reviewCount(self, obj):
         return obj.reviews.count()
@@ -232,7 +233,7 @@ class ProductDetailSerializer(serializers.ModelSerializer):
         return False
 
 class ProductRankingSerializer(serializers.ModelSerializer):
-    image = serializers.SerializerMethodField()
+    image = serializers.CharField(source="cover_image_url", read_only=True)
     rankDiff = serializers.SerializerMethodField()
     reviewCount = serializers.SerializerMethodField()
     reviewAvg = serializers.SerializerMethodField()
@@ -241,10 +242,6 @@ class ProductRankingSerializer(serializers.ModelSerializer):
         model = Product
         fields = ("id", "name", "image", "company", "reviewCount", "reviewAvg", "rankDiff")
 
-    def get_image(self, obj):
-        first_image = obj.images.order_by("id").first()
-        return first_image.url if first_image else None
-
     def get_rankDiff(self, obj):
         current_ranks = self.context.get("current_ranks", {})
         prev_ranks = self.context.get("prev_ranks", {})
@@ -265,17 +262,13 @@ class ProductRankingSerializer(serializers.ModelSerializer):
         return round(float(value), 2) if value is not None else None
 
 class ProductsListSerializer(serializers.ModelSerializer):
-    image = serializers.SerializerMethodField()
+    image = serializers.CharField(source="cover_image_url", read_only=True)
     reviewCount = serializers.SerializerMethodField()
     reviewAvg = serializers.SerializerMethodField()
     class Meta:
         model = Product
         fields = ("id", "name", "image", "company", "reviewCount", "reviewAvg")
 
-    def get_image(self, obj):
-        first_image = obj.images.order_by("id").first()
-        return first_image.url if first_image else None
-
     def get_reviewCount(self, obj):
         return obj.reviews.count()
 
@@ -285,7 +278,7 @@ class ProductsListSerializer(serializers.ModelSerializer):
         return round(float(value), 2) if value is not None else None
 
 class ProductSearchSerializer(serializers.ModelSerializer):
-    image = serializers.SerializerMethodField()
+    image = serializers.CharField(source="cover_image_url", read_only=True)
     reviewCount = serializers.SerializerMethodField()
     reviewAvg = serializers.SerializerMethodField()
 
@@ -293,10 +286,6 @@ class ProductSearchSerializer(serializers.ModelSerializer):
         model = Product
         fields = ("id", "name", "image", "company", "reviewCount", "reviewAvg")
 
-    def get_image(self, obj):
-        first_image = obj.images.order_by("id").first()
-        return first_image.url if first_image else None
-
     def get_reviewCount(self, obj):
         return obj.reviews.count()
 
@@ -306,7 +295,7 @@ class ProductSearchSerializer(serializers.ModelSerializer):
         return round(float(value), 2) if value is not None else None
 
 class MainSerializer(serializers.ModelSerializer):
-    image = serializers.SerializerMethodField()
+    image = serializers.CharField(source="cover_image_url", read_only=True)
     reviewCount = serializers.SerializerMethodField()
     reviewAvg = serializers.SerializerMethodField()
 
@@ -314,10 +303,6 @@ class MainSerializer(serializers.ModelSerializer):
         model = Product
         fields = ("id", "name", "image", "company", "reviewCount", "reviewAvg")
 
-    def get_image(self, obj):
-        first_image = obj.images.order_by("id").first()
-        return first_image.url if first_image else None
-
     def get_reviewCount(self, obj):
         return obj.reviews.count()
 
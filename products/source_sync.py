@@ -0,0 +1,121 @@
+"""외부 소스 동기화 변경 감지.
+
+식약처 API 동기화(update_ingredients_from_openapi, 가르시니아 수집)는 매번 전체 레코드를 다시
+파싱·퍼지매칭·저장했다. 여기서는 소스 레코드(PRDLST_NM, RAWMTRL_NM 등 키)별로 원본 내용의
+해시를 SourceRecord 에 남겨 두고, 다음 동기화 때 해시가 같은 레코드는 건너뛴다.
+
+- SourceChanges.check(key, payload): 새 레코드거나 내용이 바뀌었으면 True (full 이면 항상 True)
+- 끝까지 수집했을 때만 removed(이번에 안 보인 키)를 센다(중간 실패를 삭제로 오인하지 않음)
+- 해시는 실제로 DB 에 반영한 뒤에 save() 로 저장한다. 수집과 저장이 나뉜 경우(CSV, ImportJob)는
+  state() 를 같이 넘겨 두었다가 저장 단계에서 save_source_state(state, imported=...) 로 반영한다.
+  imported 에 없는 키(매칭 실패·연결 실패·관리자가 CSV 에서 뺀 제품)는 해시를 지워 다음에 다시 처리한다.
+- 퍼지매칭 결과는 DB 원료 이름에 따라 달라지므로, 매칭 기준 목록의 버전(candidates_version)을
+  version 으로 넘기면 해시에 같이 넣는다. 원료가 추가되면 모든 레코드를 다시 매칭한다.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+
+from django.utils import timezone
+
+from products.models import SourceRecord
+
+# 가르시니아 제품 수집(crawl_garcinia_to_csv 커맨드, 어드민 CSV 임포트) - PRDLST_NM 기준
+GARCINIA_SOURCE = "foodsafety:I0030:garcinia"
+
+
+def content_hash(payload):
+    """JSON 직렬화 가능한 값의 내용 해시(키 순서 무관)."""
+    data = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+def candidates_version(names):
+    """퍼지매칭 기준 이름 목록의 버전(순서·중복 무관)."""
+    return content_hash(sorted(set(names)))
+
+
+@dataclass
+class SyncDelta:
+    added: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+    def __str__(self):
+        return (
+            f"추가 {self.added} / 변경 {self.changed} / "
+            f"변경 없음 {self.unchanged} / 사라짐 {self.removed}"
+        )
+
+
+class SourceChanges:
+    """한 번의 동기화에서 소스 레코드 변경을 추적한다."""
+
+    def __init__(self, source, full=False, version=None):
+        self.source = source
+        self.full = full
+        self.version = version
+        self.delta = SyncDelta()
+        self._known = dict(
+            SourceRecord.objects.filter(source=source).values_list("key", "content_hash")
+        )
+        self._seen = {}
+        self._removed = []
+
+    def check(self, key, payload):
+        """레코드를 본 것으로 기록하고, 다시 처리해야 하면 True."""
+        digest = content_hash(payload if self.version is None else [self.version, payload])
+        if key not in self._seen:
+            known = self._known.get(key)
+            if known is None:
+                self.delta.added += 1
+            elif known != digest:
+                self.delta.changed += 1
+            else:
+                self.delta.unchanged += 1
+        self._seen[key] = digest
+        return self.full or self._known.get(key) != digest
+
+    def finish(self):
+        """끝까지 수집했을 때 호출 — 이번에 보이지 않은 키를 사라진 것으로 센다."""
+        self._removed = [key for key in self._known if key not in self._seen]
+        self.delta.removed = len(self._removed)
+        return self.delta
+
+    def state(self):
+        return {"source": self.source, "hashes": self._seen, "removed": self._removed}
+
+    def save(self):
+        save_source_state(self.state())
+
+
+def save_source_state(state, imported=None, batch_size=1000):
+    """state() 결과를 SourceRecord 에 반영한다(본 레코드는 upsert, 사라진 레코드는 삭제).
+
+    imported 가 주어지면 그 키만 저장하고, 본 레코드 중 나머지는 해시를 지운다
+    (DB 에 다 들어가지 못한 레코드를 다음 동기화에서 "변경 없음"으로 건너뛰지 않도록).
+    """
+    if not state:
+        return
+    source = state["source"]
+    hashes = state.get("hashes", {})
+    removed = list(state.get("removed") or [])
+    if imported is not None:
+        removed += [key for key in hashes if key not in imported]
+        hashes = {key: digest for key, digest in hashes.items() if key in imported}
+    now = timezone.now()
+    records = [
+        SourceRecord(source=source, key=key, content_hash=digest, last_seen_at=now)
+        for key, digest in hashes.items()
+    ]
+    SourceRecord.objects.bulk_create(
+        records,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=["source", "key"],
+        update_fields=["content_hash", "last_seen_at"],
+    )
+    for i in range(0, len(removed), batch_size):
+        SourceRecord.objects.filter(source=source, key__in=removed[i:i + batch_size]).delete()
@@ -0,0 +1,233 @@
+"""공개 API 쿼리 수·지연 시간 회귀 테스트.
+
+합성 카탈로그(제품·카테고리·성분·이미지·일별 조회수·리뷰·리뷰 이미지·차단)를 만든 뒤 메인/랭킹/
+리스트/검색/상세/리뷰 목록/별점 통계 API 를 여러 번 호출해, 엔드포인트별 최대 쿼리 수와 p95 지연
+시간이 예산을 넘지 않는지 확인한다. 쿼리 수 예산은 카탈로그 크기와 무관해야 한다(N+1 방지).
+
+환경 변수:
+    PERF_CATALOG_SIZE   제품 수 (기본값: 100)
+    PERF_REPEAT         엔드포인트별 측정 횟수 (기본값: 20, 첫 호출 워밍업은 제외)
+    PERF_P95_BUDGET_MS  p95 지연 시간 예산(ms) (기본값: 500 - 테스트 DB·CI 환경 기준의 느슨한 값)
+    PERF_RESULTS_PATH   결과 JSON 경로 (기본값: perf_results.json)
+
+사용법:
+    python manage.py test products
+"""
+
+import json
+import math
+import os
+import time
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from products.models import (
+    BigCategory,
+    CategoryProduct,
+    Ingredient,
+    IngredientGuide,
+    MiddleCategory,
+    Product,
+    ProductDailyView,
+    ProductImage,
+    ProductIngredient,
+    SmallCategory,
+)
+from review.models import BlockedReview, BlockedUser, Review, ReviewImage
+from users.models import User
+
+CATALOG_SIZE = int(os.environ.get("PERF_CATALOG_SIZE", 100))
+REPEAT = int(os.environ.get("PERF_REPEAT", 20))
+P95_BUDGET_MS = float(os.environ.get("PERF_P95_BUDGET_MS", 500))
+RESULTS_PATH = os.environ.get("PERF_RESULTS_PATH", "perf_results.json")
+
+# 엔드포인트별 최대 쿼리 수 (로그인 사용자 기준 - 인증은 force_authenticate 라 사용자 조회 없음)
+# 현재 측정값이 기준선이다. 목록 API 의 제품별 리뷰 수·평균 별점 조회처럼 페이지 크기(10)에
+# 비례하는 쿼리는 포함돼 있지만 카탈로그 크기와는 무관하다. 줄였으면 예산도 같이 낮춘다.
+QUERY_BUDGETS = {
+    "main": 29,
+    "ranking": 22,
+    "list": 22,
+    "search": 22,
+    "detail": 16,
+    "reviews": 6,
+    "rating": 8,
+}
+
+DAYS_OF_VIEWS = 30
+REVIEWS_PER_PRODUCT = 5
+REVIEWERS = 20
+
+
+def _p95(samples):
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(len(ordered) * 0.95) - 1)]
+
+
+class PublicApiPerformanceTest(TestCase):
+    results = {}
+
+    @classmethod
+    def setUpTestData(cls):
+        big = BigCategory.objects.create(category="다이어트 보조제")
+        middle = MiddleCategory.objects.create(category="건강기능식품", big_category=big)
+        smalls = [
+            SmallCategory.objects.create(category=name, middle_category=middle)
+            for name in ("전체", "체지방 관리", "혈당 관리", "장 건강")
+        ]
+        ingredients = Ingredient.objects.bulk_create(
+            [Ingredient(name=f"성분{i}", effect=["효과"]) for i in range(20)]
+        )
+        IngredientGuide.objects.bulk_create(
+            [IngredientGuide(ingredient=ingredient, keyPoints=["포인트"]) for ingredient in ingredients]
+        )
+
+        products = Product.objects.bulk_create(
+            [
+                Product(
+                    name=f"가르시니아 제품{i}",
+                    company=f"회사{i % 10}",
+                    productType="건강기능식품",
+                    cover_image_url=f"https://example.com/{i}/thumb.jpg",
+                )
+                for i in range(CATALOG_SIZE)
+            ]
+        )
+        CategoryProduct.objects.bulk_create(
+            [
+                CategoryProduct(product=product, category=smalls[1 + i % 3])
+                for i, product in enumerate(products)
+            ]
+        )
+        ProductIngredient.objects.bulk_create(
+            [
+                ProductIngredient(product=product, ingredient=ingredients[(i + k) % 20], amount="100mg")
+                for i, product in enumerate(products)
+                for k in range(3)
+            ]
+        )
+        ProductImage.objects.bulk_create(
+            [
+                ProductImage(product=product, url=f"https://example.com/{product.id}/{k}.jpg")
+                for product in products
+                for k in range(2)
+            ]
+        )
+        today = timezone.now().date()
+        ProductDailyView.objects.bulk_create(
+            [
+                ProductDailyView(product=product, date=today - timedelta(days=d), views=(i * 7 + d) % 50)
+                for i, product in enumerate(products)
+                for d in range(DAYS_OF_VIEWS)
+            ]
+        )
+
+        cls.user = User.objects.create_user(email="perf@example.com", password="pw", nickname="perf")
+        reviewers = [
+            User.objects.create_user(email=f"reviewer{i}@example.com", password="pw", nickname=f"리뷰어{i}")
+            for i in range(REVIEWERS)
+        ]
+        reviews = Review.objects.bulk_create(
+            [
+                Review(user=reviewers[(i + k) % REVIEWERS], product=product, rate=1 + (i + k) % 5, review="좋아요")
+                for i, product in enumerate(products)
+                for k in range(REVIEWS_PER_PRODUCT)
+            ]
+        )
+        ReviewImage.objects.bulk_create(
+            [ReviewImage(review=review, url=f"https://example.com/r/{review.id}.jpg") for review in reviews[::2]]
+        )
+        BlockedUser.objects.create(blocker_user_id=cls.user.id, blocked_user_id=reviewers[0].id)
+        BlockedReview.objects.bulk_create(
+            [BlockedReview(user_id=cls.user.id, blocked_review=review) for review in reviews[1::10]]
+        )
+        cls.product = products[0]
+        cls.first_review = min(r.id for r in reviews if r.product_id == cls.product.id)
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        with open(RESULTS_PATH, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "catalog": {
+                        "products": CATALOG_SIZE,
+                        "daily_views": CATALOG_SIZE * DAYS_OF_VIEWS,
+                        "reviews": CATALOG_SIZE * REVIEWS_PER_PRODUCT,
+                    },
+                    "repeat": REPEAT,
+                    "p95_budget_ms": P95_BUDGET_MS,
+                    "endpoints": cls.results,
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def measure(self, name, url, params=None):
+        response = self.client.get(url, params)  # 워밍업(캐시 채우기)
+        self.assertEqual(response.status_code, 200, response.content[:200])
+
+        queries = 0
+        samples = []
+        for _ in range(REPEAT):
+            with CaptureQueriesContext(connection) as ctx:
+                started = time.perf_counter()
+                response = self.client.get(url, params)
+                samples.append((time.perf_counter() - started) * 1000)
+            self.assertEqual(response.status_code, 200)
+            queries = max(queries, len(ctx.captured_queries))
+
+        result = {
+            "queries": queries,
+            "query_budget": QUERY_BUDGETS[name],
+            "p50_ms": round(sorted(samples)[len(samples) // 2], 2),
+            "p95_ms": round(_p95(samples), 2),
+        }
+        type(self).results[name] = result
+        self.assertLessEqual(
+            queries,
+            QUERY_BUDGETS[name],
+            f"{name}: 쿼리 {queries}개 (예산 {QUERY_BUDGETS[name]}개)\n"
+            + "\n".join(q["sql"] for q in ctx.captured_queries),
+        )
+        self.assertLessEqual(
+            result["p95_ms"], P95_BUDGET_MS, f"{name}: p95 {result['p95_ms']}ms (예산 {P95_BUDGET_MS}ms)"
+        )
+
+    def test_main(self):
+        self.measure("main", reverse("product_main"))
+
+    def test_ranking(self):
+        self.measure("ranking", reverse("product_ranking"), {"period": "monthly", "category": "체지방 관리"})
+
+    def test_list(self):
+        self.measure("list", reverse("product_list"), {"bigCategory": "다이어트 보조제", "sort": "review_desc"})
+
+    def test_search(self):
+        self.measure("search", reverse("product_search"), {"word": "가르시니아"})
+
+    def test_detail(self):
+        self.measure("detail", reverse("product_detail", args=[self.product.id]))
+
+    def test_reviews(self):
+        self.measure(
+            "reviews",
+            reverse("get-reviews", args=[self.product.id, self.first_review]),
+            {"sort": "high"},
+        )
+
+    def test_rating(self):
+        self.measure("rating", reverse("product-rating-stats", args=[self.product.id]))
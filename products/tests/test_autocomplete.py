@@ -0,0 +1,41 @@
+"""성분/기타 원료 자동완성 인덱스(products.autocomplete)."""
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from products.autocomplete import NameIndex, normalize
+from products.models import Ingredient
+
+
+class AutocompleteTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        Ingredient.objects.bulk_create(
+            [Ingredient(name=name) for name in ("L-카르니틴", "가르시니아 캄보지아", "비타민 B-6", "녹차추출물")]
+        )
+        self.index = NameIndex(Ingredient)
+
+    def labels(self, q):
+        return [item["label"] for item in self.index.search(q)]
+
+    def test_normalize_matches_select2_rule(self):
+        self.assertEqual(normalize(" L-카르니틴 "), "l카르니틴")
+        self.assertEqual(normalize("비타민 B-6 (피리독신)"), "비타민b6피리독신")
+        self.assertEqual(normalize("ㄱ"), "")
+        self.assertEqual(normalize(None), "")
+
+    def test_punctuation_is_ignored(self):
+        self.assertEqual(self.labels("l카르"), ["L-카르니틴"])
+        self.assertEqual(self.labels("L-카르"), ["L-카르니틴"])
+        self.assertEqual(self.labels("b6"), ["비타민 B-6"])
+        self.assertEqual(self.labels("비타민B-6"), ["비타민 B-6"])
+
+    def test_prefix_before_infix(self):
+        Ingredient.objects.create(name="차전자피")
+        self.index.invalidate()
+        self.assertEqual(self.labels("차"), ["차전자피", "녹차추출물"])
+
+    def test_invalidate_reloads(self):
+        self.assertEqual(self.labels("홍삼"), [])
+        Ingredient.objects.create(name="홍삼")  # post_save 가 버전을 바꾼다
+        self.assertEqual(self.labels("홍삼"), ["홍삼"])
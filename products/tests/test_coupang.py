@@ -0,0 +1,106 @@
+"""쿠팡 리다이렉트 링크 캐시(products.coupang) - 검색 API 응답별 캐시 저장 규칙."""
+
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+import requests
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from products import coupang
+from products.models import CoupangLinkCache, Product
+
+GOOD_URL = "https://link.coupang.com/good"
+
+
+class FakeResponse:
+    def __init__(self, status_code, products=None):
+        self.status_code = status_code
+        self._products = products or []
+
+    def json(self):
+        return {"data": {"productData": [{"productUrl": url} for url in self._products]}}
+
+
+def api_returns(status_code, *urls):
+    return mock.patch.object(coupang.http_client, "get", return_value=FakeResponse(status_code, urls))
+
+
+class CoupangLinkCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.product = Product.objects.create(name="가르시니아", company="다시", productType="건강기능식품")
+        self.keyword = coupang.product_keyword(self.product.company, self.product.name)
+
+    def cache_link(self, url, keyword=None, age=timedelta(0)):
+        return CoupangLinkCache.objects.create(
+            product=self.product,
+            keyword=keyword or self.keyword,
+            url=url,
+            resolved_at=timezone.now() - age,
+        )
+
+    def test_found_url_is_cached(self):
+        with api_returns(200, GOOD_URL):
+            self.assertEqual(coupang.get_product_url(self.product.id, self.keyword), GOOD_URL)
+        self.assertEqual(CoupangLinkCache.objects.get(product=self.product).url, GOOD_URL)
+
+    def test_empty_result_on_200_is_cached(self):
+        with api_returns(200):
+            self.assertIsNone(coupang.get_product_url(self.product.id, self.keyword))
+        link = CoupangLinkCache.objects.get(product=self.product)
+        self.assertIsNone(link.url)
+        self.assertTrue(coupang.is_link_fresh(link))
+
+    def test_api_error_on_miss_raises_without_caching(self):
+        for status in (401, 429, 503):
+            with api_returns(status), self.assertRaises(coupang.CoupangAPIError):
+                coupang.get_product_url(self.product.id, self.keyword)
+        self.assertFalse(CoupangLinkCache.objects.exists())
+
+    def test_network_error_is_api_error(self):
+        with mock.patch.object(
+            coupang.http_client, "get", side_effect=requests.ConnectionError("down")
+        ), self.assertRaises(coupang.CoupangAPIError):
+            coupang.search_top_product_url(self.keyword)
+
+    def test_failed_refresh_keeps_existing_url(self):
+        link = self.cache_link(GOOD_URL, age=timedelta(days=2))
+        with api_returns(429), self.assertRaises(coupang.CoupangAPIError):
+            coupang.resolve_product_url(self.product.id, self.keyword)
+
+        link.refresh_from_db()
+        self.assertEqual(link.url, GOOD_URL)
+        self.assertFalse(coupang.is_link_fresh(link))  # 다음 요청에서 다시 갱신 시도
+
+    def test_failed_lookup_after_rename_falls_back_to_existing_url(self):
+        link = self.cache_link(GOOD_URL, keyword="예전 이름")
+        with api_returns(500), self.assertLogs("products.coupang", "WARNING"):
+            self.assertEqual(coupang.get_product_url(self.product.id, self.keyword), GOOD_URL)
+        link.refresh_from_db()
+        self.assertEqual((link.keyword, link.url), ("예전 이름", GOOD_URL))
+
+    def test_redirect_view(self):
+        url = reverse("product_coupang_redirect", args=[self.product.id])
+        with api_returns(503):
+            self.assertEqual(self.client.get(url).status_code, 503)
+        with api_returns(200):
+            self.assertEqual(self.client.get(url).status_code, 404)
+        CoupangLinkCache.objects.all().delete()
+        with api_returns(200, GOOD_URL):
+            response = self.client.get(url)
+        self.assertRedirects(response, GOOD_URL, fetch_redirect_response=False)
+
+    def test_warm_command_does_not_overwrite_on_error(self):
+        link = self.cache_link(GOOD_URL, age=timedelta(days=2))
+        out = StringIO()
+        with api_returns(429):
+            call_command("warm_coupang_links", "--per-minute", "60000", stdout=out)
+
+        link.refresh_from_db()
+        self.assertEqual(link.url, GOOD_URL)
+        self.assertIn("실패 1건", out.getvalue())
@@ -0,0 +1,82 @@
+"""export_data 커맨드 - 형식(json/ndjson)·gzip·청크·id 증분 export 를 다시 읽어 확인한다."""
+
+import gzip
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from products.models import Ingredient, Product, ProductIngredient
+
+
+class ExportDataTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.ingredients = [
+            Ingredient.objects.create(name=f"성분{i}", effect=[f"효과{i}"]) for i in range(3)
+        ]
+        cls.products = [
+            Product.objects.create(name=f"제품{i}", company="회사", productType="건강기능식품")
+            for i in range(3)
+        ]
+        for ingredient, amount in ((cls.ingredients[0], "1g"), (cls.ingredients[1], "")):
+            ProductIngredient.objects.create(product=cls.products[0], ingredient=ingredient, amount=amount)
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+
+    def export(self, *args):
+        out = StringIO()
+        call_command(
+            "export_data", "--output-dir", str(self.dir), "--chunk-size", "2", *args, stdout=out
+        )
+        return out.getvalue()
+
+    def read(self, name, opener=open):
+        with opener(self.dir / name, "rt", encoding="utf-8") as f:
+            if ".ndjson" in name:
+                return [json.loads(line) for line in f]
+            return json.load(f)
+
+    def test_json(self):
+        self.export()
+        ingredients = self.read("ingredients_export.json")
+        products = self.read("products_export.json")
+
+        self.assertEqual([i["name"] for i in ingredients], ["성분0", "성분1", "성분2"])
+        self.assertEqual(ingredients[0]["effect"], ["효과0"])
+        self.assertEqual([p["id"] for p in products], [p.id for p in self.products])
+        self.assertEqual(
+            products[0]["ingredients"],
+            [
+                {"ingredient_id": self.ingredients[0].id, "ingredient_name": "성분0", "amount": "1g"},
+                {"ingredient_id": self.ingredients[1].id, "ingredient_name": "성분1", "amount": ""},
+            ],
+        )
+        self.assertEqual(products[1]["ingredients"], [])
+
+    def test_ndjson_gzip(self):
+        self.export("--format", "ndjson", "--gzip")
+        ingredients = self.read("ingredients_export.ndjson.gz", gzip.open)
+        products = self.read("products_export.ndjson.gz", gzip.open)
+        self.assertEqual(len(ingredients), 3)
+        self.assertEqual([p["name"] for p in products], ["제품0", "제품1", "제품2"])
+
+    def test_json_gzip(self):
+        self.export("--gzip")
+        self.assertEqual(len(self.read("products_export.json.gz", gzip.open)), 3)
+
+    def test_incremental_export(self):
+        output = self.export(
+            "--since-ingredient-id", str(self.ingredients[1].id),
+            "--since-product-id", str(self.products[2].id),
+        )
+        ingredients = self.read("ingredients_export.json")
+        self.assertEqual([i["id"] for i in ingredients], [self.ingredients[2].id])
+        self.assertEqual(self.read("products_export.json"), [])  # 빈 배열도 올바른 JSON
+        self.assertIn(f"마지막 id {self.ingredients[2].id}", output)
@@ -0,0 +1,92 @@
+"""식약처 기능성 원료 페이지 동기화(sync_ingredient_page)와 관리자 성분 이름 중복 방지."""
+
+from django.contrib.messages import get_messages
+from django.test import TestCase
+from django.urls import reverse
+
+from products.api.import_ingredients import sync_ingredient_page
+from products.models import Ingredient
+
+
+def api_row(name, effect="", low="", high=""):
+    return {
+        "RAWMTRL_NM": name,
+        "PRIMARY_FNCLTY": effect,
+        "IFTKN_ATNT_MATR_CN": "",
+        "DAY_INTK_LOWLIMIT": low,
+        "DAY_INTK_HIGHLIMIT": high,
+    }
+
+
+class SyncIngredientPageTest(TestCase):
+    def test_creates_and_collapses_duplicates_last_row_wins(self):
+        result = sync_ingredient_page([
+            api_row("홍삼(진세노사이드)", effect="면역력"),
+            api_row("아연", low="2,400 (mg)"),
+            api_row("홍삼", effect="피로 개선"),
+        ])
+        self.assertEqual(result, (2, 0, 0))
+        self.assertEqual(Ingredient.objects.count(), 2)
+        self.assertEqual(Ingredient.objects.get(name="홍삼").effect, ["피로 개선"])
+        self.assertEqual(Ingredient.objects.get(name="아연").minRecommended, "2400mg")
+
+    def test_unchanged_rows_are_skipped(self):
+        rows = [api_row("홍삼", effect="피로 개선"), api_row("아연", low="2,400 (mg)")]
+        sync_ingredient_page(rows)
+        with self.assertNumQueries(1):  # 기존 행 조회만
+            self.assertEqual(sync_ingredient_page(rows), (0, 0, 2))
+
+    def test_changed_row_updates_in_place(self):
+        sync_ingredient_page([api_row("홍삼", effect="피로 개선")])
+        ginseng = Ingredient.objects.get(name="홍삼")
+        ginseng.mainIngredient = "진세노사이드"  # 동기화 대상이 아닌 필드는 그대로
+        ginseng.save()
+
+        self.assertEqual(sync_ingredient_page([api_row("홍삼", effect="면역력")]), (0, 1, 0))
+        ginseng.refresh_from_db()
+        self.assertEqual((ginseng.effect, ginseng.mainIngredient), (["면역력"], "진세노사이드"))
+
+    def test_rows_without_name_are_ignored(self):
+        self.assertEqual(sync_ingredient_page([api_row(""), api_row("(괄호만)")]), (0, 0, 0))
+        self.assertFalse(Ingredient.objects.exists())
+
+
+class IngredientDuplicateNameTest(TestCase):
+    def setUp(self):
+        session = self.client.session
+        session["admin_authenticated"] = True
+        session.save()
+        self.existing = Ingredient.objects.create(name="홍삼")
+        self.other = Ingredient.objects.create(name="아연")
+
+    def messages(self, response):
+        return [str(m) for m in get_messages(response.wsgi_request)]
+
+    def test_admin_home_create_rejects_duplicate(self):
+        response = self.client.post(
+            reverse("admin_home_ingredient"), {"action": "create", "name": "홍삼"}
+        )
+        self.assertEqual(Ingredient.objects.filter(name="홍삼").count(), 1)
+        self.assertIn('"홍삼" 성분이 이미 존재합니다.', self.messages(response))
+
+    def test_legacy_create_rejects_duplicate(self):
+        response = self.client.post(
+            reverse("admin_ingredient_form"),
+            {
+                "name": "홍삼",
+                "mainIngredient": "진세노사이드",
+                "minRecommended": "3mg",
+                "maxRecommended": "80mg",
+                "effect": '["피로 개선"]',
+            },
+        )
+        self.assertEqual(Ingredient.objects.filter(name="홍삼").count(), 1)
+        self.assertIn('"홍삼" 성분이 이미 존재합니다.', self.messages(response))
+
+    def test_legacy_edit_rejects_rename_to_existing(self):
+        response = self.client.post(
+            reverse("admin_ingredient_edit", args=[self.other.id]), {"name": "홍삼"}
+        )
+        self.other.refresh_from_db()
+        self.assertEqual(self.other.name, "아연")
+        self.assertIn('"홍삼" 성분이 이미 존재합니다.', self.messages(response))
@@ -0,0 +1,96 @@
+"""데이터를 채우거나 합치는 products 마이그레이션 - 이전 상태로 되돌린 뒤 적용해 확인한다."""
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+
+class MigrationTestCase(TransactionTestCase):
+    migrate_from = None  # [(app, migration)]
+    migrate_to = None
+
+    def setUp(self):
+        executor = MigrationExecutor(connection)
+        self.latest = executor.loader.graph.leaf_nodes()
+        executor.migrate(self.migrate_from)
+        self.old_apps = executor.loader.project_state(self.migrate_from).apps
+        self.addCleanup(self.migrate_latest)
+
+    def migrate(self):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(self.migrate_to)
+        return executor.loader.project_state(self.migrate_to).apps
+
+    def migrate_latest(self):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(self.latest)
+
+
+class CoverImageBackfillTest(MigrationTestCase):
+    migrate_from = [("products", "0030_productimage_thumbnail_url")]
+    migrate_to = [("products", "0031_product_cover_image_url")]
+
+    def test_cover_image_is_filled_from_first_image(self):
+        Product = self.old_apps.get_model("products", "Product")
+        ProductImage = self.old_apps.get_model("products", "ProductImage")
+        with_thumb = Product.objects.create(name="썸네일", company="회사", productType="건강기능식품")
+        original_only = Product.objects.create(name="원본", company="회사", productType="건강기능식품")
+        no_image = Product.objects.create(name="없음", company="회사", productType="건강기능식품")
+        ProductImage.objects.create(
+            product=with_thumb,
+            url="https://cdn.example.com/a.jpg",
+            thumbnail_url="https://cdn.example.com/a_t.webp",
+        )
+        ProductImage.objects.create(product=with_thumb, url="https://cdn.example.com/b.jpg")
+        ProductImage.objects.create(product=original_only, url="https://cdn.example.com/c.jpg")
+
+        Product = self.migrate().get_model("products", "Product")
+        covers = dict(Product.objects.values_list("id", "cover_image_url"))
+        self.assertEqual(covers[with_thumb.id], "https://cdn.example.com/a_t.webp")
+        self.assertEqual(covers[original_only.id], "https://cdn.example.com/c.jpg")
+        self.assertIsNone(covers[no_image.id])
+
+
+class MergeDuplicateIngredientNamesTest(MigrationTestCase):
+    migrate_from = [("products", "0032_coupanglinkcache")]
+    migrate_to = [("products", "0033_ingredient_name_unique")]
+
+    def test_duplicates_are_merged_into_lowest_id(self):
+        Ingredient = self.old_apps.get_model("products", "Ingredient")
+        IngredientGuide = self.old_apps.get_model("products", "IngredientGuide")
+        Product = self.old_apps.get_model("products", "Product")
+        ProductIngredient = self.old_apps.get_model("products", "ProductIngredient")
+
+        keep = Ingredient.objects.create(name="비타민C")
+        dup_a = Ingredient.objects.create(name="비타민C")
+        dup_b = Ingredient.objects.create(name="비타민C")
+        other = Ingredient.objects.create(name="아연")
+        IngredientGuide.objects.create(ingredient=dup_a, keyPoints=["가이드"])
+
+        both = Product.objects.create(name="둘 다", company="회사", productType="건강기능식품")
+        only_dup = Product.objects.create(name="중복만", company="회사", productType="건강기능식품")
+        ProductIngredient.objects.create(product=both, ingredient=keep, amount="")
+        with_amount = ProductIngredient.objects.create(product=both, ingredient=dup_a, amount="100mg")
+        ProductIngredient.objects.create(product=both, ingredient=dup_b, amount="200mg")
+        moved = ProductIngredient.objects.create(product=only_dup, ingredient=dup_b, amount="50mg")
+        ProductIngredient.objects.create(product=only_dup, ingredient=other, amount="1mg")
+
+        apps = self.migrate()
+        Ingredient = apps.get_model("products", "Ingredient")
+        IngredientGuide = apps.get_model("products", "IngredientGuide")
+        ProductIngredient = apps.get_model("products", "ProductIngredient")
+
+        merged = Ingredient.objects.filter(name="비타민C").values_list("id", flat=True)
+        self.assertEqual(list(merged), [keep.id])
+        self.assertEqual(IngredientGuide.objects.get(ingredient_id=keep.id).keyPoints, ["가이드"])
+        links = ProductIngredient.objects.order_by("product_id", "ingredient_id")
+        self.assertEqual(
+            list(links.values_list("id", "product_id", "ingredient_id", "amount")),
+            [
+                (with_amount.id, both.id, keep.id, "100mg"),
+                (moved.id, only_dup.id, keep.id, "50mg"),
+                (links.get(ingredient_id=other.id).id, only_dup.id, other.id, "1mg"),
+            ],
+        )
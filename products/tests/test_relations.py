@@ -0,0 +1,160 @@
+"""제품 연결(성분·기타 원료·카테고리) 차이 반영 - products.utils.sync_product_relations."""
+
+from django.test import TestCase
+from django.urls import reverse
+
+from products.admin_views import _edited_links
+from products.models import (
+    BigCategory,
+    CategoryProduct,
+    Ingredient,
+    MiddleCategory,
+    OtherIngredient,
+    Product,
+    ProductIngredient,
+    ProductOtherIngredient,
+    SmallCategory,
+)
+from products.utils import sync_product_relations
+
+
+class SyncProductRelationsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.ingredients = Ingredient.objects.bulk_create([Ingredient(name=f"성분{i}") for i in range(4)])
+        cls.others = OtherIngredient.objects.bulk_create([OtherIngredient(name=f"기타{i}") for i in range(3)])
+        big = BigCategory.objects.create(category="대분류")
+        middle = MiddleCategory.objects.create(category="중분류", big_category=big)
+        cls.categories = [
+            SmallCategory.objects.create(category=f"소분류{i}", middle_category=middle) for i in range(3)
+        ]
+
+    def setUp(self):
+        self.product = Product.objects.create(name="제품", company="회사", productType="건강기능식품")
+        self.i0, self.i1, self.i2, self.i3 = (i.id for i in self.ingredients)
+
+    def link_ingredient(self, ingredient_id, amount):
+        return ProductIngredient.objects.create(product=self.product, ingredient_id=ingredient_id, amount=amount)
+
+    def amounts(self):
+        return dict(
+            ProductIngredient.objects.filter(product=self.product).values_list("ingredient_id", "amount")
+        )
+
+    def sync(self, ingredients=(), others=(), categories=()):
+        return sync_product_relations(self.product, ingredients, others, categories)
+
+    def test_added(self):
+        result = self.sync(
+            [(self.i0, "100mg"), (str(self.i1), " 50mg ")],
+            [self.others[0].id],
+            [self.categories[0].id],
+        )
+        self.assertEqual(result["ingredients"], {"added": 2, "removed": 0, "changed": 0})
+        self.assertEqual(result["other_ingredients"]["added"], 1)
+        self.assertEqual(result["categories"]["added"], 1)
+        self.assertEqual(self.amounts(), {self.i0: "100mg", self.i1: "50mg"})
+
+    def test_removed(self):
+        self.link_ingredient(self.i0, "100mg")
+        self.link_ingredient(self.i1, "50mg")
+        ProductOtherIngredient.objects.create(product=self.product, other_ingredient=self.others[0])
+        CategoryProduct.objects.create(product=self.product, category=self.categories[0])
+
+        result = self.sync([(self.i0, "100mg")])
+        self.assertEqual(result["ingredients"], {"added": 0, "removed": 1, "changed": 0})
+        self.assertEqual(result["other_ingredients"]["removed"], 1)
+        self.assertEqual(result["categories"]["removed"], 1)
+        self.assertEqual(self.amounts(), {self.i0: "100mg"})
+
+    def test_amount_changed(self):
+        self.link_ingredient(self.i0, "100mg")
+        result = self.sync([(self.i0, "200mg")])
+        self.assertEqual(result["ingredients"], {"added": 0, "removed": 0, "changed": 1})
+        self.assertEqual(self.amounts(), {self.i0: "200mg"})
+
+    def test_duplicates(self):
+        # 입력 중복은 처음 것(용량 있는 것 우선), 기존 중복 연결은 하나만 남긴다
+        self.link_ingredient(self.i0, "100mg")
+        self.link_ingredient(self.i0, "100mg")
+        CategoryProduct.objects.create(product=self.product, category=self.categories[0])
+        CategoryProduct.objects.create(product=self.product, category=self.categories[0])
+
+        result = self.sync(
+            [(self.i0, "100mg"), (self.i0, "999mg"), (self.i1, ""), (self.i1, "5mg")],
+            categories=[self.categories[0].id, self.categories[0].id],
+        )
+        self.assertEqual(result["ingredients"], {"added": 1, "removed": 1, "changed": 0})
+        self.assertEqual(result["categories"], {"added": 0, "removed": 1, "changed": 0})
+        self.assertEqual(self.amounts(), {self.i0: "100mg", self.i1: "5mg"})
+        self.assertEqual(CategoryProduct.objects.filter(product=self.product).count(), 1)
+
+    def test_ids_preserved(self):
+        kept = self.link_ingredient(self.i0, "100mg")
+        edited = self.link_ingredient(self.i1, "50mg")
+        other = ProductOtherIngredient.objects.create(product=self.product, other_ingredient=self.others[0])
+        category = CategoryProduct.objects.create(product=self.product, category=self.categories[0])
+
+        self.sync(
+            [(self.i0, "100mg"), (self.i1, "60mg"), (self.i2, "1g")],
+            [self.others[0].id, self.others[1].id],
+            [self.categories[0].id],
+        )
+        rows = {pi.ingredient_id: pi.id for pi in ProductIngredient.objects.filter(product=self.product)}
+        self.assertEqual(rows[self.i0], kept.id)
+        self.assertEqual(rows[self.i1], edited.id)
+        self.assertTrue(ProductOtherIngredient.objects.filter(id=other.id).exists())
+        self.assertTrue(CategoryProduct.objects.filter(id=category.id).exists())
+
+    def test_empty_amount_keeps_existing_row(self):
+        # CSV 임포트는 용량 없이 연결을 만든다 - 그대로 다시 저장해도 지우지 않는다
+        blank = self.link_ingredient(self.i0, "")
+        result = self.sync([(self.i0, ""), (self.i1, "")])
+        self.assertEqual(result["ingredients"], {"added": 0, "removed": 0, "changed": 0})
+        self.assertEqual(list(ProductIngredient.objects.filter(product=self.product)), [blank])
+
+    def test_invalid_ids_are_ignored(self):
+        result = self.sync([("abc", "1mg"), (999999, "1mg")], ["x", 999999], [""])
+        self.assertEqual(
+            result,
+            {
+                "ingredients": {"added": 0, "removed": 0, "changed": 0},
+                "other_ingredients": {"added": 0, "removed": 0, "changed": 0},
+                "categories": {"added": 0, "removed": 0, "changed": 0},
+            },
+        )
+
+    def test_edited_links(self):
+        current = [(1, self.i0, "100mg"), (2, self.i1, ""), (3, self.i2, "1g")]
+        links = _edited_links(
+            current,
+            delete_ids=["3"],
+            edited_rows=[("1", self.i0, "200mg"), ("2", self.i1, "")],
+            new_rows=[(self.i3, "5mg"), (self.i3, "")],
+        )
+        self.assertEqual(links, [(str(self.i0), "200mg"), (self.i1, ""), (str(self.i3), "5mg")])
+
+
+class LegacyProductEditTest(TestCase):
+    def setUp(self):
+        session = self.client.session
+        session["admin_authenticated"] = True
+        session.save()
+        self.product = Product.objects.create(name="제품", company="회사", productType="건강기능식품")
+        self.ingredient = Ingredient.objects.create(name="성분")
+
+    def test_unchanged_submit_keeps_blank_amount_links(self):
+        link = ProductIngredient.objects.create(product=self.product, ingredient=self.ingredient, amount="")
+        response = self.client.post(
+            reverse("admin_product_edit", args=[self.product.id]),
+            {
+                "name": "제품",
+                "company": "회사",
+                "productType": "건강기능식품",
+                "existing_product_ingredient_ids[]": [link.id],
+                "existing_ingredient_ids[]": [self.ingredient.id],
+                "existing_amounts[]": [""],
+            },
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(list(ProductIngredient.objects.filter(product=self.product)), [link])
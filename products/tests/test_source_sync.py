@@ -0,0 +1,119 @@
+"""외부 소스 동기화 변경 감지(products.source_sync)와 가르시니아 임포트의 해시 저장 규칙."""
+
+from django.test import TestCase
+from django.urls import reverse
+
+from products.models import ImportJob, Ingredient, Product, ProductIngredient, SourceRecord
+from products.source_sync import (
+    GARCINIA_SOURCE,
+    SourceChanges,
+    candidates_version,
+    save_source_state,
+)
+
+SOURCE = "test:source"
+
+
+class SourceChangesTest(TestCase):
+    def sync(self, records, full=False, version=None, complete=True):
+        changes = SourceChanges(SOURCE, full=full, version=version)
+        todo = [key for key, payload in records.items() if changes.check(key, payload)]
+        if complete:
+            changes.finish()
+        changes.save()
+        return changes.delta, todo
+
+    def test_first_sync_adds_everything(self):
+        delta, todo = self.sync({"a": {"v": 1}, "b": {"v": 2}})
+        self.assertEqual((delta.added, delta.changed, delta.unchanged, delta.removed), (2, 0, 0, 0))
+        self.assertEqual(todo, ["a", "b"])
+        self.assertEqual(SourceRecord.objects.filter(source=SOURCE).count(), 2)
+
+    def test_unchanged_records_are_skipped(self):
+        self.sync({"a": {"v": 1}, "b": {"v": 2}})
+        delta, todo = self.sync({"a": {"v": 1}, "b": {"v": 3}, "c": {"v": 4}})
+        self.assertEqual((delta.added, delta.changed, delta.unchanged), (1, 1, 1))
+        self.assertEqual(todo, ["b", "c"])
+
+    def test_full_reprocesses_unchanged(self):
+        self.sync({"a": {"v": 1}})
+        delta, todo = self.sync({"a": {"v": 1}}, full=True)
+        self.assertEqual(delta.unchanged, 1)
+        self.assertEqual(todo, ["a"])
+
+    def test_removed_only_counted_when_finished(self):
+        self.sync({"a": {"v": 1}, "b": {"v": 2}})
+        delta, _ = self.sync({"a": {"v": 1}}, complete=False)
+        self.assertEqual(delta.removed, 0)
+        self.assertTrue(SourceRecord.objects.filter(source=SOURCE, key="b").exists())
+
+        delta, _ = self.sync({"a": {"v": 1}})
+        self.assertEqual(delta.removed, 1)
+        self.assertFalse(SourceRecord.objects.filter(source=SOURCE, key="b").exists())
+
+    def test_candidate_set_change_reprocesses(self):
+        self.assertEqual(candidates_version(["b", "a", "a"]), candidates_version(["a", "b"]))
+        self.sync({"a": {"v": 1}}, version=candidates_version(["비타민C"]))
+        _, todo = self.sync({"a": {"v": 1}}, version=candidates_version(["비타민C"]))
+        self.assertEqual(todo, [])
+        _, todo = self.sync({"a": {"v": 1}}, version=candidates_version(["비타민C", "새 원료"]))
+        self.assertEqual(todo, ["a"])
+
+    def test_save_only_imported_keys(self):
+        self.sync({"a": {"v": 1}, "b": {"v": 2}})
+        changes = SourceChanges(SOURCE)
+        for key in ("a", "b"):
+            changes.check(key, {"v": 9})
+        save_source_state(changes.state(), imported={"a"})
+
+        # b 는 DB 에 다 들어가지 못함 → 이전 해시도 지워 다음에 새 레코드로 처리
+        keys = SourceRecord.objects.filter(source=SOURCE).values_list("key", flat=True)
+        self.assertEqual(list(keys), ["a"])
+        _, todo = self.sync({"a": {"v": 9}, "b": {"v": 9}})
+        self.assertEqual(todo, ["b"])
+
+
+class GarciniaImportSourceStateTest(TestCase):
+    """어드민 CSV 임포트 - 제품과 성분 연결이 모두 들어간 제품만 해시를 저장한다."""
+
+    def setUp(self):
+        session = self.client.session
+        session["admin_authenticated"] = True
+        Ingredient.objects.create(name="가르시니아캄보지아 추출물")
+        changes = SourceChanges(GARCINIA_SOURCE)
+        for name in ("완전", "매칭실패", "연결실패", "CSV에서 뺌"):
+            changes.check(name, {"spec": name})
+        changes.finish()
+        job = ImportJob.objects.create(
+            products=[
+                {"name": name, "company": "회사", "productType": "건강기능식품", "category_ids": ""}
+                for name in ("완전", "매칭실패", "연결실패")
+            ],
+            ingredients={"가르시니아캄보지아 추출물": "", "모르는원료": ""},
+            pi_rows=[
+                {"product_name": "완전", "ingredient_name": "가르시니아캄보지아 추출물",
+                 "amount": "1g", "method": "exact"},
+                {"product_name": "매칭실패", "ingredient_name": "모르는원료",
+                 "amount": "", "method": "unmatched"},
+                {"product_name": "연결실패", "ingredient_name": "없는원료",
+                 "amount": "", "method": "fuzzy(91%)"},
+            ],
+            source_state=changes.state(),
+        )
+        session["import_job_id"] = job.id
+        session.save()
+
+    def test_skips_unmatched_failed_and_removed_products(self):
+        response = self.client.post(reverse("admin_import_csv"), {"action": "import"})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(Product.objects.count(), 3)
+        self.assertEqual(ProductIngredient.objects.count(), 2)
+
+        saved = SourceRecord.objects.filter(source=GARCINIA_SOURCE).values_list("key", flat=True)
+        self.assertEqual(list(saved), ["완전"])
+
+        # 원료를 추가하고 다시 수집하면 나머지는 "변경 없음"이 아니라 다시 처리된다
+        changes = SourceChanges(GARCINIA_SOURCE)
+        todo = [name for name in ("완전", "매칭실패", "연결실패", "CSV에서 뺌")
+                if changes.check(name, {"spec": name})]
+        self.assertEqual(todo, ["매칭실패", "연결실패", "CSV에서 뺌"])
@@ -1,9 +1,21 @@
-import boto3, uuid, os
-from typing import List
+import io
+from typing import Dict, Iterable, List, Optional, Tuple
 from django.utils import timezone
-from django.db.models import F
-from django.conf import settings
-from products.models import Product, ProductDailyView, ProductImage
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from common.storage import build_public_url, key_from_public_url, upload_files
+from common.thumbnails import create_thumbnails
+from products.models import (
+    CategoryProduct,
+    Ingredient,
+    OtherIngredient,
+    Product,
+    ProductDailyView,
+    ProductImage,
+    ProductIngredient,
+    ProductOtherIngredient,
+    SmallCategory,
+)
 
 def record_view(product: Product):
     # 누적 증가
@@ -16,43 +28,181 @@ def record_view(product: Product):
     daily_view.views = F("views") + 1
     daily_view.save()
 
+def refresh_cover_images(product_ids):
+    """
+    제품들의 cover_image_url(첫 이미지의 카드용 URL)을 UPDATE 한 번으로 다시 계산한다.
+    ProductImage 를 생성/삭제/썸네일 갱신한 뒤 호출한다 (bulk_create·queryset delete 는 save 를 거치지 않음).
+    """
+    first_image = (
+        ProductImage.objects.filter(product_id=OuterRef("pk"))
+        .order_by("id")
+        .annotate(card_url=Coalesce("thumbnail_url", "url"))
+        .values("card_url")[:1]
+    )
+    return Product.objects.filter(id__in=product_ids).update(
+        cover_image_url=Subquery(first_image)
+    )
+
+def _public_url_or_none(key: Optional[str]) -> Optional[str]:
+    return build_public_url(key) if key else None
+
+def upload_product_images(images: List) -> List[Tuple[str, Optional[str]]]:
+    """
+    제품 이미지 파일을 S3에 병렬 업로드하고, 들고 있는 파일로 썸네일도 바로 만든다.
+
+    Returns:
+        [(원본 URL, 썸네일 URL 또는 None), ...] (입력 순서 유지)
+    """
+    if not images:
+        return []
+
+    # upload_fileobj 가 업로드 후 파일을 닫으므로 썸네일용 원본 바이트를 미리 읽어 둔다
+    sources = [io.BytesIO(image.read()) for image in images]
+    for image in images:
+        image.seek(0)
+
+    keys = upload_files(images, prefix="products")
+    thumb_keys = create_thumbnails(keys, sources=sources)
+    return [
+        (build_public_url(key), _public_url_or_none(thumb_key))
+        for key, thumb_key in zip(keys, thumb_keys)
+    ]
+
+def make_product_thumbnails(urls: List[str]) -> List[Optional[str]]:
+    """이미 S3에 올라간(직접 업로드 등) 제품 이미지 URL들의 썸네일 URL 목록 (실패는 None)"""
+    thumb_keys = create_thumbnails([key_from_public_url(url) for url in urls])
+    return [_public_url_or_none(thumb_key) for thumb_key in thumb_keys]
+
 def upload_images_to_s3(product: Product, images: List) -> List[ProductImage]:
     """
-    제품 이미지를 S3에 업로드하고 ProductImage 객체 리스트를 반환
+    제품 이미지를 S3에 병렬 업로드하고 ProductImage 객체 리스트를 반환
+    (공용 S3 클라이언트 재사용, 썸네일 포함, 저장은 호출 측에서 bulk_create)
     
     Args:
         product: 이미지가 속할 제품 객체
         images: 업로드할 이미지 파일 리스트
         
     Returns:
-        ProductImage 객체 리스트
+        ProductImage 객체 리스트 (입력 순서 유지)
     """
-    if not images:
+    return [
+        ProductImage(product=product, url=url, thumbnail_url=thumbnail_url)
+        for url, thumbnail_url in upload_product_images(images)
+    ]
+
+def _valid_ids(model, raw_ids: Iterable) -> List[int]:
+    """raw_ids 중 실제로 있는 id 만 입력 순서대로(중복 제거) — 쿼리 1번"""
+    ids = []
+    for raw in raw_ids:
+        try:
+            value = int(str(raw).strip())
+        except ValueError:
+            continue
+        if value not in ids:
+            ids.append(value)
+    if not ids:
         return []
-    
-    s3 = boto3.client(
-        "s3",
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name=settings.AWS_S3_REGION_NAME,
-    )
-    
-    uploaded_images = []
-    for img in images:
-        # 확장자만 추출 (안전)
-        _, ext = os.path.splitext(img.name)
-        ext = ext.lower()
-
-        # 완전히 안전한 파일명
-        filename = f"products/{uuid.uuid4().hex}{ext}"
-
-        s3.upload_fileobj(
-            img,
-            settings.AWS_STORAGE_BUCKET_NAME,
-            filename,
-            ExtraArgs={"ContentType": img.content_type},
-        )
-        url = f"{settings.CLOUDFRONT_DOMAIN}/{filename}"
-        uploaded_images.append(ProductImage(product=product, url=url))
-    
-    return uploaded_images
+    existing = set(model.objects.filter(id__in=ids).values_list("id", flat=True))
+    return [i for i in ids if i in existing]
+
+def _sync_links(queryset, model, fk_name: str, product: Product, wanted_ids: List[int]) -> Dict[str, int]:
+    """product 의 단순 연결(fk 하나)을 wanted_ids 와 같아지게 — 추가분 bulk_create, 빠진 것 DELETE 1번"""
+    current = {}
+    stale = []
+    for link_id, target_id in queryset.values_list("id", fk_name):
+        if target_id in current:
+            stale.append(link_id)  # 같은 대상 중복 연결 정리
+        else:
+            current[target_id] = link_id
+    wanted = set(wanted_ids)
+    stale += [link_id for target_id, link_id in current.items() if target_id not in wanted]
+    added = [
+        model(product=product, **{fk_name: target_id})
+        for target_id in wanted_ids
+        if target_id not in current
+    ]
+    if stale:
+        model.objects.filter(id__in=stale).delete()
+    if added:
+        model.objects.bulk_create(added)
+    return {"added": len(added), "removed": len(stale), "changed": 0}
+
+def sync_product_relations(
+    product: Product,
+    ingredients: Iterable[Tuple[str, str]],
+    other_ingredient_ids: Iterable,
+    category_ids: Iterable,
+) -> Dict[str, Dict[str, int]]:
+    """
+    제품의 성분(+용량)/기타 원료/카테고리 연결을 주어진 목록과 같아지도록 차이만 반영한다.
+    (기존 연결을 다 지우고 다시 만들지 않으므로 바뀌지 않은 연결 행은 id 가 유지된다)
+
+    - 없는 id 는 무시하고, 같은 대상이 여러 번 오면 처음 것만 쓴다(용량이 빈 것보다 있는 것 우선).
+    - 용량이 빈 성분은 새로 추가하지 않지만, 이미 연결돼 있으면 기존 행(용량 포함)을 그대로 둔다.
+      CSV 임포트로 들어온 용량 없는 연결이 수정 폼 저장만으로 지워지지 않게 하기 위함이다.
+    - 추가는 bulk_create, 용량 변경은 bulk_update, 제거는 DELETE ... IN 한 번.
+    - 트랜잭션은 호출 측에서 연다.
+
+    Args:
+        product: 대상 제품
+        ingredients: (성분 id, 용량) 목록 — 용량이 비면 "있으면 유지"
+        other_ingredient_ids: 기타 원료 id 목록
+        category_ids: 소분류 id 목록
+
+    Returns:
+        {"ingredients"|"other_ingredients"|"categories": {"added", "removed", "changed"}}
+    """
+    amounts = {}
+    for ingredient_id, amount in ingredients:
+        amount = (amount or "").strip()
+        try:
+            ingredient_id = int(str(ingredient_id).strip())
+        except ValueError:
+            continue
+        if not amounts.get(ingredient_id):
+            amounts[ingredient_id] = amount
+    ingredient_ids = _valid_ids(Ingredient, amounts)
+
+    current = {}
+    stale = []
+    for pi in ProductIngredient.objects.filter(product=product).only("id", "ingredient_id", "amount"):
+        if pi.ingredient_id in current:
+            stale.append(pi.id)
+        else:
+            current[pi.ingredient_id] = pi
+    stale += [pi.id for ingredient_id, pi in current.items() if ingredient_id not in amounts]
+    changed = []
+    added = []
+    for ingredient_id in ingredient_ids:
+        pi = current.get(ingredient_id)
+        amount = amounts[ingredient_id]
+        if pi is None:
+            if amount:
+                added.append(ProductIngredient(product=product, ingredient_id=ingredient_id, amount=amount))
+        elif amount and pi.amount != amount:
+            pi.amount = amount
+            changed.append(pi)
+    if stale:
+        ProductIngredient.objects.filter(id__in=stale).delete()
+    if changed:
+        ProductIngredient.objects.bulk_update(changed, ["amount"])
+    if added:
+        ProductIngredient.objects.bulk_create(added)
+
+    return {
+        "ingredients": {"added": len(added), "removed": len(stale), "changed": len(changed)},
+        "other_ingredients": _sync_links(
+            ProductOtherIngredient.objects.filter(product=product),
+            ProductOtherIngredient,
+            "other_ingredient_id",
+            product,
+            _valid_ids(OtherIngredient, other_ingredient_ids),
+        ),
+        "categories": _sync_links(
+            CategoryProduct.objects.filter(product=product),
+            CategoryProduct,
+            "category_id",
+            product,
+            _valid_ids(SmallCategory, category_ids),
+        ),
+    }
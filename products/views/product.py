@@ -17,8 +17,9 @@ from products.models import Product, SmallCategory, ProductIngredient, ProductOt
 from products.serializers import ProductDetailSerializer, ProductSearchSerializer, ProductRankingSerializer, \
     ProductsListSerializer, MainSerializer, ProductRequestSerializer
 from products.serializers.ingredient import MainRandomGuideSerializer
-from products.utils import record_view, upload_images_to_s3
-from products.coupang import search_top_product_url, debug_search
+from common.sampling import random_sample
+from products.utils import record_view, refresh_cover_images, upload_images_to_s3
+from products.coupang import CoupangAPIError, debug_search, get_product_url, product_keyword
 
 # 제품 상세 (GET /products/<id>/)
 class ProductDetailView(generics.RetrieveAPIView):
@@ -431,10 +432,10 @@ class MainView(APIView):
             .order_by("-todayViews", "id")[:10]
         )
 
-        random_guides = (
-            IngredientGuide.objects
-            .select_related("ingredient")
-            .order_by("?")[:10]
+        random_guides = random_sample(
+            IngredientGuide.objects.select_related("ingredient"),
+            10,
+            cache_key="sample:ingredient_guides",
         )
 
         guide_serializer = MainRandomGuideSerializer(random_guides, many=True)
@@ -488,6 +489,7 @@ class UploadProductImageView(APIView):
         # S3 업로드 및 ProductImage 저장
         uploaded_images = upload_images_to_s3(product, images)
         ProductImage.objects.bulk_create(uploaded_images)
+        refresh_cover_images([product.id])
 
         return Response({"success": True, "message": f"{len(uploaded_images)}개의 이미지가 등록되었습니다."}, status=201)
 
@@ -518,7 +520,7 @@ class CoupangRedirectView(APIView):
             OpenApiParameter("id", OpenApiTypes.INT, OpenApiParameter.PATH, description="제품 ID"),
             OpenApiParameter("debug", OpenApiTypes.INT, OpenApiParameter.QUERY, description="1이면 리다이렉트 없이 API 요청·응답 JSON 반환", required=False),
         ],
-        responses={200: None, 302: None, 404: None},
+        responses={200: None, 302: None, 404: None, 503: None},
         tags=["제품"],
     )
     def get(self, request, id):
@@ -526,12 +528,16 @@ class CoupangRedirectView(APIView):
         if not product:
             raise NotFound("존재하지 않는 제품입니다.")
 
-        keyword = f"{product['company']} {product['name']}"
+        keyword = product_keyword(product["company"], product["name"])
 
         if request.query_params.get("debug"):
             return Response({"keyword": keyword, **debug_search(keyword)})
 
-        product_url = search_top_product_url(keyword)
+        # 캐시된 검색 결과로 바로 리다이렉트 (만료 시 백그라운드 갱신)
+        try:
+            product_url = get_product_url(id, keyword)
+        except CoupangAPIError:
+            return Response({"error": "쿠팡 검색을 잠시 사용할 수 없습니다."}, status=503)
 
         if not product_url:
             return Response({"error": "쿠팡 검색 결과가 없습니다."}, status=404)
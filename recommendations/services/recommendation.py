@@ -100,16 +100,15 @@ def _get_products_by_ingredient(ingredient_id: int) -> list:
         .distinct()
     )
 
-    products = Product.objects.filter(id__in=product_ids).prefetch_related("images")
+    products = Product.objects.filter(id__in=product_ids)
 
     result = []
     for p in products:
-        images = [img.url for img in p.images.all()]
         result.append({
             "id": p.id,
             "name": p.name,
             "company": p.company,
-            "thumbnail": images[0] if images else None,
+            "thumbnail": p.cover_image_url,
         })
 
     return result
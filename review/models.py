@@ -34,10 +34,16 @@ class ReviewImage(models.Model):
         verbose_name="리뷰 아이디"
     )
     url = models.URLField(verbose_name="이미지 URL")
+    # url 과 같은 형식(S3 키)으로 저장. 아직 생성 전이면 null
+    thumbnail_url = models.URLField(null=True, blank=True, verbose_name="썸네일 URL")
 
     class Meta:
         db_table = "reviewImages"
 
+    @property
+    def card_url(self):
+        return self.thumbnail_url or self.url
+
     def __str__(self):
         return f"Image {self.id} - Review {self.review.id}"
         
@@ -4,7 +4,7 @@ from .models import Review, ReviewImage, ReviewReport, ReviewReportReason
 class ReviewImageSerializer(serializers.ModelSerializer):
     class Meta:
         model = ReviewImage
-        fields = ['id', 'url']
+        fields = ['id', 'url', 'thumbnail_url']
 
 class ReviewSerializer(serializers.ModelSerializer):
     images = ReviewImageSerializer(many=True, read_only=True)
@@ -147,8 +147,7 @@ class ProductInfoSerializer(serializers.Serializer):
     
     def get_image(self, obj):
         """첫 번째 이미지 URL을 반환"""
-        first_image = obj.images.first()
-        return first_image.url if first_image else ''
+        return obj.cover_image_url or ''
 
 class MyPageReviewSerializer(serializers.ModelSerializer):
     """마이페이지용 리뷰 시리얼라이저"""
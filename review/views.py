@@ -7,7 +7,6 @@ from django.utils.decorators import method_decorator
 from django.utils import timezone
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
 from drf_spectacular.types import OpenApiTypes
-from products.models import ProductImage
 from .serializers import (
     ReviewSerializer, 
     ReviewListResponseSerializer, 
@@ -30,6 +29,8 @@ from .serializers import (
 from .models import Review, ReviewImage, ReviewReport, ReviewReportReason, BlockedReview, BlockedUser
 from django.shortcuts import get_object_or_404
 from .utils import S3Uploader
+from common.sampling import random_sample
+from common.storage import delete_object
 from django.db.models import Prefetch
 
 @method_decorator(csrf_exempt, name='dispatch')
@@ -407,7 +408,7 @@ class ReviewListView(GenericAPIView):
                     'id': product.id,
                     'name': product.name,
                     'company': product.company,
-                    'image': product.images.first().url if product.images.exists() else ''
+                    'image': product.cover_image_url or ''
                 },
                 'reviews': []
             }
@@ -422,13 +423,12 @@ class ReviewListView(GenericAPIView):
             review_data['user_nickname'] = review.user.nickname
             reviews_data.append(review_data)
         
-        # 제품 정보 구성 (첫 번째 이미지 가져오기 - 이미 prefetch됨)
-        first_image = product.images.first()
+        # 제품 정보 구성 (대표 이미지는 Product.cover_image_url)
         product_info = {
             'id': product.id,
             'name': product.name,
             'company': product.company,
-            'image': first_image.url if first_image else ''
+            'image': product.cover_image_url or ''
         }
         
         # 최종 응답 데이터 구성
@@ -548,49 +548,39 @@ class ReviewImageView(GenericAPIView):
         # 유효성 검사된 URL들 가져오기
         original_urls = serializer.validated_data['urls']
         
-        # S3 업로더 초기화
-        s3_uploader = S3Uploader()
-        
-        presigned_urls = []
-        created_images = []
-        
-        for original_url in original_urls:
-            try:
-                # 파일명에서 확장자 추출
-                import os
-                
-                # 파일명에서 확장자 추출 (URL이든 파일명이든 상관없이)
-                file_extension = os.path.splitext(original_url)[1] or '.jpg'
-                
-                # presigned URL 생성 (백엔드에서 파일명 생성)
-                presigned_data = s3_uploader.generate_presigned_url(
-                    product_id=review.product_id,
-                    review_id=review_id,
-                    file_extension=file_extension
-                )
-                
-                # ReviewImage 객체 생성 (DB에 저장) - 파일명만 저장
-                review_image = ReviewImage.objects.create(
-                    review=review,
-                    url=presigned_data['filename']
-                )
-                created_images.append(review_image)
-                
-                presigned_urls.append({
-                    'image_id': review_image.id,
-                    'original_url': original_url,
-                    'upload_url': presigned_data['upload_url'],
-                    'final_url': presigned_data['final_url'],
-                    'filename': presigned_data['filename']  # DB에 저장된 파일명
-                })
-                
-            except Exception as e:
-                # 실패한 경우 생성된 이미지들 삭제
-                for img in created_images:
-                    img.delete()
-                return Response({
-                    'error': f'Presigned URL 생성 실패: {str(e)}'
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        # 파일명에서 확장자 추출 (URL이든 파일명이든 상관없이)
+        import os
+        file_extensions = [os.path.splitext(url)[1] or '.jpg' for url in original_urls]
+
+        try:
+            # presigned URL 일괄 생성 (백엔드에서 파일명 생성, 공용 S3 클라이언트 재사용)
+            presigned_list = S3Uploader().generate_presigned_urls(
+                product_id=review.product_id,
+                review_id=review_id,
+                file_extensions=file_extensions
+            )
+        except Exception as e:
+            return Response({
+                'error': f'Presigned URL 생성 실패: {str(e)}'
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        # ReviewImage 객체 일괄 생성 (DB에 저장) - 파일명만 저장
+        created_images = ReviewImage.objects.bulk_create([
+            ReviewImage(review=review, url=presigned_data['filename'])
+            for presigned_data in presigned_list
+        ])
+
+        presigned_urls = [
+            {
+                'image_id': review_image.id,
+                'original_url': original_url,
+                'upload_url': presigned_data['upload_url'],
+                'final_url': presigned_data['final_url'],
+                'filename': presigned_data['filename']  # DB에 저장된 파일명
+            }
+            for original_url, presigned_data, review_image
+            in zip(original_urls, presigned_list, created_images)
+        ]
         
         # 응답 데이터를 Serializer로 직렬화
         response_data = {
@@ -683,11 +673,9 @@ class ReviewImageDeleteView(GenericAPIView):
         
         try:
             # S3에서 파일 삭제
-            s3_uploader = S3Uploader()
-            s3_uploader.s3_client.delete_object(
-                Bucket=s3_uploader.bucket_name,
-                Key=image_to_delete.url  # DB에 저장된 파일명
-            )
+            delete_object(image_to_delete.url)  # DB에 저장된 파일명
+            if image_to_delete.thumbnail_url:
+                delete_object(image_to_delete.thumbnail_url)
             
             # DB에서 레코드 삭제
             filename = image_to_delete.url
@@ -826,7 +814,10 @@ class ProductReviewImagesView(GenericAPIView):
             images = list(images_query.filter(id__lt=image_id)[:20])
         
         # 4. 이미지 데이터 구성 (ID와 URL 포함)
-        image_data = [{'id': image.id, 'url': image.url} for image in images]
+        image_data = [
+            {'id': image.id, 'url': image.url, 'thumbnail_url': image.thumbnail_url}
+            for image in images
+        ]
         
         # 5. 전체 이미지 개수 조회
         total_images = images_query.count()
@@ -1233,8 +1224,7 @@ class UserReviewsView(GenericAPIView):
         reviews_query = Review.objects.filter(
             user=request.user
         ).select_related('product').prefetch_related(
-            Prefetch('images', queryset=ReviewImage.objects.all()),
-            Prefetch('product__images', queryset=ProductImage.objects.all())
+            Prefetch('images', queryset=ReviewImage.objects.all())
         ).order_by('-date', '-id')
         
         # review_id가 0이면 처음 요청으로 판단
@@ -1587,33 +1577,19 @@ class RandomProductsView(GenericAPIView):
         """
         from products.models import Product
         from review.models import Review
-        import random
         
-        # 현재 사용자가 리뷰를 작성한 제품 ID 목록
+        # 현재 사용자가 리뷰를 작성한 제품 ID 목록 (서브쿼리로 SQL 에서 제외)
         reviewed_product_ids = Review.objects.filter(
             user=request.user
         ).values_list('product_id', flat=True)
         
-        # 사용자가 리뷰를 작성하지 않은 제품만 필터링
-        unreviewed_products = Product.objects.exclude(
-            id__in=reviewed_product_ids
-        ).prefetch_related('images')
-        
-        # 제품이 없는 경우 처리
-        total_products = unreviewed_products.count()
-        print(f"DEBUG: 리뷰 작성 안한 제품 수: {total_products}")
-        
-        if total_products == 0:
-            response_data = {
-                'success': True,
-                'products': []
-            }
-            return Response(response_data, status=status.HTTP_200_OK)
-        
-        # 랜덤하게 3개 선택 (제품 수가 3개 미만이면 전체 선택)
-        sample_size = min(3, total_products)
-        print(f"DEBUG: 선택할 제품 수: {sample_size}")
-        random_products = random.sample(list(unreviewed_products), sample_size)
+        # 리뷰하지 않은 제품 중 랜덤 3개 (제품 수가 3개 미만이면 전체, 없으면 빈 배열)
+        random_products = random_sample(
+            Product.objects.all(),
+            3,
+            cache_key='sample:products',
+            exclude_ids=reviewed_product_ids,
+        )
         
         # 응답 데이터 구성
         response_data = {
@@ -1622,12 +1598,11 @@ class RandomProductsView(GenericAPIView):
         }
         
         for product in random_products:
-            first_image = product.images.first()
             product_data = {
                 'id': product.id,
                 'name': product.name,
                 'company': product.company,
-                'image': first_image.url if first_image else ''
+                'image': product.cover_image_url or ''
             }
             response_data['products'].append(product_data)
         
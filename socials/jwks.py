@@ -0,0 +1,117 @@
+"""JWKS(JSON Web Key Set) 공개키 저장소.
+
+Apple 로그인마다 https://appleid.apple.com/auth/keys 를 받아 JWK 를 다시 파싱하던 것을
+프로세스 단위 캐시로 바꾼다.
+
+- 파싱된 공개키를 kid 별로 보관하고, 응답의 Cache-Control max-age(없으면 Expires)로
+  만료 시각을 정한다(MIN_TTL~MAX_TTL 로 제한, 헤더가 없으면 DEFAULT_TTL).
+- 만료됐지만 kid 가 있으면 기존 키를 바로 쓰고 백그라운드 스레드에서 갱신한다.
+- 모르는 kid(키 교체 직후)면 즉시 다시 받는다. 동시에 들어온 요청은 락으로 한 번만
+  받고(single-flight), 없는 kid 로 반복 요청해도 MIN_REFRESH_INTERVAL 안에는 다시 받지 않는다.
+- fetcher 를 주입하거나 load() 로 로컬 JWKS 를 넣어 네트워크 없이 테스트할 수 있다.
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+from jwt.algorithms import RSAAlgorithm
+
+from common import http_client
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 60 * 60  # 캐시 헤더가 없을 때 1시간
+MIN_TTL = 5 * 60
+MAX_TTL = 24 * 60 * 60
+MIN_REFRESH_INTERVAL = 60  # 모르는 kid 로 인한 재요청 최소 간격(초)
+FETCH_TIMEOUT = 5  # (초)
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+def _http_fetch(url: str) -> Tuple[dict, Mapping[str, str]]:
+    response = http_client.get(url, service="apple-jwks", timeout=FETCH_TIMEOUT)
+    response.raise_for_status()
+    return response.json(), response.headers
+
+
+def ttl_from_headers(headers: Mapping[str, str]) -> int:
+    """Cache-Control max-age 또는 Expires 로 캐시 유효 시간(초)을 계산한다."""
+    ttl = None
+    match = _MAX_AGE_RE.search(headers.get("Cache-Control", "") or "")
+    if match:
+        ttl = int(match.group(1))
+    elif headers.get("Expires"):
+        try:
+            ttl = int(parsedate_to_datetime(headers["Expires"]).timestamp() - time.time())
+        except (TypeError, ValueError):
+            ttl = None
+    if ttl is None:
+        return DEFAULT_TTL
+    return max(MIN_TTL, min(MAX_TTL, ttl))
+
+
+class JWKSKeyStore:
+    def __init__(self, url: str, fetcher: Optional[Callable[[str], Tuple[dict, Mapping]]] = None):
+        self.url = url
+        self._fetcher = fetcher or _http_fetch
+        self._keys: Dict[str, object] = {}
+        self._expires_at = 0.0
+        self._fetched_at = 0.0
+        self._refresh_lock = threading.Lock()
+        self._background = None
+
+    def load(self, jwks: dict, ttl: int = DEFAULT_TTL):
+        """JWKS 문서를 파싱해 키 집합을 통째로 교체한다(테스트에서는 로컬 JWKS 주입용)."""
+        keys = {}
+        for jwk in jwks.get("keys", []):
+            if jwk.get("kty") != "RSA" or "kid" not in jwk:
+                continue
+            keys[jwk["kid"]] = RSAAlgorithm.from_jwk(json.dumps(jwk))
+        now = time.time()
+        self._keys = keys
+        self._fetched_at = now
+        self._expires_at = now + ttl
+
+    def refresh(self):
+        """JWKS 를 다시 받아 교체한다. 이미 다른 스레드가 받는 중이면 끝날 때까지 기다린다."""
+        started = time.time()
+        with self._refresh_lock:
+            if self._fetched_at >= started:
+                return  # 기다리는 사이 다른 스레드가 갱신함
+            jwks, headers = self._fetcher(self.url)
+            self.load(jwks, ttl_from_headers(headers))
+
+    def _refresh_in_background(self):
+        if self._background and self._background.is_alive():
+            return
+
+        def run():
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("JWKS 백그라운드 갱신 실패: %s", self.url)
+
+        self._background = threading.Thread(target=run, daemon=True)
+        self._background.start()
+
+    def get_key(self, kid: str):
+        """kid 에 해당하는 공개키를 반환한다. 갱신 후에도 없으면 KeyError."""
+        key = self._keys.get(kid)
+        if key is not None:
+            if time.time() >= self._expires_at:
+                self._refresh_in_background()
+            return key
+
+        # 모르는 kid: 최근에 받았으면 다시 받지 않는다(없는 kid 로 인한 폭주 방지)
+        if time.time() - self._fetched_at >= MIN_REFRESH_INTERVAL or not self._keys:
+            self.refresh()
+        key = self._keys.get(kid)
+        if key is None:
+            raise KeyError(kid)
+        return key
@@ -1,2 +1,119 @@
+import json
+import time
+from unittest import mock
 
-# Create your tests here.
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.test import SimpleTestCase, override_settings
+from jwt.algorithms import RSAAlgorithm
+
+from socials import jwks, utils
+from socials.jwks import JWKSKeyStore, ttl_from_headers
+
+APPLE_ISSUER = "https://appleid.apple.com"
+
+
+def _make_key(kid):
+    """(kid, 개인키, 공개 JWK dict) — 로컬 JWKS 픽스처용 RSA 키."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": kid, "alg": "RS256", "use": "sig"})
+    return kid, private_key, jwk
+
+
+class FakeJWKSEndpoint:
+    """네트워크 대신 JWKSKeyStore 에 주입하는 fetcher. 받은 횟수를 센다."""
+
+    def __init__(self, *keys, headers=None):
+        self.keys = list(keys)
+        self.headers = headers or {"Cache-Control": "max-age=3600"}
+        self.calls = 0
+
+    def __call__(self, url):
+        self.calls += 1
+        return {"keys": [jwk for _, _, jwk in self.keys]}, self.headers
+
+
+class JWKSKeyStoreTest(SimpleTestCase):
+    def setUp(self):
+        self.key_a = _make_key("kid-a")
+        self.key_b = _make_key("kid-b")
+        self.endpoint = FakeJWKSEndpoint(self.key_a)
+        self.store = JWKSKeyStore("https://example.com/keys", fetcher=self.endpoint)
+
+    def test_first_lookup_fetches_once(self):
+        self.assertIsNotNone(self.store.get_key("kid-a"))
+        self.assertIsNotNone(self.store.get_key("kid-a"))
+        self.assertEqual(self.endpoint.calls, 1)
+
+    def test_unknown_kid_refreshes_after_rotation(self):
+        self.store.get_key("kid-a")
+        self.endpoint.keys = [self.key_a, self.key_b]  # Apple 이 키를 교체함
+
+        now = time.time() + jwks.MIN_REFRESH_INTERVAL
+        with mock.patch("socials.jwks.time.time", return_value=now):
+            self.assertIsNotNone(self.store.get_key("kid-b"))
+        self.assertEqual(self.endpoint.calls, 2)
+
+    def test_unknown_kid_is_not_refetched_within_interval(self):
+        self.store.get_key("kid-a")
+        with self.assertRaises(KeyError):
+            self.store.get_key("kid-missing")
+        with self.assertRaises(KeyError):
+            self.store.get_key("kid-missing")
+        self.assertEqual(self.endpoint.calls, 1)
+
+    def test_expired_known_kid_is_served_and_refreshed_in_background(self):
+        self.store.get_key("kid-a")
+        key = self.store._keys["kid-a"]
+
+        with mock.patch("socials.jwks.time.time", return_value=time.time() + 2 * 3600):
+            self.assertIs(self.store.get_key("kid-a"), key)
+            self.store._background.join(timeout=5)
+        self.assertEqual(self.endpoint.calls, 2)
+
+    def test_load_local_jwks_skips_non_rsa(self):
+        self.store.load({"keys": [self.key_b[2], {"kty": "EC", "kid": "ec"}, {"kty": "RSA"}]})
+        self.assertEqual(list(self.store._keys), ["kid-b"])
+        self.assertEqual(self.endpoint.calls, 0)
+
+    def test_ttl_from_headers(self):
+        self.assertEqual(ttl_from_headers({"Cache-Control": "public, max-age=7200"}), 7200)
+        self.assertEqual(ttl_from_headers({"Cache-Control": "max-age=1"}), jwks.MIN_TTL)
+        self.assertEqual(ttl_from_headers({"Cache-Control": "max-age=9999999"}), jwks.MAX_TTL)
+        self.assertEqual(ttl_from_headers({}), jwks.DEFAULT_TTL)
+
+
+@override_settings(DJANGO_ENV="production", APPLE_CLIENT_ID="kr.dasii.test")
+class VerifyIdentityTokenTest(SimpleTestCase):
+    def setUp(self):
+        self.kid, self.private_key, jwk = _make_key("apple-kid")
+        self.endpoint = FakeJWKSEndpoint((self.kid, self.private_key, jwk))
+        store = JWKSKeyStore(utils.APPLE_PUBLIC_KEY_URL, fetcher=self.endpoint)
+        patcher = mock.patch.object(utils, "apple_key_store", store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _token(self, kid=None, **claims):
+        payload = {
+            "iss": APPLE_ISSUER,
+            "aud": "kr.dasii.test",
+            "sub": "apple-user",
+            "exp": int(time.time()) + 600,
+            **claims,
+        }
+        return jwt.encode(payload, self.private_key, algorithm="RS256", headers={"kid": kid or self.kid})
+
+    def test_valid_token(self):
+        self.assertEqual(utils.verify_identity_token(self._token())["sub"], "apple-user")
+        self.assertEqual(utils.verify_identity_token(self._token())["sub"], "apple-user")
+        self.assertEqual(self.endpoint.calls, 1)
+
+    def test_unknown_kid_is_rejected(self):
+        utils.verify_identity_token(self._token())
+        with self.assertRaisesMessage(ValueError, "kid"):
+            utils.verify_identity_token(self._token(kid="other-kid"))
+
+    def test_wrong_audience_is_rejected(self):
+        with self.assertRaises(ValueError):
+            utils.verify_identity_token(self._token(aud="someone.else"))
@@ -1,54 +1,24 @@
 import jwt
-import requests
 from django.conf import settings
 from django.core.mail import send_mail
 from django.utils.html import strip_tags
-import json
 import logging
 
+from socials.jwks import JWKSKeyStore
+
 logger = logging.getLogger(__name__)
 
 APPLE_PUBLIC_KEY_URL = "https://appleid.apple.com/auth/keys"
 
+# kid 별로 파싱된 Apple 공개키를 캐시하는 프로세스 공용 저장소
+apple_key_store = JWKSKeyStore(APPLE_PUBLIC_KEY_URL)
+
 def get_apple_public_key(kid):
-    """Apple 공개키를 가져와서 JWT 검증에 사용할 수 있는 형태로 반환"""
+    """Apple 공개키를 가져와서 JWT 검증에 사용할 수 있는 형태로 반환 (캐시된 JWKS 사용)"""
     try:
-        response = requests.get(APPLE_PUBLIC_KEY_URL)
-        response.raise_for_status()
-        keys = response.json()["keys"]
-        
-        # kid가 일치하는 키 찾기
-        key = next((k for k in keys if k["kid"] == kid), None)
-        if not key:
-            raise ValueError(f"Apple 공개키 조회 실패: kid {kid}를 찾을 수 없습니다")
-        
-        # JWK를 RSA 공개키로 변환
-        try:
-            # PyJWT 2.0+ 방식
-            from jwt.algorithms import RSAAlgorithm
-            return RSAAlgorithm.from_jwk(json.dumps(key))
-        except (ImportError, AttributeError):
-            try:
-                # PyJWT 1.x 방식
-                import jwt.algorithms as algorithms
-                return algorithms.RSAAlgorithm.from_jwk(json.dumps(key))
-            except (ImportError, AttributeError):
-                # 최신 PyJWT 방식
-                from cryptography.hazmat.primitives import serialization
-                from cryptography.hazmat.primitives.asymmetric import rsa
-                import base64
-                
-                # JWK에서 RSA 공개키 구성 요소 추출
-                n = base64.urlsafe_b64decode(key['n'] + '==')
-                e = base64.urlsafe_b64decode(key['e'] + '==')
-                
-                # RSA 공개키 생성
-                public_key = rsa.RSAPublicNumbers(
-                    int.from_bytes(e, 'big'),
-                    int.from_bytes(n, 'big')
-                ).public_key()
-                
-                return public_key
+        return apple_key_store.get_key(kid)
+    except KeyError:
+        raise ValueError(f"Apple 공개키 조회 실패: kid {kid}를 찾을 수 없습니다")
     except Exception as e:
         raise ValueError(f"Apple 공개키 조회 중 오류 발생: {str(e)}")
 
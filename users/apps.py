@@ -3,3 +3,17 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "users"
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+
+        from auth.authentication import invalidate_cached_user
+
+        # 사용자 정보가 바뀌면 JWT 인증 캐시(jti 별 사용자 객체)를 무효화
+        def _invalidate(sender, instance, **kwargs):
+            invalidate_cached_user(instance.pk)
+
+        post_save.connect(_invalidate, sender=self.get_model("User"), weak=False,
+                          dispatch_uid="users.invalidate_jwt_user_cache")
+        post_delete.connect(_invalidate, sender=self.get_model("User"), weak=False,
+                            dispatch_uid="users.invalidate_jwt_user_delete")
@@ -0,0 +1,99 @@
+"""사용자 일괄 삭제.
+
+User.objects.filter(...).delete() 는 Django collector 가 리뷰·리뷰 이미지·신고·설문·저장된 추천을
+모두 메모리로 읽은 뒤 한 트랜잭션에서 지운다. 여기서는
+
+- 사용자를 chunk_size 명씩 나눠 묶음마다 짧은 트랜잭션으로 지우고,
+- 무거운 하위 테이블은 말단(자식)부터 user_id 조건 DELETE 한 번으로 지운다(행을 읽지 않음).
+  시그널이 없고 자식이 먼저 지워진 테이블만 이렇게 지운다.
+- 마지막에 남은 관계(권한 M2M, admin 로그 등)와 User post_delete 시그널은 그 묶음의
+  사용자만 대상으로 ORM delete 가 처리한다.
+- user_id 정수 컬럼으로만 연결된 차단 기록(BlockedReview.user_id, BlockedUser)도 함께 지운다.
+"""
+
+import time
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.db.models import Q
+
+from recommendations.models import SavedRecommendation, SavedRecommendationItem, UserSurvey
+from review.models import BlockedReview, BlockedUser, Review, ReviewImage, ReviewReport
+from users.models import User
+
+CHUNK_SIZE = 500
+
+
+@dataclass
+class DeletionResult:
+    users: int = 0
+    rows: int = 0  # 사용자 포함 삭제된 전체 행 수
+    seconds: float = 0.0
+
+    @property
+    def users_per_second(self):
+        return self.users / self.seconds if self.seconds else 0.0
+
+
+def _raw_delete(queryset):
+    # 행을 읽지 않고 DELETE ... WHERE 한 번으로 지운다(시그널·cascade 처리 없음)
+    return queryset._raw_delete(queryset.db)
+
+
+def _delete_chunk(user_ids):
+    rows = 0
+    reviews = Review.objects.filter(user_id__in=user_ids)
+    with transaction.atomic():
+        rows += _raw_delete(ReviewImage.objects.filter(review__in=reviews))
+        rows += _raw_delete(
+            ReviewReport.objects.filter(Q(review__in=reviews) | Q(reporter_id__in=user_ids))
+        )
+        rows += _raw_delete(
+            BlockedReview.objects.filter(Q(blocked_review__in=reviews) | Q(user_id__in=user_ids))
+        )
+        rows += _raw_delete(
+            BlockedUser.objects.filter(
+                Q(blocker_user_id__in=user_ids) | Q(blocked_user_id__in=user_ids)
+            )
+        )
+        rows += _raw_delete(reviews)
+        rows += _raw_delete(
+            SavedRecommendationItem.objects.filter(recommendation__user_id__in=user_ids)
+        )
+        rows += _raw_delete(SavedRecommendation.objects.filter(user_id__in=user_ids))
+        rows += _raw_delete(UserSurvey.objects.filter(user_id__in=user_ids))
+        deleted, _ = User.objects.filter(id__in=user_ids).delete()
+        rows += deleted
+    return rows
+
+
+def delete_users(queryset, chunk_size=CHUNK_SIZE, on_chunk=None):
+    """queryset 의 사용자를 chunk_size 명씩 지운다.
+
+    Args:
+        queryset: 삭제할 User 쿼리셋 (묶음마다 다시 평가하므로 조건 기반이어야 함)
+        chunk_size: 한 트랜잭션에서 지울 사용자 수
+        on_chunk: 묶음마다 호출(DeletionResult 누적값) - 진행 상황 출력용
+    """
+    result = DeletionResult()
+    started = time.monotonic()
+    last_id = 0
+    while True:
+        user_ids = list(
+            queryset.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:chunk_size]
+        )
+        if not user_ids:
+            break
+        last_id = user_ids[-1]
+        result.rows += _delete_chunk(user_ids)
+        result.users += len(user_ids)
+        result.seconds = time.monotonic() - started
+        if on_chunk:
+            on_chunk(result)
+    result.seconds = time.monotonic() - started
+    return result
+
+
+def delete_user(user):
+    """사용자 한 명을 삭제한다(회원탈퇴)."""
+    return delete_users(User.objects.filter(id=user.id), chunk_size=1)
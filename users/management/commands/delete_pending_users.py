@@ -1,19 +1,39 @@
 from django.core.management import BaseCommand
 from django.utils import timezone
 from datetime import timedelta
+from users.deletion import CHUNK_SIZE, delete_users
 from users.models import User
 
 class Command(BaseCommand):
     help = "약관 미동의 24시간 경과 유저 삭제"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=CHUNK_SIZE,
+            help=f"한 트랜잭션에서 삭제할 유저 수 (기본값: {CHUNK_SIZE})",
+        )
+
     def handle(self, *args, **options):
         cutoff = timezone.now() - timedelta(hours=24)
 
-        delete_count, _ = User.objects.filter(
-            is_terms_agreed = False,
-            created_at__lt = cutoff,
-        ).delete()
+        def report(result):
+            self.stdout.write(
+                f"  {result.users} users / {result.rows} rows ({result.users_per_second:.1f} users/s)"
+            )
+
+        result = delete_users(
+            User.objects.filter(
+                is_terms_agreed = False,
+                created_at__lt = cutoff,
+            ),
+            chunk_size=max(1, options["chunk_size"]),
+            on_chunk=report,
+        )
 
         self.stdout.write(
-            self.style.SUCCESS(f"Deleted {delete_count} users")
+            self.style.SUCCESS(
+                f"Deleted {result.users} users ({result.rows} rows, {result.seconds:.2f}s)"
+            )
         )
@@ -0,0 +1,59 @@
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from users.models import RevokedToken
+
+
+def delete_in_chunks(queryset, chunk_size, pause):
+    """queryset 을 id 묶음 단위로 지운다(짧은 트랜잭션 여러 번 - 테이블을 오래 잠그지 않음)."""
+    model = queryset.model
+    deleted = 0
+    while True:
+        ids = list(queryset.order_by("id").values_list("id", flat=True)[:chunk_size])
+        if not ids:
+            return deleted
+        count, _ = model.objects.filter(id__in=ids).delete()
+        deleted += count
+        if pause:
+            time.sleep(pause)
+
+
+class Command(BaseCommand):
+    help = "만료된 폐기 토큰(RevokedToken)을 묶음 단위로 삭제"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="한 번에 삭제할 행 수 (기본값: 1000)",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.0,
+            help="묶음 사이 대기 시간(초) (기본값: 0)",
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        chunk_size = max(1, options["chunk_size"])
+        pause = options["pause"]
+
+        deleted = delete_in_chunks(
+            RevokedToken.objects.filter(expires_at__lt=now), chunk_size, pause
+        )
+        self.stdout.write(self.style.SUCCESS(f"만료된 폐기 토큰 {deleted}개 삭제 완료"))
+
+        # simplejwt 블랙리스트 앱을 쓰는 경우 그 테이블도 같은 방식으로 정리
+        if apps.is_installed("rest_framework_simplejwt.token_blacklist"):
+            OutstandingToken = apps.get_model("token_blacklist", "OutstandingToken")
+            deleted = delete_in_chunks(
+                OutstandingToken.objects.filter(expires_at__lt=now), chunk_size, pause
+            )
+            self.stdout.write(
+                self.style.SUCCESS(f"만료된 simplejwt 토큰 {deleted}개 삭제 완료")
+            )
@@ -0,0 +1,62 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from auth.sms_outbox import BATCH_SIZE, process_batch, purge
+
+PURGE_INTERVAL = 60 * 60  # 1시간마다 오래된 발송 기록 정리
+
+
+class Command(BaseCommand):
+    help = "SMS 발송 큐(SmsOutbox)를 처리하는 워커 (SMS_ASYNC_DISPATCH=True 일 때 필요, 여러 프로세스 동시 실행 가능)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help=f"한 번에 가져올 메시지 수 (기본값: {BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="배치 안에서 동시에 발송할 스레드 수 (기본값: 4)",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="큐가 비었을 때 다시 확인할 간격(초) (기본값: 1)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="쌓인 메시지를 모두 처리하고 종료 (cron 실행용)",
+        )
+        parser.add_argument(
+            "--purge-days",
+            type=int,
+            default=7,
+            help="이 기간이 지난 발송완료/실패 기록 삭제 (기본값: 7일)",
+        )
+
+    def handle(self, *args, **options):
+        last_purge = 0.0
+        while True:
+            if time.monotonic() - last_purge >= PURGE_INTERVAL:
+                deleted = purge(options["purge_days"])
+                if deleted:
+                    self.stdout.write(f"오래된 SMS 기록 {deleted}건 삭제")
+                last_purge = time.monotonic()
+
+            claimed, sent, failed = process_batch(options["batch_size"], options["workers"])
+            if claimed:
+                self.stdout.write(f"SMS {claimed}건 처리: 발송 {sent}건, 최종 실패 {failed}건")
+                continue
+
+            if options["once"]:
+                break
+            time.sleep(options["interval"])
+
+        self.stdout.write(self.style.SUCCESS("SMS 발송 큐 처리 완료"))
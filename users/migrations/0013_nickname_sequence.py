@@ -0,0 +1,34 @@
+# Generated by Django 5.2.5 on 2026-10-19 08:07
+
+from django.db import migrations, models
+
+
+def create_sequence_row(apps, schema_editor):
+    NicknameSequence = apps.get_model('users', 'NicknameSequence')
+    NicknameSequence.objects.get_or_create(pk=1, defaults={'value': 0})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0012_smsoutbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NicknameSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'nickname_sequence',
+            },
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='nickname',
+            field=models.CharField(db_index=True, max_length=50),
+        ),
+        migrations.RunPython(create_sequence_row, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.5 on 2026-10-19 08:11
+
+import re
+
+from django.db import migrations, models, transaction
+
+BATCH_SIZE = 1000
+
+
+def backfill_phone_key(apps, schema_editor):
+    # 배치마다 커밋해 users 테이블을 오래 잠그지 않는다
+    User = apps.get_model('users', 'User')
+    last_id = 0
+    while True:
+        with transaction.atomic():
+            users = list(
+                User.objects.filter(id__gt=last_id, phone_number__isnull=False)
+                .order_by('id')
+                .only('id', 'phone_number')[:BATCH_SIZE]
+            )
+            if not users:
+                return
+            for user in users:
+                user.phone_key = re.sub(r'\D', '', user.phone_number) or None
+            User.objects.bulk_update(users, ['phone_key'])
+        last_id = users[-1].id
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('users', '0014_revokedtoken'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='phone_key',
+            field=models.CharField(blank=True, editable=False, max_length=20, null=True),
+        ),
+        migrations.RunPython(backfill_phone_key, migrations.RunPython.noop),
+        # 채운 뒤에 인덱스 생성 (채우는 동안 인덱스 갱신 비용 없음)
+        migrations.AlterField(
+            model_name='user',
+            name='phone_key',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=20, null=True),
+        ),
+    ]
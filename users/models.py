@@ -1,8 +1,25 @@
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
 from django.utils import timezone
-import random
-import string
+import re
+
+# 자동 생성 닉네임: user + 6자리. 시퀀스 번호를 6자리 공간에서 섞어(곱셈 순열) 순서가 드러나지 않게 한다.
+# 100만 개를 다 쓰면 user + 7자리 이상(시퀀스 번호 그대로)으로 넘어가므로 겹치지 않는다.
+AUTO_NICKNAME_RE = re.compile(r"user\d{6}")
+_NICKNAME_SPACE = 10 ** 6
+_NICKNAME_MULTIPLIER = 387_419  # 10^6 과 서로소 → 0~999999 를 한 번씩만 지나간다
+_NICKNAME_OFFSET = 271_828
+
+def phone_key_for(phone_number):
+    """전화번호 조회 키: 숫자만 남긴 형태 (010-1234-5678 → 01012345678). 없으면 None."""
+    digits = re.sub(r"\D", "", phone_number or "")
+    return digits or None
+
+def nickname_for_sequence(n):
+    if n < _NICKNAME_SPACE:
+        return f"user{(n * _NICKNAME_MULTIPLIER + _NICKNAME_OFFSET) % _NICKNAME_SPACE:06d}"
+    return f"user{n}"
 
 class UserManager(BaseUserManager):
     def create_user(self, email, password=None, nickname=None, **extra_fields):
@@ -25,23 +42,26 @@ class UserManager(BaseUserManager):
 
     @staticmethod
     def generate_nickname():
+        # 시퀀스에서 번호를 하나 받아 닉네임을 만든다 (번호마다 닉네임이 달라 충돌 없음)
         while True:
-            number = "".join(random.choices(string.digits, k=6))
-            nickname = f"user{number}"
+            nickname = nickname_for_sequence(NicknameSequence.next_value())
+            # 예전(랜덤 생성) 닉네임과 겹친 경우에만 다음 번호로 - 인덱스 조회 1회
             if not User.objects.filter(nickname=nickname).exists():
                 return nickname
 
 class User(AbstractBaseUser, PermissionsMixin):
-    nickname = models.CharField(max_length=50)
+    nickname = models.CharField(max_length=50, db_index=True)
     email = models.EmailField(unique=True)
     password = models.CharField(max_length=128) # Django가 해싱해서 저장
     phone_number = models.CharField(max_length=20, blank=True, null=True)
+    # phone_number 를 정규화한 조회용 키 (save 때 자동 갱신)
+    phone_key = models.CharField(max_length=20, blank=True, null=True, db_index=True, editable=False)
     kakao = models.BooleanField(default=False)
     google = models.BooleanField(default=False)
     apple = models.BooleanField(default=False)
     apple_sub = models.CharField(max_length=225, blank=True, null=True)
     is_terms_agreed = models.BooleanField(default=False)
-    created_at = models.DateTimeField(auto_now_add=True)  # 가입일 추가
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)  # 가입일 추가
     # Django 기본 인증 시스템을 위한 필드
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
@@ -54,6 +74,13 @@ class User(AbstractBaseUser, PermissionsMixin):
     def __str__(self):
         return self.email
 
+    def save(self, *args, **kwargs):
+        self.phone_key = phone_key_for(self.phone_number)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "phone_number" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "phone_key"}
+        super().save(*args, **kwargs)
+
     class Meta:
         db_table = "users"
 
@@ -91,4 +118,63 @@ class PhoneVerification(models.Model):
         if self.sent_at.date() < timezone.now().date():
             return False # 날짜가 바뀌었으면 리셋 대상
 
-        return self.daily_count >= 10
\ No newline at end of file
+        return self.daily_count >= 10
+
+class SmsOutbox(models.Model):
+    # 발송 대기 SMS (auth.sms_outbox 워커가 처리)
+    STATUS_PENDING = "pending"
+    STATUS_SENDING = "sending"
+    STATUS_SENT = "sent"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "대기"),
+        (STATUS_SENDING, "발송중"),
+        (STATUS_SENT, "발송완료"),
+        (STATUS_FAILED, "발송실패"),
+    ]
+
+    phone_number = models.CharField(max_length=20)
+    message = models.TextField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.IntegerField(default=0)
+    # pending: 다음 발송 시도 시각 / sending: 처리 권한 만료 시각(워커가 죽으면 이후 재처리)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "sms_outbox"
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"]),
+        ]
+
+class NicknameSequence(models.Model):
+    # 자동 닉네임 발급 번호 (행 1개) - UserManager.generate_nickname 에서 사용
+    value = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = "nickname_sequence"
+
+    @classmethod
+    def next_value(cls):
+        """번호를 1 올리고 올린 값을 반환한다(행 잠금으로 동시 요청끼리 겹치지 않음)."""
+        with transaction.atomic():
+            if not cls.objects.filter(pk=1).update(value=F("value") + 1):
+                try:
+                    with transaction.atomic():
+                        cls.objects.create(pk=1, value=0)
+                except IntegrityError:
+                    pass  # 다른 요청이 먼저 만듦
+                cls.objects.filter(pk=1).update(value=F("value") + 1)
+            return cls.objects.values_list("value", flat=True).get(pk=1) - 1
+
+class RevokedToken(models.Model):
+    # 폐기된 refresh 토큰 (auth.revocation 에서 조회, purge_revoked_tokens 로 만료분 정리)
+    jti = models.CharField(max_length=255, unique=True)
+    user_id = models.BigIntegerField(null=True, blank=True)
+    expires_at = models.DateTimeField(db_index=True)
+    revoked_at = models.DateTimeField(auto_now_add=True, db_index=True)  # 워커 간 동기화 구간 조회
+
+    class Meta:
+        db_table = "revoked_token"
@@ -3,7 +3,7 @@ from django.contrib.auth import authenticate
 from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
 
-from users.models import User
+from users.models import AUTO_NICKNAME_RE, User, phone_key_for
 
 class SignUpSerializer(serializers.ModelSerializer):
     email = serializers.EmailField(
@@ -34,7 +34,7 @@ class SignUpSerializer(serializers.ModelSerializer):
                 raise serializers.ValidationError("올바른 핸드폰번호 형식이 아닙니다. (예: 010-1234-5678)")
             
             # 중복 검사
-            if User.objects.filter(phone_number=data).exists():
+            if User.objects.filter(phone_key=phone_key_for(data)).exists():
                 raise serializers.ValidationError("이미 사용 중인 핸드폰번호입니다.")
                 
         return data
@@ -154,6 +154,12 @@ class NicknameUpdateRequestSerializer(serializers.Serializer):
 
         # 현재 사용자 정보 가져오기 (context에서 request를 통해 접근)
         request = self.context.get('request')
+
+        # user + 6자리 숫자는 자동 생성 닉네임 전용 (본인 현재 닉네임 유지는 허용)
+        if AUTO_NICKNAME_RE.fullmatch(value) and not (
+            request and request.user.is_authenticated and request.user.nickname == value
+        ):
+            raise serializers.ValidationError("user+숫자 6자리 형식은 사용할 수 없는 닉네임입니다.")
         if request and request.user.is_authenticated:
             # 현재 사용자를 제외하고 중복 체크
             if User.objects.filter(nickname=value).exclude(id=request.user.id).exists():
@@ -1,2 +1,299 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+from auth import revocation, sms_outbox
+from auth.authentication import USER_CACHE_PREFIX, CachedJWTAuthentication
+from auth.utils import parse_phone_number
+from auth.verification_service import sms_service
+from auth.verification_store import DAILY_LIMIT, get_verification_store
+from users.models import PhoneVerification, RevokedToken, SmsOutbox, User
+
+PHONE = "01012345678"
+
+
+def _failing(message="provider down"):
+    return mock.patch.object(
+        sms_outbox.sms_service,
+        "send_message",
+        return_value={"success": False, "message": message},
+    )
+
+
+class SmsOutboxTest(TestCase):
+    """SMS 발송 큐 - 개발 환경 시뮬레이션 발송으로 네트워크 없이 돈다."""
+
+    def enqueue(self, age=timedelta(0)):
+        row = sms_service.enqueue_verification_sms(PHONE, "123456")
+        if age:
+            SmsOutbox.objects.filter(id=row.id).update(
+                created_at=timezone.now() - age, next_attempt_at=timezone.now() - age
+            )
+            row.refresh_from_db()
+        return row
+
+    def test_worker_sends_pending_rows(self):
+        rows = [self.enqueue() for _ in range(3)]
+        out = StringIO()
+        call_command("run_sms_worker", "--once", "--workers", "2", stdout=out)
+
+        for row in rows:
+            row.refresh_from_db()
+            self.assertEqual(row.status, SmsOutbox.STATUS_SENT)
+            self.assertEqual(row.attempts, 1)
+            self.assertIsNotNone(row.sent_at)
+        self.assertIn("발송 3건", out.getvalue())
+
+    def test_failure_is_retried_with_backoff(self):
+        row = self.enqueue()
+        with _failing():
+            self.assertEqual(sms_outbox.process_batch(), (1, 0, 0))
+
+        row.refresh_from_db()
+        self.assertEqual(row.status, SmsOutbox.STATUS_PENDING)
+        self.assertEqual(row.last_error, "provider down")
+        self.assertGreater(row.next_attempt_at, timezone.now())
+        # backoff 전에는 다시 가져가지 않는다
+        self.assertEqual(sms_outbox.claim_batch(), [])
+
+    def test_retry_past_code_ttl_fails_instead(self):
+        # 다음 재시도(30초 × 2^3)가 유효 시간을 넘기면 더 보내지 않는다
+        row = self.enqueue(age=timedelta(minutes=2))
+        SmsOutbox.objects.filter(id=row.id).update(attempts=3)
+        with _failing():
+            self.assertEqual(sms_outbox.process_batch(), (1, 0, 1))
+        row.refresh_from_db()
+        self.assertEqual(row.status, SmsOutbox.STATUS_FAILED)
+
+    def test_max_attempts(self):
+        row = self.enqueue()
+        SmsOutbox.objects.filter(id=row.id).update(attempts=sms_outbox.MAX_ATTEMPTS - 1)
+        with _failing():
+            self.assertEqual(sms_outbox.process_batch(), (1, 0, 1))
+        row.refresh_from_db()
+        self.assertEqual(row.status, SmsOutbox.STATUS_FAILED)
+
+    def test_expired_rows_are_dropped_not_sent(self):
+        stale = self.enqueue(age=sms_outbox.MESSAGE_TTL + timedelta(seconds=1))
+        fresh = self.enqueue()
+        with mock.patch.object(
+            sms_outbox.sms_service, "send_message", wraps=sms_service.send_message
+        ) as send:
+            self.assertEqual(sms_outbox.process_batch(), (1, 1, 0))
+        self.assertEqual(send.call_count, 1)
+
+        stale.refresh_from_db()
+        fresh.refresh_from_db()
+        self.assertEqual(stale.status, SmsOutbox.STATUS_FAILED)
+        self.assertEqual(stale.last_error, sms_outbox.EXPIRED_ERROR)
+        self.assertEqual(stale.attempts, 0)
+        self.assertEqual(fresh.status, SmsOutbox.STATUS_SENT)
+
+    def test_expired_lease_is_reclaimed(self):
+        row = self.enqueue()
+        # 워커가 가져간 뒤 죽음 → 처리 권한 만료 후 다시 가져간다
+        self.assertEqual(len(sms_outbox.claim_batch()), 1)
+        self.assertEqual(sms_outbox.claim_batch(), [])
+        SmsOutbox.objects.filter(id=row.id).update(next_attempt_at=timezone.now())
+        self.assertEqual([r.id for r in sms_outbox.claim_batch()], [row.id])
+
+    def test_purge_keeps_recent_and_pending_rows(self):
+        old_sent = self.enqueue()
+        SmsOutbox.objects.filter(id=old_sent.id).update(
+            status=SmsOutbox.STATUS_SENT, created_at=timezone.now() - timedelta(days=8)
+        )
+        pending = self.enqueue()
+        self.assertEqual(sms_outbox.purge(7), 1)
+        self.assertEqual(list(SmsOutbox.objects.values_list("id", flat=True)), [pending.id])
+
+
+class PhoneVerificationSendTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("phone-verification-send")
+
+    def test_sends_inline_by_default(self):
+        response = self.client.post(self.url, {"phone_number": PHONE}, format="json")
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.data["sms_status"], SmsOutbox.STATUS_SENT)
+        self.assertFalse(SmsOutbox.objects.exists())  # 동기 발송은 큐를 거치지 않는다
+
+    def test_inline_send_writes_one_row(self):
+        self.client.post(self.url, {"phone_number": PHONE}, format="json")
+        with self.assertNumQueries(2):  # 발송 제한 조회 + UPDATE
+            response = self.client.post(self.url, {"phone_number": PHONE}, format="json")
+        self.assertEqual(response.data["remaining_requests"], DAILY_LIMIT - 2)
+
+    def test_daily_count_resets_on_new_day(self):
+        phone = parse_phone_number(PHONE)
+        PhoneVerification.objects.create(
+            phone_number=phone,
+            verification_type=PhoneVerification.VERIFICATION_TYPE_SMS,
+            daily_count=DAILY_LIMIT,
+            sent_at=timezone.now() - timedelta(days=1),
+        )
+        response = self.client.post(self.url, {"phone_number": PHONE}, format="json")
+        self.assertEqual(response.data["remaining_requests"], DAILY_LIMIT - 1)
+        self.assertEqual(PhoneVerification.objects.get(phone_number=phone).daily_count, 1)
+
+    def test_inline_failure_leaves_nothing_to_resend(self):
+        with _failing():
+            response = self.client.post(self.url, {"phone_number": PHONE}, format="json")
+        self.assertEqual(response.status_code, 500)
+        self.assertFalse(SmsOutbox.objects.exists())
+
+    def test_failed_send_keeps_code_and_quota(self):
+        store = get_verification_store()
+        phone, sms = parse_phone_number(PHONE), PhoneVerification.VERIFICATION_TYPE_SMS
+        with _failing():
+            self.client.post(self.url, {"phone_number": PHONE}, format="json")
+        with self.settings(SMS_ASYNC_DISPATCH=True), mock.patch.object(
+            sms_service, "enqueue_verification_sms", side_effect=RuntimeError
+        ), self.assertLogs("auth.verification_views", "ERROR"):
+            response = self.client.post(self.url, {"phone_number": PHONE}, format="json")
+        self.assertEqual(response.status_code, 500)
+
+        self.assertIsNone(store.load(phone, sms))
+        self.assertEqual(store.remaining(phone, sms), DAILY_LIMIT)
+
+        response = self.client.post(self.url, {"phone_number": PHONE}, format="json")
+        self.assertEqual(response.data["remaining_requests"], DAILY_LIMIT - 1)
+        self.assertEqual(store.load(phone, sms), response.data["verification_code"])
+
+    @override_settings(SMS_ASYNC_DISPATCH=True)
+    def test_async_dispatch_leaves_row_for_worker(self):
+        response = self.client.post(self.url, {"phone_number": PHONE}, format="json")
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.data["sms_status"], SmsOutbox.STATUS_PENDING)
+        self.assertEqual(SmsOutbox.objects.get().status, SmsOutbox.STATUS_PENDING)
+
+
+@override_settings(JWT_USER_CACHE=True)
+class CachedJWTAuthenticationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email="jwt@example.com", password="pw-1234", nickname="jwt")
+        self.token = AccessToken.for_user(self.user)
+        self.auth = CachedJWTAuthentication()
+
+    def authenticate(self):
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {self.token}")
+        user, _ = self.auth.authenticate(request)
+        return user
+
+    def test_hit_skips_user_query(self):
+        with self.assertNumQueries(1):
+            self.authenticate()
+        with self.assertNumQueries(0):
+            user = self.authenticate()
+        self.assertEqual((user.pk, user.email, user.nickname), (self.user.pk, "jwt@example.com", "jwt"))
+        self.assertTrue(user.is_authenticated)
+
+    def test_password_hash_is_not_cached(self):
+        self.authenticate()
+        entry = cache.get(f"{USER_CACHE_PREFIX}{self.token['jti']}")
+        self.assertNotIn("password", entry[1])
+        self.assertNotIn(self.user.password, entry[2])
+
+        user = self.authenticate()
+        with self.assertNumQueries(1):  # 지연 필드라 처음 읽을 때만 조회
+            self.assertTrue(user.check_password("pw-1234"))
+
+    def test_saving_cached_user_keeps_password(self):
+        self.authenticate()
+        user = self.authenticate()
+        user.nickname = "renamed"
+        user.save()
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.nickname, "renamed")
+        self.assertTrue(self.user.check_password("pw-1234"))
+
+    def test_deactivated_user_is_rejected(self):
+        self.authenticate()
+        self.user.is_active = False
+        self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_deleted_user_is_rejected(self):
+        self.authenticate()
+        self.user.delete()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    @override_settings(JWT_USER_CACHE=False)
+    def test_cache_off_without_shared_backend(self):
+        self.authenticate()
+        with self.assertNumQueries(1):
+            self.authenticate()
+        self.assertIsNone(cache.get(f"{USER_CACHE_PREFIX}{self.token['jti']}"))
+
+
+class RevocationIndexTest(TestCase):
+    """refresh 토큰 폐기 인덱스 - 다른 워커가 남긴 행을 동기화로 반영한다."""
+
+    def setUp(self):
+        self.index = revocation.RevocationIndex()
+        self.clock = 1000.0
+        patcher = mock.patch("auth.revocation.time.monotonic", side_effect=lambda: self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def revoke_elsewhere(self, jti, **fields):
+        # 다른 프로세스의 revoke_token — 이 인덱스의 add() 를 거치지 않는다
+        return RevokedToken.objects.create(
+            jti=jti, expires_at=timezone.now() + timedelta(days=1), **fields
+        )
+
+    def next_sync(self):
+        self.clock += revocation.SYNC_INTERVAL
+
+    def test_rows_committed_out_of_id_order_are_synced(self):
+        self.revoke_elsewhere("jti-early", id=1)
+        self.assertTrue(self.index.is_revoked("jti-early"))  # 첫 호출에서 전체 빌드
+
+        # id 10 이 먼저 커밋되어 동기화된 뒤, 더 작은 id 5 가 늦게 커밋됨
+        self.revoke_elsewhere("jti-high", id=10)
+        self.next_sync()
+        self.assertTrue(self.index.is_revoked("jti-high"))
+
+        self.revoke_elsewhere("jti-late", id=5)
+        self.next_sync()
+        with self.assertNumQueries(1):  # 동기화 조회만, jti 는 LRU 에서
+            self.assertTrue(self.index.is_revoked("jti-late"))
+
+    def test_unrevoked_token_skips_db_between_syncs(self):
+        self.revoke_elsewhere("jti-a")
+        self.index.is_revoked("jti-a")
+        with self.assertNumQueries(0):
+            self.assertFalse(self.index.is_revoked("jti-never-revoked"))
+
+    def test_overlapping_window_does_not_inflate_filter(self):
+        self.revoke_elsewhere("jti-a")
+        self.index.is_revoked("jti-a")
+        count = self.index._bloom.count
+        for _ in range(3):
+            self.next_sync()
+            self.index.is_revoked("jti-a")
+        self.assertEqual(self.index._bloom.count, count)
+
+    def test_rows_older_than_window_are_left_to_rebuild(self):
+        self.index.is_revoked("jti-x")
+        self.revoke_elsewhere("jti-old")
+        RevokedToken.objects.filter(jti="jti-old").update(
+            revoked_at=timezone.now() - revocation.SYNC_MARGIN * 2
+        )
+        self.next_sync()
+        self.assertFalse(self.index.is_revoked("jti-old"))
+        self.clock += revocation.REBUILD_INTERVAL
+        self.assertTrue(self.index.is_revoked("jti-old"))
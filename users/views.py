@@ -4,14 +4,15 @@ from rest_framework.generics import GenericAPIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from django.conf import settings
-from django.db import models
 from drf_spectacular.utils import extend_schema, OpenApiExample, OpenApiResponse, OpenApiParameter, extend_schema_view
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
+
+from common import http_client
 import logging
 logger = logging.getLogger(__name__)
 
-from .models import User
+from .models import User, phone_key_for
 from .serializers import (
     SignUpSerializer,
     SignInSerializer,
@@ -35,7 +36,21 @@ from .serializers import (
     PhoneNumberAccountInfoResponseSerializer,
     MyPageUserInfoResponseSerializer
 )
-from .utils import generate_jwt_tokens_with_metadata, get_token_type_from_token
+from .utils import generate_jwt_tokens_with_metadata
+from auth.authentication import get_token_claim
+from auth.revocation import is_token_revoked, revoke_token
+from .deletion import delete_user
+
+
+def revoke_refresh_cookie(request):
+    """쿠키의 refresh 토큰을 폐기한다(없거나 이미 무효한 토큰이면 무시)."""
+    refresh_token = request.COOKIES.get('refresh_token')
+    if not refresh_token:
+        return
+    try:
+        revoke_token(RefreshToken(refresh_token))
+    except TokenError:
+        pass
 
 @extend_schema_view(
         post=extend_schema(
@@ -321,8 +336,9 @@ class KakaoLoginView(GenericAPIView):
         # Code 방식인 경우 토큰 교환
         if code:
             try:
-                token_response = requests.post(
+                token_response = http_client.post(
                     "https://kauth.kakao.com/oauth/token",
+                    service="kakao-auth",
                     data={
                         "grant_type": "authorization_code",
                         "client_id": settings.KAKAO_REST_API_KEY,
@@ -379,8 +395,9 @@ class KakaoLoginView(GenericAPIView):
 
         # 카카오 access_token으로 사용자 정보 조회
         try:
-            profile_response = requests.get(
+            profile_response = http_client.get(
                 "https://kapi.kakao.com/v2/user/me",
+                service="kakao-api",
                 headers={"Authorization": f"Bearer {kakao_access_token}"},
                 timeout=5,
             )
@@ -526,6 +543,9 @@ class LogoutView(GenericAPIView):
         tags=['인증']
     )
     def post(self, request):
+        # refresh 토큰 폐기 (쿠키를 지워도 탈취된 토큰으로 재발급받지 못하게)
+        revoke_refresh_cookie(request)
+
         # 로그아웃 응답 생성
         response = Response({
             "success": True, 
@@ -609,6 +629,8 @@ class TokenRefreshView(GenericAPIView):
         try:
             # refresh 토큰 검증 및 새 access 토큰 생성
             refresh = RefreshToken(refresh_token)
+            if is_token_revoked(refresh):
+                raise TokenError('로그아웃된 토큰입니다.')
             
             # 토큰에서 사용자 ID 추출
             user_id = refresh.get('user_id')
@@ -717,8 +739,9 @@ class KakaoLogoutView(GenericAPIView):
         kakao_access_token = request.data.get('kakao_access_token')
         if kakao_access_token:
             try:
-                kakao_logout_response = requests.post(
+                kakao_logout_response = http_client.post(
                     "https://kapi.kakao.com/v1/user/logout",
+                    service="kakao-api",
                     headers={"Authorization": f"Bearer {kakao_access_token}"},
                     timeout=5,
                 )
@@ -727,7 +750,8 @@ class KakaoLogoutView(GenericAPIView):
             except Exception as e:
                 print(f"카카오 로그아웃 처리 중 오류: {str(e)}")
         
-        # 서버 로그아웃 처리 (refresh token 쿠키 삭제)
+        # 서버 로그아웃 처리 (refresh 토큰 폐기 + 쿠키 삭제)
+        revoke_refresh_cookie(request)
         response = Response({
             "success": True, 
             "message": "카카오 로그아웃이 완료되었습니다."
@@ -815,8 +839,9 @@ class UserDeleteView(GenericAPIView):
         # 카카오 unlink
         if user.kakao and kakao_access_token:
             try:
-                requests.post(
+                http_client.post(
                     "https://kapi.kakao.com/v1/user/unlink",
+                    service="kakao-api",
                     headers={"Authorization": f"Bearer {kakao_access_token}"},
                     timeout=5,
                 )
@@ -824,8 +849,8 @@ class UserDeleteView(GenericAPIView):
                 logger.warning(f"Kakao unlink failed: {(e)}")
 
         # 애플은 아무 처리 없음
-        # DB 삭제
-        user.delete()
+        # DB 삭제 (리뷰 등 하위 데이터는 행을 읽지 않고 일괄 삭제)
+        delete_user(user)
 
         return Response({
             "success": True,
@@ -1008,16 +1033,14 @@ class PasswordChangeView(GenericAPIView):
         현재 사용자의 비밀번호를 변경합니다.
         (email 로그인 사용자만 가능)
         """
-        # JWT 토큰에서 tokenType 확인
-        auth_header = request.META.get('HTTP_AUTHORIZATION')
-        if not auth_header or not auth_header.startswith('Bearer '):
+        # 인증 때 검증된 JWT 토큰에서 tokenType 확인
+        if request.auth is None:
             return Response(
                 {"error": "Authorization header가 없습니다."}, 
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        access_token = auth_header.split(' ')[1]
-        token_type = get_token_type_from_token(access_token)
+        token_type = get_token_claim(request, 'tokenType')
         
         # tokenType이 'email'이 아니면 비밀번호 변경 불가
         if token_type != 'email':
@@ -1153,8 +1176,8 @@ class PhoneNumberFindAccountView(GenericAPIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # 해당 핸드폰번호로 등록된 사용자들 조회
-        users = User.objects.filter(phone_number=phone_number)
+        # 해당 핸드폰번호로 등록된 사용자들 조회 (하이픈 유무와 관계없이 phone_key 인덱스로 조회)
+        users = User.objects.filter(phone_key=phone_key_for(phone_number))
         
         accounts = []
         for user in users:
@@ -1284,16 +1307,14 @@ class PhoneNumberAccountInfoView(GenericAPIView):
                 {'error': f'전화번호 형식이 올바르지 않습니다: {str(e)}'}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
+        if not parsed_phone:
+            return Response(
+                {'error': '전화번호 형식이 올바르지 않습니다.'}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        # 전화번호에서 '-' 제거한 형태도 생성
-        phone_without_dash = parsed_phone.replace('-', '')
-        phone_with_dash = parsed_phone
-        
-        # 두 가지 형태 모두로 검색 (중복 제거)
-        users = User.objects.filter(
-            models.Q(phone_number=phone_with_dash) | 
-            models.Q(phone_number=phone_without_dash)
-        ).distinct().order_by('id')
+        # 정규화된 phone_key 로 조회 (하이픈 유무와 관계없이 인덱스 조회 한 번)
+        users = User.objects.filter(phone_key=phone_key_for(parsed_phone)).order_by('id')
         
         # 계정 정보 리스트 생성
         accounts = []
@@ -1358,7 +1379,6 @@ class MyPageUserInfoView(GenericAPIView):
     )
     def get(self, request):
         """마이페이지 사용자 정보를 조회합니다."""
-        from .utils import get_token_type_from_token
         from review.models import Review
         
         # 사용자 인증 여부 확인
@@ -1372,13 +1392,8 @@ class MyPageUserInfoView(GenericAPIView):
                 status=status.HTTP_200_OK
             )
         
-        # JWT 토큰에서 로그인 방식 추출
-        auth_header = request.META.get('HTTP_AUTHORIZATION', '')
-        if auth_header.startswith('Bearer '):
-            token = auth_header.split(' ')[1]
-            login_type = get_token_type_from_token(token)
-        else:
-            login_type = 'email'  # 기본값
+        # 인증 때 검증된 JWT 토큰에서 로그인 방식 추출
+        login_type = get_token_claim(request, 'tokenType', 'email')
         
         # 사용자 리뷰 개수 조회
         review_count = Review.objects.filter(user=request.user).count()